@@ -3,112 +3,340 @@ Caching layer for block explorer
 Multi-tier caching with Redis and in-memory support
 """
 
+import asyncio
+import heapq
+import inspect
 import json
 import logging
+import queue
+import threading
 import time
-from typing import Any, Optional, Callable
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Final, Optional
 from functools import wraps
-from dataclasses import dataclass
 import hashlib
 
+# xxh3 is several times faster than hashlib on short keys; blake2b is the
+# stdlib fallback. Neither needs to be cryptographic for cache keying.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# orjson (de)serializes several times faster than json and emits bytes that
+# go straight to the Redis socket
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# lz4 shrinks large payloads (validator sets, block lists) at GB/s before
+# they cross the Redis socket; without it everything is stored uncompressed
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
 logger = logging.getLogger(__name__)
 
+_NS_PER_SECOND: Final = 1_000_000_000
 
-@dataclass
-class CacheEntry:
-    """Cache entry with metadata"""
+# Stored in L1 for keys known to be absent so repeated lookups skip L2
+_MISS: Final = object()
 
-    key: str
-    value: Any
-    timestamp: float
-    ttl: int
-    hit_count: int = 0
+# Serialized payloads larger than this (bytes) are compressed for Redis
+_COMPRESS_THRESHOLD: Final = 512
+# Prefixes compressed payloads; no JSON document starts with this byte
+_LZ4_MARKER: Final = b"\x01"
 
 
-class MemoryCache:
-    """In-memory LRU cache"""
+def _dumps(value: Any) -> bytes:
+    """Serialize a value for storage in Redis"""
+    if orjson is not None:
+        payload = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(value).encode()
+    if lz4_frame is not None and len(payload) > _COMPRESS_THRESHOLD:
+        return _LZ4_MARKER + lz4_frame.compress(payload)
+    return payload
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a value read from Redis"""
+    if data[:1] == _LZ4_MARKER:
+        if lz4_frame is None:
+            raise json.JSONDecodeError("lz4 is not installed", "", 0)
+        try:
+            data = lz4_frame.decompress(memoryview(data)[1:])
+        except RuntimeError as e:
+            # A corrupt or truncated frame is a bad value, not a Redis outage
+            raise json.JSONDecodeError(f"corrupt lz4 frame: {e}", "", 0) from e
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _CacheShard:
+    """One lock-protected stripe of a MemoryCache"""
+
+    __slots__ = ("lock", "entries", "hits", "expiry_buckets", "bucket_heap", "swept")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> (value, expires_ns) on the monotonic_ns clock; insertion
+        # order doubles as recency order with the most recently used entry last
+        self.entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self.hits: int = 0
+        # Expiry wheel: bucket id -> live keys expiring in that window, plus
+        # a min-heap of bucket ids and the newest bucket already swept. Keys
+        # leave their bucket when deleted, evicted or re-set, so the wheel
+        # never holds more keys than entries
+        self.expiry_buckets: dict[int, set[str]] = {}
+        self.bucket_heap: list[int] = []
+        self.swept: int = 0
+
+    def track_expiry(self, key: str, expires_ns: int, bucket_shift: int) -> None:
+        """Register a key in the expiry bucket covering expires_ns"""
+        bucket = expires_ns >> bucket_shift
+        keys = self.expiry_buckets.get(bucket)
+        if keys is None:
+            keys = self.expiry_buckets[bucket] = set()
+            heapq.heappush(self.bucket_heap, bucket)
+        keys.add(key)
+
+    def untrack_expiry(self, key: str, expires_ns: int, bucket_shift: int) -> None:
+        """Remove a key that is leaving the shard from its expiry bucket"""
+        keys = self.expiry_buckets.get(expires_ns >> bucket_shift)
+        if keys is not None:
+            # An emptied bucket stays until swept; its id is still in the heap
+            keys.discard(key)
+
+    def remove(self, key: str, bucket_shift: int) -> None:
+        """Drop an entry and its expiry bucket slot, if present"""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.untrack_expiry(key, entry[1], bucket_shift)
+
+    def expire(self, now_ns: int, bucket_shift: int) -> None:
+        """Drop every entry in buckets that closed before now_ns"""
+        current = now_ns >> bucket_shift
+        if current <= self.swept:
+            return
 
-    def __init__(self, max_size: int = 1000):
-        self.max_size = max_size
-        self.cache: dict[str, CacheEntry] = {}
-        self.access_order: list[str] = []
+        while self.bucket_heap and self.bucket_heap[0] < current:
+            for key in self.expiry_buckets.pop(heapq.heappop(self.bucket_heap)):
+                # Buckets only hold live keys, and a closed bucket's keys
+                # are all past due
+                del self.entries[key]
+        self.swept = current
+
+
+class MemoryCache:
+    """
+    Thread-safe in-memory LRU cache
+
+    Keys are striped across independently locked shards so concurrent
+    workers only contend when they touch the same stripe. LRU order and
+    capacity are tracked per shard; small caches use a single shard so
+    eviction stays exact.
+
+    Expired entries are dropped a whole time bucket at a time as the clock
+    advances, so keys that are never read again do not hold capacity until
+    LRU eviction reaches them.
+    """
+
+    MIN_SHARD_SIZE: Final = 64
+    # Expiry buckets span 2**30 ns (~1.07s) of the monotonic_ns clock
+    EXPIRY_BUCKET_SHIFT: Final = 30
+
+    def __init__(self, max_size: int = 1000, shards: int = 16) -> None:
+        self.max_size: int = max_size
+
+        # Power-of-two shard count, capped so every shard keeps a useful size
+        shard_count = 1
+        while (
+            shard_count * 2 <= shards
+            and max_size // (shard_count * 2) >= self.MIN_SHARD_SIZE
+        ):
+            shard_count *= 2
+
+        self._shard_mask: int = shard_count - 1
+        self._shard_size: int = max(1, max_size // shard_count)
+        self._shards: list[_CacheShard] = [_CacheShard() for _ in range(shard_count)]
+
+    def _shard(self, key: str) -> _CacheShard:
+        """Get the shard responsible for a key"""
+        return self._shards[hash(key) & self._shard_mask]
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
-        if key in self.cache:
-            entry = self.cache[key]
+        shard = self._shard(key)
+        now_ns = time.monotonic_ns()
+        with shard.lock:
+            shard.expire(now_ns, self.EXPIRY_BUCKET_SHIFT)
+            entry = shard.entries.get(key)
+            if entry is None:
+                return None
 
-            # Check if expired
-            if time.time() - entry.timestamp > entry.ttl:
-                self.delete(key)
+            value, expires_ns = entry
+
+            # Check if expired within the current bucket
+            if now_ns > expires_ns:
+                shard.remove(key, self.EXPIRY_BUCKET_SHIFT)
                 return None
 
             # Update access order (LRU)
-            if key in self.access_order:
-                self.access_order.remove(key)
-            self.access_order.append(key)
+            shard.entries.move_to_end(key)
+            shard.hits += 1
 
-            # Update hit count
-            entry.hit_count += 1
+            return value
 
-            return entry.value
+    def get_with_ttl(self, key: str) -> tuple[Optional[Any], Optional[int]]:
+        """Get value from cache along with its remaining TTL in seconds"""
+        shard = self._shard(key)
+        now_ns = time.monotonic_ns()
+        with shard.lock:
+            shard.expire(now_ns, self.EXPIRY_BUCKET_SHIFT)
+            entry = shard.entries.get(key)
+            if entry is None:
+                return None, None
 
-        return None
+            value, expires_ns = entry
 
-    def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        """Set value in cache"""
-        # Evict if at capacity
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            self._evict_lru()
+            # Check if expired within the current bucket
+            remaining_ns = expires_ns - now_ns
+            if remaining_ns < 0:
+                shard.remove(key, self.EXPIRY_BUCKET_SHIFT)
+                return None, None
 
-        entry = CacheEntry(
-            key=key, value=value, timestamp=time.time(), ttl=ttl, hit_count=0
-        )
+            # Update access order (LRU)
+            shard.entries.move_to_end(key)
+            shard.hits += 1
 
-        self.cache[key] = entry
+            return value, max(1, remaining_ns // _NS_PER_SECOND)
 
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
+    def _store(self, shard: _CacheShard, key: str, value: Any, expires_ns: int) -> None:
+        """Insert or replace an entry; the caller holds shard.lock"""
+        previous = shard.entries.get(key)
+        if previous is not None:
+            shard.untrack_expiry(key, previous[1], self.EXPIRY_BUCKET_SHIFT)
+            shard.entries.move_to_end(key)
+        elif len(shard.entries) >= self._shard_size:
+            # Evict least recently used item if at capacity
+            evicted, (_, evicted_ns) = shard.entries.popitem(last=False)
+            shard.untrack_expiry(evicted, evicted_ns, self.EXPIRY_BUCKET_SHIFT)
+
+        shard.entries[key] = (value, expires_ns)
+        shard.track_expiry(key, expires_ns, self.EXPIRY_BUCKET_SHIFT)
+
+    def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        """Set value in cache"""
+        shard = self._shard(key)
+        now_ns = time.monotonic_ns()
+        expires_ns = now_ns + int(ttl * _NS_PER_SECOND)
+        with shard.lock:
+            shard.expire(now_ns, self.EXPIRY_BUCKET_SHIFT)
+            self._store(shard, key, value, expires_ns)
 
     def delete(self, key: str) -> None:
         """Delete key from cache"""
-        if key in self.cache:
-            del self.cache[key]
-        if key in self.access_order:
-            self.access_order.remove(key)
+        shard = self._shard(key)
+        with shard.lock:
+            shard.remove(key, self.EXPIRY_BUCKET_SHIFT)
+
+    def mget(self, keys: list[str]) -> dict[str, Any]:
+        """Get multiple values, returning only the keys that were found"""
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def mget_with_ttl(self, keys: list[str]) -> dict[str, tuple[Any, Optional[int]]]:
+        """Get multiple values along with their remaining TTLs"""
+        found: dict[str, tuple[Any, Optional[int]]] = {}
+        for key in keys:
+            value, ttl = self.get_with_ttl(key)
+            if value is not None:
+                found[key] = (value, ttl)
+        return found
+
+    def mset(self, items: dict[str, Any], ttl: int = 300) -> None:
+        """Set multiple values with a shared TTL, locking each shard once"""
+        by_shard: dict[int, list[tuple[str, Any]]] = {}
+        for key, value in items.items():
+            by_shard.setdefault(hash(key) & self._shard_mask, []).append((key, value))
+
+        now_ns = time.monotonic_ns()
+        expires_ns = now_ns + int(ttl * _NS_PER_SECOND)
+        for index, shard_items in by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:
+                shard.expire(now_ns, self.EXPIRY_BUCKET_SHIFT)
+                for key, value in shard_items:
+                    self._store(shard, key, value, expires_ns)
+
+    def mdelete(self, keys: list[str]) -> None:
+        """Delete multiple keys"""
+        for key in keys:
+            self.delete(key)
 
     def clear(self) -> None:
         """Clear all cache"""
-        self.cache.clear()
-        self.access_order.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.expiry_buckets.clear()
+                shard.bucket_heap.clear()
+                shard.hits = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics from the live per-shard counters"""
+        size = 0
+        total_hits = 0
+        now_ns = time.monotonic_ns()
+        for shard in self._shards:
+            with shard.lock:
+                shard.expire(now_ns, self.EXPIRY_BUCKET_SHIFT)
+                size += len(shard.entries)
+                total_hits += shard.hits
 
-    def _evict_lru(self) -> None:
-        """Evict least recently used item"""
-        if self.access_order:
-            lru_key = self.access_order.pop(0)
-            if lru_key in self.cache:
-                del self.cache[lru_key]
-
-    def get_stats(self) -> dict:
-        """Get cache statistics"""
-        total_hits = sum(entry.hit_count for entry in self.cache.values())
         return {
-            "size": len(self.cache),
+            "size": size,
             "max_size": self.max_size,
+            "shards": len(self._shards),
             "total_hits": total_hits,
-            "keys": list(self.cache.keys()),
         }
 
+    def list_keys(self) -> list[str]:
+        """List every live key (O(n), not meant for monitoring scrapes)"""
+        keys: list[str] = []
+        now_ns = time.monotonic_ns()
+        for shard in self._shards:
+            with shard.lock:
+                shard.expire(now_ns, self.EXPIRY_BUCKET_SHIFT)
+                keys.extend(shard.entries.keys())
+        return keys
+
 
 class RedisCache:
     """Redis-based cache with automatic fallback to MemoryCache"""
 
+    # Keys requested per SCAN call during bulk clear/stats
+    SCAN_COUNT: Final = 1000
+    # Keys queued for UNLINK before a pipeline is flushed
+    UNLINK_FLUSH_SIZE: Final = 10_000
+    # Upper bound on pooled connections per cache instance
+    MAX_CONNECTIONS: Final = 32
+
     def __init__(
         self,
         redis_url: Optional[str] = None,
         fallback_cache: Optional[MemoryCache] = None,
         key_prefix: str = "aura:",
+        client: Optional[Any] = None,
     ):
         """
         Initialize Redis cache with optional fallback
@@ -117,10 +345,15 @@ class RedisCache:
             redis_url: Redis connection URL (default: from REDIS_URL env var or localhost)
             fallback_cache: Fallback cache to use if Redis is unavailable
             key_prefix: Prefix for all cache keys to avoid collisions
+            client: Pre-built redis client to use instead of connecting
+
+        Set REDIS_SOCKET to a Unix socket path to reach a co-located Redis
+        without going through loopback TCP; it takes precedence over the URL.
         """
         import os
 
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        socket_path = os.getenv("REDIS_SOCKET")
         self.key_prefix = key_prefix
         self.enabled = False
         self.client = None
@@ -131,17 +364,32 @@ class RedisCache:
         try:
             import redis
 
-            self.client = redis.from_url(
-                self.redis_url,
-                decode_responses=True,
-                socket_connect_timeout=2,
-                socket_timeout=2,
-                retry_on_timeout=True,
-            )
+            if client is not None:
+                self.client = client
+            elif socket_path:
+                self.client = redis.Redis(
+                    unix_socket_path=socket_path,
+                    max_connections=self.MAX_CONNECTIONS,
+                    decode_responses=False,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                    retry_on_timeout=True,
+                )
+            else:
+                pool = redis.ConnectionPool.from_url(
+                    self.redis_url,
+                    max_connections=self.MAX_CONNECTIONS,
+                    decode_responses=False,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                    socket_keepalive=True,
+                    retry_on_timeout=True,
+                )
+                self.client = redis.Redis(connection_pool=pool)
             # Test connection
             self.client.ping()
             self.enabled = True
-            logger.info(f"Redis cache initialized: {self.redis_url}")
+            logger.info(f"Redis cache initialized: {socket_path or self.redis_url}")
         except ImportError:
             logger.warning("redis-py not installed, using fallback MemoryCache")
             self.fallback_mode = True
@@ -182,7 +430,7 @@ class RedisCache:
             prefixed_key = self._get_key(key)
             value = self.client.get(prefixed_key)
             if value:
-                return json.loads(value)
+                return _loads(value)
             return None
         except json.JSONDecodeError as e:
             logger.error(f"Redis JSON decode error for key {key}: {e}")
@@ -194,6 +442,44 @@ class RedisCache:
             self.fallback_mode = True
             return self.fallback_cache.get(key)
 
+    def get_with_ttl(self, key: str) -> tuple[Optional[Any], Optional[int]]:
+        """
+        Get value and its remaining TTL in seconds in one round trip
+
+        The TTL is None when the key has no expiry set.
+        """
+        if self.fallback_mode:
+            return self.fallback_cache.get_with_ttl(key)
+
+        if not self.enabled or self.client is None:
+            return None, None
+
+        try:
+            prefixed_key = self._get_key(key)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(prefixed_key)
+            pipe.pttl(prefixed_key)
+            value, pttl_ms = pipe.execute()
+            if value:
+                return _loads(value), self._pttl_to_ttl(pttl_ms)
+            return None, None
+        except json.JSONDecodeError as e:
+            logger.error(f"Redis JSON decode error for key {key}: {e}")
+            self.client.delete(self._get_key(key))
+            return None, None
+        except Exception as e:
+            logger.error(f"Redis get error for key {key}: {e}")
+            # Attempt fallback
+            self.fallback_mode = True
+            return self.fallback_cache.get_with_ttl(key)
+
+    @staticmethod
+    def _pttl_to_ttl(pttl_ms: int) -> Optional[int]:
+        """Convert a PTTL reply to whole seconds (None when no expiry)"""
+        if pttl_ms is None or pttl_ms < 0:
+            return None
+        return max(1, pttl_ms // 1000)
+
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
         """Set value in Redis or fallback cache"""
         if self.fallback_mode:
@@ -205,7 +491,7 @@ class RedisCache:
 
         try:
             prefixed_key = self._get_key(key)
-            serialized = json.dumps(value)
+            serialized = _dumps(value)
             self.client.setex(prefixed_key, ttl, serialized)
         except (TypeError, ValueError) as e:
             logger.error(f"Redis serialization error for key {key}: {e}")
@@ -233,6 +519,84 @@ class RedisCache:
             self.fallback_mode = True
             self.fallback_cache.delete(key)
 
+    def mget(self, keys: list[str]) -> dict[str, Any]:
+        """Get multiple values in a single pipelined round trip"""
+        return {key: value for key, (value, _) in self.mget_with_ttl(keys).items()}
+
+    def mget_with_ttl(self, keys: list[str]) -> dict[str, tuple[Any, Optional[int]]]:
+        """Get multiple values and their remaining TTLs in one round trip"""
+        if self.fallback_mode:
+            return self.fallback_cache.mget_with_ttl(keys)
+
+        if not self.enabled or self.client is None or not keys:
+            return {}
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                prefixed_key = self._get_key(key)
+                pipe.get(prefixed_key)
+                pipe.pttl(prefixed_key)
+            replies = pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis mget error for {len(keys)} keys: {e}")
+            # Attempt fallback
+            self.fallback_mode = True
+            return self.fallback_cache.mget_with_ttl(keys)
+
+        found = {}
+        for key, value, pttl_ms in zip(keys, replies[::2], replies[1::2]):
+            if not value:
+                continue
+            try:
+                found[key] = (_loads(value), self._pttl_to_ttl(pttl_ms))
+            except json.JSONDecodeError as e:
+                logger.error(f"Redis JSON decode error for key {key}: {e}")
+                self.delete(key)
+        return found
+
+    def mset(self, items: dict[str, Any], ttl: int = 300) -> None:
+        """Set multiple values in a single pipelined round trip"""
+        if self.fallback_mode:
+            self.fallback_cache.mset(items, ttl)
+            return
+
+        if not self.enabled or self.client is None or not items:
+            return
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                try:
+                    serialized = _dumps(value)
+                except (TypeError, ValueError) as e:
+                    logger.error(f"Redis serialization error for key {key}: {e}")
+                    continue
+                pipe.setex(self._get_key(key), ttl, serialized)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis mset error for {len(items)} keys: {e}")
+            # Attempt fallback
+            self.fallback_mode = True
+            self.fallback_cache.mset(items, ttl)
+
+    def mdelete(self, keys: list[str]) -> None:
+        """Delete multiple keys with a single command"""
+        if self.fallback_mode:
+            self.fallback_cache.mdelete(keys)
+            return
+
+        if not self.enabled or self.client is None or not keys:
+            return
+
+        try:
+            self.client.delete(*(self._get_key(key) for key in keys))
+        except Exception as e:
+            logger.error(f"Redis mdelete error for {len(keys)} keys: {e}")
+            # Attempt fallback
+            self.fallback_mode = True
+            self.fallback_cache.mdelete(keys)
+
     def clear(self) -> None:
         """Clear all cache with matching prefix"""
         if self.fallback_mode:
@@ -243,23 +607,64 @@ class RedisCache:
             return
 
         try:
-            # Use pattern matching to only delete keys with our prefix
+            # Use pattern matching to only delete keys with our prefix.
+            # UNLINK frees values in a background thread, and batches are
+            # queued on a pipeline so each flush is one round trip.
             pattern = f"{self.key_prefix}*"
-            cursor = 0
-            while True:
-                cursor, keys = self.client.scan(cursor, match=pattern, count=100)
-                if keys:
-                    self.client.delete(*keys)
-                if cursor == 0:
-                    break
+            pipe = self.client.pipeline(transaction=False)
+            batch: list[bytes] = []
+            queued = 0
+            for key in self.client.scan_iter(match=pattern, count=self.SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= self.SCAN_COUNT:
+                    pipe.unlink(*batch)
+                    queued += len(batch)
+                    batch = []
+                if queued >= self.UNLINK_FLUSH_SIZE:
+                    pipe.execute()
+                    queued = 0
+            if batch:
+                pipe.unlink(*batch)
+                queued += len(batch)
+            if queued:
+                pipe.execute()
         except Exception as e:
             logger.error(f"Redis clear error: {e}")
             # Attempt fallback
             self.fallback_mode = True
             self.fallback_cache.clear()
 
-    def get_stats(self) -> dict:
-        """Get cache statistics"""
+    def _count_keys(self, exact: bool) -> tuple[int, bool]:
+        """
+        Count keys under our prefix, returning (count, estimated)
+
+        Without a prefix every key is ours and DBSIZE answers in O(1). With
+        one, DBSIZE is scaled by the share of prefixed keys in a single SCAN
+        page; an exact count walks the whole keyspace and is opt-in.
+        """
+        if not self.key_prefix:
+            return self.client.dbsize(), False
+
+        if exact:
+            pattern = f"{self.key_prefix}*"
+            scan = self.client.scan_iter(match=pattern, count=self.SCAN_COUNT)
+            return sum(1 for _ in scan), False
+
+        total = self.client.dbsize()
+        _, sample = self.client.scan(cursor=0, count=self.SCAN_COUNT)
+        if not total or not sample:
+            return 0, True
+        prefix = self.key_prefix.encode()
+        hits = sum(1 for key in sample if key.startswith(prefix))
+        return round(total * hits / len(sample)), True
+
+    def get_stats(self, exact_count: bool = False) -> dict:
+        """
+        Get cache statistics
+
+        key_count is estimated from a sample unless exact_count is set,
+        which costs a full SCAN of the keyspace.
+        """
         if self.fallback_mode:
             stats = self.fallback_cache.get_stats()
             stats["mode"] = "fallback"
@@ -271,21 +676,14 @@ class RedisCache:
         try:
             info = self.client.info("stats")
 
-            # Count keys with our prefix
-            pattern = f"{self.key_prefix}*"
-            cursor = 0
-            key_count = 0
-            while True:
-                cursor, keys = self.client.scan(cursor, match=pattern, count=100)
-                key_count += len(keys)
-                if cursor == 0:
-                    break
+            key_count, estimated = self._count_keys(exact_count)
 
             return {
                 "enabled": True,
                 "mode": "redis",
                 "url": self.redis_url,
                 "key_count": key_count,
+                "key_count_estimated": estimated,
                 "key_prefix": self.key_prefix,
                 "total_connections": info.get("total_connections_received", 0),
                 "total_commands": info.get("total_commands_processed", 0),
@@ -309,54 +707,266 @@ class RedisCache:
                 logger.error(f"Error closing Redis connection: {e}")
 
 
+class CountMinSketch:
+    """
+    Approximate per-key access counts in fixed memory
+
+    Counters are halved every sample_size additions so past popularity
+    fades. Updates are not locked: a lost increment under contention only
+    makes an estimate slightly low.
+    """
+
+    MAX_COUNT: Final = 0xFFFF
+
+    def __init__(
+        self, width: int = 2048, depth: int = 4, sample_size: Optional[int] = None
+    ) -> None:
+        self.width = width
+        self.depth = depth
+        self.sample_size = sample_size or width * 10
+        # depth rows of width uint16 counters, stored row after row
+        self._table = array("H", bytes(2 * width * depth))
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        # Double hashing derives one column per row from a single hash()
+        h = hash(key)
+        step = (h >> 32) | 1
+        width = self.width
+        return [row * width + (h + row * step) % width for row in range(self.depth)]
+
+    def add(self, key: str) -> None:
+        """Count one access to key"""
+        table = self._table
+        for i in self._indexes(key):
+            if table[i] < self.MAX_COUNT:
+                table[i] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        """Approximate number of recent accesses to key (never too low)"""
+        table = self._table
+        return min(table[i] for i in self._indexes(key))
+
+    def _age(self) -> None:
+        self._additions = 0
+        self._table = array("H", (count >> 1 for count in self._table))
+
+
 class MultiTierCache:
-    """Multi-tier cache with memory and Redis"""
+    """Multi-tier cache with memory and Redis
+
+    Writes land in L1 synchronously and reach L2 through a write-behind
+    queue, so callers never wait on a Redis round trip. Deletes and clears
+    drain the queue first so a pending write cannot resurrect a removed key.
+
+    With admission="tinylfu", L2 hits are only promoted into L1 once a
+    count-min sketch has seen the key ADMISSION_THRESHOLD times, so one-off
+    lookups (e.g. scanners walking every block) do not evict hot entries.
+    """
+
+    WRITE_QUEUE_SIZE: Final = 10_000
+    WRITE_BATCH_SIZE: Final = 500
+    ADMISSION_THRESHOLD: Final = 2
+    # What remember_miss() stores in L1; code reading l1_cache directly
+    # must treat it as absent
+    MISS_MARKER: Final = _MISS
 
     def __init__(
         self,
         memory_cache: Optional[MemoryCache] = None,
         redis_cache: Optional[RedisCache] = None,
+        admission: Optional[str] = None,
     ):
+        if admission not in (None, "tinylfu"):
+            raise ValueError(f"Unknown admission policy: {admission}")
+        self._sketch = CountMinSketch() if admission == "tinylfu" else None
         self.l1_cache = memory_cache or MemoryCache(max_size=1000)
         self.l2_cache = redis_cache
+        # TTL for promoted L2 entries that carry no expiry of their own
+        self.default_ttl = 300
         self.stats = {"l1_hits": 0, "l2_hits": 0, "misses": 0}
+        self._l2_queue: queue.Queue = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        self._l2_worker: Optional[threading.Thread] = None
+        self._l2_worker_lock = threading.Lock()
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache (L1 -> L2)"""
-        # Try L1 (memory) first
+    def _ensure_l2_worker(self) -> None:
+        """Start the write-behind thread on first use"""
+        if self._l2_worker is not None:
+            return
+        with self._l2_worker_lock:
+            if self._l2_worker is None:
+                worker = threading.Thread(
+                    target=self._drain_l2_queue, name="cache-l2-writer", daemon=True
+                )
+                worker.start()
+                self._l2_worker = worker
+
+    def _drain_l2_queue(self) -> None:
+        """Write queued entries to L2, one pipelined batch per TTL"""
+        while True:
+            batch = [self._l2_queue.get()]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._l2_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            by_ttl: dict[int, dict[str, Any]] = {}
+            for key, value, ttl in batch:
+                by_ttl.setdefault(ttl, {})[key] = value
+            try:
+                for ttl, items in by_ttl.items():
+                    self.l2_cache.mset(items, ttl)
+            except Exception as e:
+                logger.error(f"Write-behind to L2 failed: {e}")
+            finally:
+                for _ in batch:
+                    self._l2_queue.task_done()
+
+    def _enqueue_l2(self, items: dict[str, Any], ttl: int) -> None:
+        """Queue writes for L2, applying backpressure when the queue is full"""
+        self._ensure_l2_worker()
+        for key, value in items.items():
+            try:
+                self._l2_queue.put_nowait((key, value, ttl))
+            except queue.Full:
+                # Drain first so the inline write cannot be overtaken by an
+                # older queued value for the same key
+                self.flush()
+                self.l2_cache.set(key, value, ttl)
+
+    def flush(self) -> None:
+        """Block until every queued L2 write has been applied"""
+        if self._l2_worker is not None:
+            self._l2_queue.join()
+
+    def get(self, key: str, absent: Any = None) -> Optional[Any]:
+        """Get value from cache (L1 -> L2)
+
+        Keys recorded with remember_miss() return absent, so callers that
+        pass their own marker can tell "known missing" from "not cached".
+        """
+        if self._sketch is not None:
+            self._sketch.add(key)
+
+        # Try L1 (memory) first; hits skip the TTL arithmetic of get_with_ttl
         value = self.l1_cache.get(key)
         if value is not None:
+            if value is _MISS:
+                # Known to be absent, no point asking L2
+                self.stats["misses"] += 1
+                return absent
             self.stats["l1_hits"] += 1
             return value
 
-        # Try L2 (Redis) if available
+        return self._get_l2(key)[0]
+
+    def get_with_ttl(
+        self, key: str, absent: Any = None
+    ) -> tuple[Optional[Any], Optional[int]]:
+        """Get value and its remaining TTL in seconds (L1 -> L2)"""
+        if self._sketch is not None:
+            self._sketch.add(key)
+
+        # Try L1 (memory) first
+        value, ttl = self.l1_cache.get_with_ttl(key)
+        if value is not None:
+            if value is _MISS:
+                # Known to be absent, no point asking L2
+                self.stats["misses"] += 1
+                return absent, ttl
+            self.stats["l1_hits"] += 1
+            return value, ttl
+
+        return self._get_l2(key)
+
+    def _get_l2(self, key: str) -> tuple[Optional[Any], Optional[int]]:
+        """Look up an L1 miss in L2, promoting hits"""
         if self.l2_cache:
-            value = self.l2_cache.get(key)
+            value, ttl = self.l2_cache.get_with_ttl(key)
             if value is not None:
                 self.stats["l2_hits"] += 1
-                # Promote to L1
-                self.l1_cache.set(key, value)
-                return value
+                if self._admit(key):
+                    # Promote to L1, never outliving the L2 entry
+                    self.l1_cache.set(key, value, ttl or self.default_ttl)
+                return value, ttl
 
         self.stats["misses"] += 1
-        return None
+        return None, None
+
+    def _admit(self, key: str) -> bool:
+        """Whether an L2 hit for key has earned a place in L1"""
+        return (
+            self._sketch is None
+            or self._sketch.estimate(key) >= self.ADMISSION_THRESHOLD
+        )
 
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        """Set value in cache (both tiers)"""
+        """Set value in L1 and queue it for L2"""
         self.l1_cache.set(key, value, ttl)
-        if self.l2_cache:
-            self.l2_cache.set(key, value, ttl)
+        if self.l2_cache and value is not _MISS:
+            self._enqueue_l2({key: value}, ttl)
+
+    def remember_miss(self, key: str, ttl: int = 10) -> None:
+        """Record that key is absent so lookups skip L2 until ttl expires
+
+        The marker lives in L1 only; a later set() for the key replaces it.
+        """
+        self.l1_cache.set(key, _MISS, ttl)
 
     def delete(self, key: str) -> None:
         """Delete key from all tiers"""
         self.l1_cache.delete(key)
         if self.l2_cache:
+            self.flush()
             self.l2_cache.delete(key)
 
+    def mget(self, keys: list[str]) -> dict[str, Any]:
+        """Get multiple values, batching all L1 misses into one L2 read"""
+        if self._sketch is not None:
+            for key in keys:
+                self._sketch.add(key)
+
+        found = self.l1_cache.mget(keys)
+        absent = {key for key, value in found.items() if value is _MISS}
+        for key in absent:
+            del found[key]
+        self.stats["l1_hits"] += len(found)
+
+        missing = [key for key in keys if key not in found and key not in absent]
+        if missing and self.l2_cache:
+            l2_found = self.l2_cache.mget_with_ttl(missing)
+            self.stats["l2_hits"] += len(l2_found)
+            # Promote to L1, never outliving the L2 entries
+            for key, (value, ttl) in l2_found.items():
+                if self._admit(key):
+                    self.l1_cache.set(key, value, ttl or self.default_ttl)
+                found[key] = value
+
+        self.stats["misses"] += len(keys) - len(found)
+        return found
+
+    def mset(self, items: dict[str, Any], ttl: int = 300) -> None:
+        """Set multiple values in L1 and queue them for L2"""
+        self.l1_cache.mset(items, ttl)
+        if self.l2_cache:
+            self._enqueue_l2(items, ttl)
+
+    def mdelete(self, keys: list[str]) -> None:
+        """Delete multiple keys from all tiers"""
+        self.l1_cache.mdelete(keys)
+        if self.l2_cache:
+            self.flush()
+            self.l2_cache.mdelete(keys)
+
     def clear(self) -> None:
         """Clear all tiers"""
         self.l1_cache.clear()
         if self.l2_cache:
+            self.flush()
             self.l2_cache.clear()
 
     def get_stats(self) -> dict:
@@ -386,30 +996,200 @@ class MultiTierCache:
 
 def cache_key(*args, **kwargs) -> str:
     """Generate cache key from function arguments"""
-    key_parts = [str(arg) for arg in args]
-    key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-    key_string = ":".join(key_parts)
-    return hashlib.md5(key_string.encode()).hexdigest()
+    hasher = xxhash.xxh3_64() if xxhash else hashlib.blake2b(digest_size=16)
+
+    # Feed parts incrementally rather than building one joined string
+    separator = b""
+    for arg in args:
+        hasher.update(separator)
+        hasher.update(str(arg).encode())
+        separator = b":"
+    for k, v in sorted(kwargs.items()):
+        hasher.update(separator)
+        hasher.update(f"{k}={v}".encode())
+        separator = b":"
+
+    return hasher.hexdigest()
+
+
+class _Flight:
+    """A single in-progress call shared by every caller of the same key"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution
+
+    The first caller for a key runs the function; callers arriving while it
+    is in progress block until it finishes and share its result or error.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+
+    def do(self, key: str, func: Callable, *args, **kwargs) -> Any:
+        """Run func once per key across concurrent callers"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func(*args, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """Coroutine counterpart of SingleFlight for a single event loop"""
+
+    def __init__(self):
+        self._flights: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await func once per key across concurrent callers
+
+        func runs in its own task that every caller awaits through a shield,
+        so cancelling one caller (e.g. a disconnected client) does not cancel
+        the shared call for the others.
+        """
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._flights[key] = task
+            task.add_done_callback(lambda done: self._land(key, done))
+        return await asyncio.shield(task)
+
+    def _land(self, key: str, task: asyncio.Future) -> None:
+        """Forget a finished flight"""
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        # Mark retrieved so an error whose callers were all cancelled is
+        # not reported as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+
+# Parameter annotations whose repr() is a stable, unambiguous key fragment
+_SIMPLE_KEY_TYPES = {int, str, float, bool, "int", "str", "float", "bool"}
+
+
+def _is_method(func: Callable) -> bool:
+    """Whether func's first parameter is self or cls, decided from its signature"""
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return next(iter(params), None) in ("self", "cls")
+
+
+def _specialized_key_builder(func: Callable, prefix: str) -> Optional[Callable]:
+    """
+    Generate a key builder tailored to func's signature
+
+    Functions (or methods) whose parameters are all required, positional and
+    annotated with simple scalar types get a builder that formats the key
+    directly, skipping the generic argument walk and hashing. Anything else
+    returns None and uses cache_key().
+    """
+    try:
+        params = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return None
+
+    is_method = _is_method(func)
+    key_params = params[1:] if is_method else params
+    for param in key_params:
+        if param.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            return None
+        if param.default is not inspect.Parameter.empty:
+            return None
+        if param.annotation not in _SIMPLE_KEY_TYPES:
+            return None
+
+    arg_names = [f"a{i}" for i in range(len(key_params))]
+    signature = ", ".join((["_self"] if is_method else []) + arg_names)
+    fragments = "".join(f":{{{name}!r}}" for name in arg_names)
+    source = f'def _key({signature}):\n    return f"{{_prefix}}{fragments}"\n'
+
+    namespace: dict[str, Any] = {"_prefix": prefix}
+    exec(source, namespace)
+    builder = namespace["_key"]
+    builder.arity = len(params)
+    return builder
 
 
 def cached(ttl: int = 300, key_prefix: str = ""):
-    """Decorator for caching function results"""
+    """
+    Decorator for caching function results
+
+    Concurrent misses on the same key are coalesced so only one caller
+    executes the function while the rest wait for its result. Coroutine
+    functions are supported and coalesced per event loop.
+    """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Skip first arg if it's self
-            cache_args = args[1:] if args and hasattr(args[0], "__dict__") else args
+        fast_key = _specialized_key_builder(func, f"{key_prefix}:{func.__name__}")
+        is_method = _is_method(func)
+
+        def make_key(args: tuple, kwargs: dict) -> str:
+            if fast_key is not None and not kwargs and len(args) == fast_key.arity:
+                return fast_key(*args)
+
+            # Leave self/cls out of the key
+            cache_args = args[1:] if is_method else args
 
             # Generate cache key
-            key = f"{key_prefix}:{func.__name__}:{cache_key(*cache_args, **kwargs)}"
+            return f"{key_prefix}:{func.__name__}:{cache_key(*cache_args, **kwargs)}"
 
-            # Try to get from cache
-            if hasattr(wrapper, "_cache"):
-                cached_value = wrapper._cache.get(key)
-                if cached_value is not None:
-                    return cached_value
+        if inspect.iscoroutinefunction(func):
+            async_flight = AsyncSingleFlight()
+
+            async def load_async(key: str, args: tuple, kwargs: dict) -> Any:
+                result = await func(*args, **kwargs)
+                if hasattr(async_wrapper, "_cache"):
+                    async_wrapper._cache.set(key, result, ttl)
+                return result
 
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+
+                # Try to get from cache
+                if hasattr(async_wrapper, "_cache"):
+                    cached_value = async_wrapper._cache.get(key)
+                    if cached_value is not None:
+                        return cached_value
+
+                return await async_flight.do(key, load_async, key, args, kwargs)
+
+            return async_wrapper
+
+        flight = SingleFlight()
+
+        def load(key: str, args: tuple, kwargs: dict) -> Any:
             # Call function
             result = func(*args, **kwargs)
 
@@ -419,6 +1199,18 @@ def cached(ttl: int = 300, key_prefix: str = ""):
 
             return result
 
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+
+            # Try to get from cache
+            if hasattr(wrapper, "_cache"):
+                cached_value = wrapper._cache.get(key)
+                if cached_value is not None:
+                    return cached_value
+
+            return flight.do(key, load, key, args, kwargs)
+
         return wrapper
 
     return decorator
@@ -435,24 +1227,34 @@ class CacheWarmer:
         """Warm cache with latest blocks"""
         logger.info(f"Warming cache with latest {count} blocks")
 
+        # Collect everything first so the L2 write is a single round trip
+        entries: dict[str, Any] = {}
         for i in range(count):
             try:
-                # This would fetch and cache the latest blocks
+                # This would fetch the latest blocks into entries[f"block:{height}"]
                 pass
             except Exception as e:
                 logger.error(f"Error warming block cache: {e}")
 
+        if entries:
+            self.cache.mset(entries, ttl=600)
+
     def warm_popular_addresses(self, addresses: list[str]) -> None:
         """Warm cache with popular addresses"""
         logger.info(f"Warming cache with {len(addresses)} addresses")
 
+        # Collect everything first so the L2 write is a single round trip
+        entries: dict[str, Any] = {}
         for address in addresses:
             try:
-                # This would fetch and cache address data
+                # This would fetch address data into entries[f"address:{address}"]
                 pass
             except Exception as e:
                 logger.error(f"Error warming address cache: {e}")
 
+        if entries:
+            self.cache.mset(entries, ttl=300)
+
     def warm_validators(self) -> None:
         """Warm cache with validator data"""
         logger.info("Warming validator cache")
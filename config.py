@@ -4,7 +4,8 @@ Production-ready configuration for AURA blockchain explorer
 """
 
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 
 class Config:
@@ -80,14 +81,28 @@ class Config:
     ADMIN_API_KEY = os.getenv("ADMIN_API_KEY", "")  # Set in production!
     REQUIRE_API_KEY = os.getenv("REQUIRE_API_KEY", "false").lower() == "true"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._settings = cls._collect_settings()
+
+    @classmethod
+    def _collect_settings(cls) -> Mapping[str, Any]:
+        """Collect public settings, including inherited ones"""
+        settings: Dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            for key, value in vars(klass).items():
+                if key.startswith("_") or callable(value):
+                    continue
+                # classmethod objects are not callable themselves
+                if isinstance(value, classmethod):
+                    continue
+                settings[key] = value
+        return MappingProxyType(settings)
+
     @classmethod
-    def to_dict(cls) -> Dict[str, Any]:
-        """Convert configuration to dictionary"""
-        return {
-            key: value
-            for key, value in cls.__dict__.items()
-            if not key.startswith("_") and not callable(value)
-        }
+    def to_dict(cls) -> Mapping[str, Any]:
+        """Convert configuration to a read-only mapping, built once per class"""
+        return cls._settings
 
     @classmethod
     def validate(cls) -> None:
@@ -110,6 +125,9 @@ class Config:
             raise ValueError(f"Configuration validation failed: {', '.join(errors)}")
 
 
+Config._settings = Config._collect_settings()
+
+
 class DevelopmentConfig(Config):
     """Development configuration"""
 
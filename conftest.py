@@ -0,0 +1,57 @@
+"""
+Shared pytest fixtures
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+
+@pytest.fixture
+def route_session_through_requests_get(monkeypatch):
+    """Send pooled-session GETs through requests.get so its patches apply
+
+    Older tests patch requests.get; new ones should patch
+    requests.Session.get directly so calls keep going through the pool.
+    """
+    monkeypatch.setattr(
+        requests.Session, "get", lambda self, url, **kwargs: requests.get(url, **kwargs)
+    )
+
+
+@pytest.fixture
+def overlapping_calls():
+    """Run a call twice, the second starting while the first is mid-fetch
+
+    Returns a function taking the call and the response every GET returns,
+    and giving back the URLs fetched and both results.
+    """
+
+    def run(call, response):
+        entered = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            entered.set()
+            release.wait(timeout=5)
+            return response
+
+        results = []
+        with patch("requests.Session.get", side_effect=fake_get):
+            first = threading.Thread(target=lambda: results.append(call()))
+            first.start()
+            entered.wait(timeout=5)
+            second = threading.Thread(target=lambda: results.append(call()))
+            second.start()
+            time.sleep(0.05)
+            release.set()
+            first.join(timeout=5)
+            second.join(timeout=5)
+        return calls, results
+
+    return run
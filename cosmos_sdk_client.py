@@ -5,35 +5,202 @@ Provides specialized query methods for all Cosmos SDK modules and Aura custom mo
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from enum import StrEnum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
 from decimal import Decimal
+from functools import cache, wraps
+from operator import itemgetter
+from urllib.parse import urlencode
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+from cache import AsyncSingleFlight, MemoryCache, SingleFlight
+
+# aiohttp is only needed by AsyncCosmosSDKClient
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# ijson parses large list responses incrementally; without it the streaming
+# helpers fall back to parsing the whole body
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# grpcio plus cosmpy's generated protobuf stubs let the staking queries skip
+# the node's protobuf -> JSON gateway; without them those queries use REST
+try:
+    import grpc
+    from cosmpy.protos.cosmos.base.query.v1beta1.pagination_pb2 import PageRequest
+    from cosmpy.protos.cosmos.crypto.ed25519.keys_pb2 import PubKey as Ed25519PubKey
+    from cosmpy.protos.cosmos.staking.v1beta1 import query_pb2 as staking_query_pb2
+    from cosmpy.protos.cosmos.staking.v1beta1 import (
+        query_pb2_grpc as staking_query_grpc,
+    )
+    from cosmpy.protos.cosmos.staking.v1beta1.staking_pb2 import (
+        BondStatus as ProtoBondStatus,
+    )
+except ImportError:
+    grpc = None
+
+# msgspec decodes coin lists straight into Coin instances with no
+# intermediate dicts; without it they go through _loads and _parse_coins
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# orjson parses response bytes directly, skipping the UTF-8 decode and the
+# slower stdlib parser on large validator/proposal lists
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _walk(doc: Any, path: str) -> Any:
+    """Follow a dotted key path through nested dicts, None if it breaks"""
+    for key in path.split(".") if path else ():
+        doc = doc.get(key) if isinstance(doc, dict) else None
+    return doc
+
+
+def _parse_items(
+    events: Iterator[Tuple[str, str, Any]], item_path: str, fields: Dict[str, Any]
+) -> Iterator[Any]:
+    """
+    Build the items at item_path from ijson.parse events
+
+    Scalars whose prefix is a key of fields are stored there as they are
+    read, so totals next to the array are known once the items run out.
+    """
+    for prefix, event, value in events:
+        if prefix == item_path:
+            if event not in ("start_map", "start_array"):
+                yield value
+                continue
+            builder = ijson.ObjectBuilder()
+            depth = 0
+            while True:
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                if not depth:
+                    break
+                prefix, event, value = next(events)
+            yield builder.value
+        elif prefix in fields and event not in ("start_map", "start_array"):
+            fields[prefix] = value
+
+
+# ==================== ENUMS ====================
+
+
+class BondStatus(StrEnum):
+    """Validator bond status filter values"""
+
+    UNSPECIFIED = "BOND_STATUS_UNSPECIFIED"
+    UNBONDED = "BOND_STATUS_UNBONDED"
+    UNBONDING = "BOND_STATUS_UNBONDING"
+    BONDED = "BOND_STATUS_BONDED"
+
+
+class ProposalStatus(StrEnum):
+    """Governance proposal status filter values"""
+
+    UNSPECIFIED = "PROPOSAL_STATUS_UNSPECIFIED"
+    DEPOSIT_PERIOD = "PROPOSAL_STATUS_DEPOSIT_PERIOD"
+    VOTING_PERIOD = "PROPOSAL_STATUS_VOTING_PERIOD"
+    PASSED = "PROPOSAL_STATUS_PASSED"
+    REJECTED = "PROPOSAL_STATUS_REJECTED"
+    FAILED = "PROPOSAL_STATUS_FAILED"
+
+
 # ==================== DATA MODELS ====================
+# Models are slotted (no per-instance __dict__) and immutable; use
+# dataclasses.replace() to derive a modified copy.
+
+
+class _ParsedAmount:
+    """Slots for lazily parsed amounts, kept out of the dataclass fields so
+    they never show up in __eq__, __hash__, repr() or asdict()"""
+
+    __slots__ = ("_amount_int", "_amount_decimal")
+    _amount_int: int
+    _amount_decimal: Decimal
 
 
-@dataclass
-class Coin:
+@dataclass(slots=True, frozen=True)
+class Coin(_ParsedAmount):
     """Token amount with denomination"""
 
     denom: str
     amount: str
 
+    @property
+    def amount_int(self) -> int:
+        """Amount as an int, for integer (non-Dec) coins; parsed once"""
+        try:
+            return self._amount_int
+        except AttributeError:
+            value = int(self.amount)
+            object.__setattr__(self, "_amount_int", value)
+            return value
+
     @property
     def amount_decimal(self) -> Decimal:
-        return Decimal(self.amount)
+        """Amount as a Decimal, exact for Dec coins too; parsed once"""
+        try:
+            return self._amount_decimal
+        except AttributeError:
+            value = Decimal(self.amount)
+            object.__setattr__(self, "_amount_decimal", value)
+            return value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Validator:
     """Validator information"""
 
@@ -50,9 +217,11 @@ class Validator:
     min_self_delegation: str
     voting_power: int = 0
     uptime: float = 0.0
+    # Only populated when requested with fetch_delegations=True
+    delegations: Optional[List[Delegation]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Delegation:
     """Delegation information"""
 
@@ -62,7 +231,7 @@ class Delegation:
     balance: Coin
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Proposal:
     """Governance proposal"""
 
@@ -77,7 +246,7 @@ class Proposal:
     voting_end_time: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Pool:
     """DEX liquidity pool"""
 
@@ -90,7 +259,7 @@ class Pool:
     swap_fee: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DIDDocument:
     """Decentralized Identity Document"""
 
@@ -102,7 +271,7 @@ class DIDDocument:
     service: List[Dict[str, Any]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerifiableCredential:
     """Verifiable Credential"""
 
@@ -116,7 +285,7 @@ class VerifiableCredential:
     credential_data: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BridgeState:
     """Cross-chain bridge state"""
 
@@ -126,15 +295,255 @@ class BridgeState:
     active_transfers: int
 
 
+@dataclass(slots=True, frozen=True)
+class NetworkOverview:
+    """Staking pool, supply and staking params for the network stats widget"""
+
+    pool: Dict[str, str]
+    total_supply: List[Coin]
+    staking_params: Dict[str, Any]
+
+
+# ==================== RESPONSE PARSING ====================
+# Shared by the sync and async clients so both build identical models
+
+
+# C-level field extraction; models are then built positionally, which skips
+# per-call keyword matching in the generated __init__
+_COIN_FIELDS: Final = itemgetter("denom", "amount")
+_VALIDATOR_FIELDS: Final = itemgetter(
+    "operator_address",
+    "jailed",
+    "status",
+    "tokens",
+    "delegator_shares",
+    "description",
+)
+_DELEGATION_FIELDS: Final = itemgetter(
+    "delegator_address", "validator_address", "shares"
+)
+
+
+def _parse_coins(items: List[Dict[str, str]]) -> List[Coin]:
+    return [Coin(*_COIN_FIELDS(c)) for c in items]
+
+
+@cache
+def _coin_list_decoder(field: str) -> Any:
+    """Typed msgspec decoder for a response holding a coin list under field"""
+    response_type = TypedDict(
+        "_CoinListResponse", {field: Optional[List[Coin]]}, total=False
+    )
+    return msgspec.json.Decoder(response_type)
+
+
+def _parse_validator(v: Dict[str, Any]) -> Validator:
+    operator_address, jailed, status, tokens, shares, description = _VALIDATOR_FIELDS(v)
+    return Validator(
+        operator_address,
+        v.get("consensus_pubkey", {}).get("key", ""),
+        jailed,
+        status,
+        tokens,
+        shares,
+        description,
+        int(v.get("unbonding_height", 0)),
+        v.get("unbonding_time", ""),
+        v["commission"],
+        v["min_self_delegation"],
+    )
+
+
+def _parse_delegation(d: Dict[str, Any]) -> Delegation:
+    delegator_address, validator_address, shares = _DELEGATION_FIELDS(d["delegation"])
+    denom, amount = _COIN_FIELDS(d["balance"])
+    return Delegation(delegator_address, validator_address, shares, Coin(denom, amount))
+
+
+# gRPC carries sdk.Dec values as integers scaled by 10**18; REST renders them
+# with the decimal point, which is what the models store
+_DEC_PRECISION: Final = 18
+
+
+def _grpc_dec(value: str) -> str:
+    """Format a gRPC-encoded sdk.Dec the way the REST gateway does"""
+    sign = "-" if value.startswith("-") else ""
+    digits = value.lstrip("-").rjust(_DEC_PRECISION + 1, "0")
+    return f"{sign}{digits[:-_DEC_PRECISION]}.{digits[-_DEC_PRECISION:]}"
+
+
+def _validator_from_proto(v: Any) -> Validator:
+    consensus_pubkey = ""
+    if v.consensus_pubkey.type_url.endswith("ed25519.PubKey"):
+        key = Ed25519PubKey.FromString(v.consensus_pubkey.value).key
+        consensus_pubkey = base64.b64encode(key).decode()
+    rates = v.commission.commission_rates
+    return Validator(
+        v.operator_address,
+        consensus_pubkey,
+        v.jailed,
+        ProtoBondStatus.Name(v.status),
+        v.tokens,
+        _grpc_dec(v.delegator_shares),
+        {
+            "moniker": v.description.moniker,
+            "identity": v.description.identity,
+            "website": v.description.website,
+            "security_contact": v.description.security_contact,
+            "details": v.description.details,
+        },
+        v.unbonding_height,
+        v.unbonding_time.ToJsonString(),
+        {
+            "commission_rates": {
+                "rate": _grpc_dec(rates.rate),
+                "max_rate": _grpc_dec(rates.max_rate),
+                "max_change_rate": _grpc_dec(rates.max_change_rate),
+            },
+            "update_time": v.commission.update_time.ToJsonString(),
+        },
+        v.min_self_delegation,
+    )
+
+
+def _delegation_from_proto(d: Any) -> Delegation:
+    return Delegation(
+        d.delegation.delegator_address,
+        d.delegation.validator_address,
+        _grpc_dec(d.delegation.shares),
+        Coin(d.balance.denom, d.balance.amount),
+    )
+
+
+def _delegations_from_proto(response: Any) -> List[Delegation]:
+    return [_delegation_from_proto(d) for d in response.delegation_responses]
+
+
+def _parse_proposal(p: Dict[str, Any]) -> Proposal:
+    return Proposal(
+        proposal_id=int(p["proposal_id"]),
+        content=p.get("content", {}),
+        status=p["status"],
+        final_tally_result=p.get("final_tally_result", {}),
+        submit_time=p["submit_time"],
+        deposit_end_time=p["deposit_end_time"],
+        total_deposit=_parse_coins(p.get("total_deposit", [])),
+        voting_start_time=p.get("voting_start_time", ""),
+        voting_end_time=p.get("voting_end_time", ""),
+    )
+
+
 # ==================== COSMOS SDK CLIENT ====================
 
 
-class CosmosSDKClient:
+class _RoutePrefixes:
+    """Fully qualified REST module prefixes, built once per client"""
+
+    def _init_routes(self, api_url: str) -> None:
+        self._bank = f"{api_url}/cosmos/bank/v1beta1"
+        self._staking = f"{api_url}/cosmos/staking/v1beta1"
+        self._gov = f"{api_url}/cosmos/gov/v1beta1"
+        self._distribution = f"{api_url}/cosmos/distribution/v1beta1"
+        self._identity = f"{api_url}/aura/identity/v1"
+        self._vcregistry = f"{api_url}/aura/vcregistry/v1"
+        self._dex = f"{api_url}/aura/dex/v1"
+        self._bridge = f"{api_url}/aura/bridge/v1"
+        self._wasm = f"{api_url}/cosmwasm/wasm/v1"
+
+
+# Proposals in these states never change again
+_FINAL_PROPOSAL_STATUSES: Final = frozenset(
+    {ProposalStatus.PASSED, ProposalStatus.REJECTED, ProposalStatus.FAILED}
+)
+
+
+def _ttl_cached(ttl: Union[int, Callable[[Any], int]]) -> Callable:
+    """
+    Cache a query method's result in the client's per-instance TTL cache
+
+    ttl is either a fixed number of seconds or a function of the result,
+    where 0 means the result is not cached. None results (failed queries)
+    are never cached. Cached results are shared, so treat them as read-only.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self: CosmosSDKClient, *args: Any, **kwargs: Any) -> Any:
+            key = f"{func.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+            value = self._query_cache.get(key)
+            if value is not None:
+                return value
+
+            value = func(self, *args, **kwargs)
+            entry_ttl = ttl(value) if callable(ttl) else ttl
+            if value is not None and entry_ttl > 0:
+                self._query_cache.set(key, value, entry_ttl)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _flight_key(url: str, params: Optional[Dict]) -> str:
+    """Identify a request for in-flight deduplication"""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def _proposal_ttl(proposal: Proposal) -> int:
+    """Cache concluded proposals for a day; ones still in progress not at all"""
+    if proposal.status in _FINAL_PROPOSAL_STATUSES:
+        return CosmosSDKClient.FINAL_PROPOSAL_TTL
+    return 0
+
+
+class _LoggingRetry(Retry):
+    """Retry policy that logs each retry it schedules"""
+
+    def increment(self, method=None, url=None, *args, **kwargs) -> Retry:
+        new_retry = super().increment(method, url, *args, **kwargs)
+        logger.debug("retry n=%d url=%s", len(new_retry.history), url)
+        return new_retry
+
+
+class CosmosSDKClient(_RoutePrefixes):
     """
     Advanced Cosmos SDK query client for Aura blockchain
     Supports all standard modules and Aura custom modules
+
+    Independent queries can be fanned out over the shared session with
+    _parallel_get(), which every bulk helper uses.
     """
 
+    POOL_SIZE = 64
+    # Fan-out workers; stays within POOL_SIZE so no worker waits on a socket
+    MAX_WORKERS = 32
+
+    # Cache lifetimes (seconds) for queries that rarely or never change
+    BLOCK_TTL = 15
+    SUPPLY_TTL = 15
+    VALIDATOR_TTL = 60
+    CONTRACT_INFO_TTL = 60
+    PARAMS_TTL = 600
+    FINAL_PROPOSAL_TTL = 24 * 3600
+    QUERY_CACHE_SIZE = 1024
+    ETAG_CACHE_SIZE = 1024
+
+    # Shared by every client (Retry is immutable); jitter spreads out the
+    # retries of many clients hitting a recovering node at once
+    RETRY: Final = _LoggingRetry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        status_forcelist=frozenset([500, 502, 503, 504]),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        # Hand the last response back so raise_for_status reports it
+        raise_on_status=False,
+    )
+
     def __init__(
         self,
         rpc_url: str,
@@ -142,6 +551,7 @@ class CosmosSDKClient:
         grpc_url: Optional[str] = None,
         timeout: int = 10,
         retry_count: int = 3,
+        prewarm: bool = False,
     ):
         """
         Initialize Cosmos SDK client
@@ -152,30 +562,184 @@ class CosmosSDKClient:
             grpc_url: gRPC endpoint (e.g., localhost:9090)
             timeout: Request timeout in seconds
             retry_count: Number of retries for failed requests
+            prewarm: Open a connection to the API up front so the first
+                query does not pay for the TCP/TLS handshake
         """
         self.rpc_url = rpc_url.rstrip("/")
         self.api_url = api_url.rstrip("/")
+        self._init_routes(self.api_url)
         self.grpc_url = grpc_url
         self.timeout = timeout
+        self._query_cache = MemoryCache(max_size=self.QUERY_CACHE_SIZE)
+        self._inflight = SingleFlight()
+        self._staking_stub: Optional[Any] = None
+        # key -> (ETag, parsed body), least recently used first
+        self._etag_cache: OrderedDict[str, Tuple[str, Dict[str, Any]]] = OrderedDict()
+        self._etag_lock = threading.Lock()
 
         # Configure session with retry logic
         self.session = requests.Session()
-        retry = Retry(
-            total=retry_count, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]
+        retry = self.RETRY
+        if retry_count != retry.total:
+            retry = retry.new(total=retry_count)
+        # Size the pool for bursts (e.g. per-validator delegation lookups) so
+        # concurrent callers reuse sockets instead of reconnecting
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "Accept": "application/json",
+                # gzip/deflate, plus br and zstd when brotli/zstandard are
+                # installed; urllib3 decodes whatever it advertises
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive",
+            }
+        )
+
+        if prewarm:
+            self._prewarm()
 
-    def _get(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make GET request with error handling"""
+    def _prewarm(self) -> None:
+        """Open a pooled keep-alive connection to the API endpoint"""
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            self.session.head(self.api_url, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            logger.warning("Connection pre-warm failed: %s - %s", self.api_url, e)
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        decode: Callable[[bytes], Any] = _loads,
+    ) -> Dict[str, Any]:
+        """
+        Make GET request with error handling
+
+        Concurrent identical requests share one round trip and receive the
+        same parsed object, so treat responses as read-only.
+
+        Args:
+            url: Endpoint to query
+            params: Query parameters
+            decode: Body parser; a typed decoder yields model instances
+                instead of plain JSON values
+        """
+        key = _flight_key(url, params)
+        if decode is not _loads:
+            # A URL always returns the same shape, so one typed variant is
+            # enough to keep its results apart from plain parses
+            key = f"{key}#typed"
+        return self._inflight.do(key, self._fetch, url, params, key, decode)
+
+    def _get_coins(self, url: str, field: str) -> List[Coin]:
+        """Get the coin list stored under field in the response"""
+        if msgspec is not None:
+            data = self._get(url, decode=_coin_list_decoder(field).decode)
+            return data.get(field) or []
+
+        data = self._get(url)
+        coins = data.get(field) or ()
+        if not coins:
+            return []
+        return _parse_coins(coins)
+
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict],
+        key: str,
+        decode: Callable[[bytes], Any] = _loads,
+    ) -> Dict[str, Any]:
+        """
+        Issue a GET request and parse the JSON response
+
+        Responses that carry an ETag are remembered, and the next request
+        for the same key is made conditional; a 304 reply reuses the
+        remembered body without transferring or parsing it again.
+        """
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        try:
+            response = self.session.get(
+                url, params=params, timeout=self.timeout, headers=headers
+            )
+            if cached and response.status_code == 304:
+                with self._etag_lock:
+                    if key in self._etag_cache:
+                        self._etag_cache.move_to_end(key)
+                return cached[1]
+
             response.raise_for_status()
-            return response.json()
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_compression(url, response)
+            data = decode(response.content)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {url} - {e}")
+            logger.error("Request failed: %s - %s", url, e)
             raise
+        except ValueError as e:
+            # json, orjson and msgspec decode errors all subclass ValueError
+            logger.error("Invalid JSON response: %s - %s", url, e)
+            raise
+
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, data)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return data
+
+    @staticmethod
+    def _log_compression(url: str, response: requests.Response) -> None:
+        """Report bytes on the wire against decoded bytes for a response"""
+        encoding = response.headers.get("Content-Encoding", "identity")
+        wire_bytes = response.headers.get("Content-Length", "?")
+        logger.debug(
+            "%s: %s %s bytes on the wire, %d decoded",
+            url,
+            encoding,
+            wire_bytes,
+            len(response.content),
+        )
+
+    def invalidate(self) -> None:
+        """Drop every cached query result"""
+        self._query_cache.clear()
+
+    def _grpc_query(
+        self,
+        method: str,
+        request: Callable[[], Any],
+        convert: Callable[[Any], Any],
+    ) -> Optional[Any]:
+        """
+        Run a staking query over gRPC, or return None so the caller uses REST
+
+        gRPC is used only when grpc_url is set and the protobuf stubs are
+        installed; RPC errors are logged and also fall back to REST.
+        """
+        if self.grpc_url is None or grpc is None:
+            return None
+        if self._staking_stub is None:
+            channel = grpc.insecure_channel(self.grpc_url)
+            self._staking_stub = staking_query_grpc.QueryStub(channel)
+        try:
+            response = getattr(self._staking_stub, method)(
+                request(), timeout=self.timeout
+            )
+        except grpc.RpcError as e:
+            logger.warning("gRPC %s failed, falling back to REST: %s", method, e)
+            return None
+        return convert(response)
 
     def _rpc_get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Query Tendermint RPC"""
@@ -185,6 +749,88 @@ class CosmosSDKClient:
         """Query Cosmos SDK REST API"""
         return self._get(f"{self.api_url}/{endpoint}", params)
 
+    def _stream_get(
+        self,
+        url: str,
+        item_path: str,
+        params: Optional[Dict] = None,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield items from a JSON array in the response without buffering it
+
+        Args:
+            url: Endpoint to query
+            item_path: ijson prefix of the array items, e.g. "votes.item"
+            params: Query parameters
+            fields: Dotted paths of scalars to record alongside the items,
+                e.g. {"result.total_count": None}; filled in once the
+                items are exhausted
+        """
+        try:
+            response = self.session.get(
+                url, params=params, timeout=self.timeout, stream=True
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error("Request failed: %s - %s", url, e)
+            raise
+
+        with response:
+            if ijson is not None:
+                # Let urllib3 undo gzip/deflate before ijson reads the stream
+                response.raw.decode_content = True
+                if fields is None:
+                    yield from ijson.items(response.raw, item_path, use_float=True)
+                else:
+                    events = ijson.parse(response.raw, use_float=True)
+                    yield from _parse_items(events, item_path, fields)
+                return
+
+            doc = _loads(response.content)
+            for path in fields or ():
+                fields[path] = _walk(doc, path)
+            items = _walk(doc, item_path.rpartition(".")[0])
+            if isinstance(items, list):
+                yield from items
+
+    def _stream_rpc_get(
+        self,
+        endpoint: str,
+        item_path: str,
+        params: Optional[Dict] = None,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Stream array items from Tendermint RPC"""
+        return self._stream_get(f"{self.rpc_url}/{endpoint}", item_path, params, fields)
+
+    def _stream_api_get(
+        self, endpoint: str, item_path: str, params: Optional[Dict] = None
+    ) -> Iterator[Any]:
+        """Stream array items from Cosmos SDK REST API"""
+        return self._stream_get(f"{self.api_url}/{endpoint}", item_path, params)
+
+    def _parallel_get(
+        self, calls: List[Tuple[str, Optional[Dict]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run independent GET requests concurrently over the pooled session
+
+        Args:
+            calls: (url, params) pairs
+
+        Returns:
+            Parsed responses in the same order as calls. The first
+            failure is raised once all requests have finished.
+        """
+        if len(calls) <= 1:
+            return [self._get(url, params) for url, params in calls]
+
+        workers = min(self.MAX_WORKERS, len(calls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._get, url, params) for url, params in calls]
+            return [future.result() for future in futures]
+
     # ==================== TENDERMINT RPC ====================
 
     def get_status(self) -> Dict[str, Any]:
@@ -193,8 +839,13 @@ class CosmosSDKClient:
 
     def get_block(self, height: Optional[int] = None) -> Dict[str, Any]:
         """Get block at height (latest if None)"""
-        params = {"height": str(height)} if height else None
-        return self._rpc_get("block", params)
+        if not height:
+            return self._rpc_get("block")
+        return self._get_block_at(height)
+
+    @_ttl_cached(BLOCK_TTL)
+    def _get_block_at(self, height: int) -> Dict[str, Any]:
+        return self._rpc_get("block", {"height": str(height)})
 
     def get_block_results(self, height: int) -> Dict[str, Any]:
         """Get block results (events, begin_block, end_block)"""
@@ -218,6 +869,29 @@ class CosmosSDKClient:
             "tx_search", {"query": query, "page": str(page), "per_page": str(per_page)}
         )
 
+    def iter_transactions(self, query: str, per_page: int = 100) -> Iterator[Any]:
+        """Stream every transaction matching query, one page at a time"""
+        page = 1
+        while True:
+            fields: Dict[str, Any] = {"result.total_count": None}
+            count = 0
+            for tx in self._stream_rpc_get(
+                "tx_search",
+                "result.txs.item",
+                {"query": query, "page": str(page), "per_page": str(per_page)},
+                fields,
+            ):
+                count += 1
+                yield tx
+            # CometBFT rejects pages past the end, so stop on the last one
+            # even when it is full
+            total = fields["result.total_count"]
+            if count < per_page or (
+                total is not None and page * per_page >= int(total)
+            ):
+                return
+            page += 1
+
     def get_validators(self, height: Optional[int] = None) -> Dict[str, Any]:
         """Get validator set at height"""
         params = {"height": str(height)} if height else None
@@ -227,7 +901,7 @@ class CosmosSDKClient:
 
     def get_balance(self, address: str, denom: str) -> Coin:
         """Get balance of single denomination"""
-        data = self._api_get(f"cosmos/bank/v1beta1/balances/{address}/{denom}")
+        data = self._get(f"{self._bank}/balances/{address}/{denom}")
         balance = data.get("balance", {})
         return Coin(
             denom=balance.get("denom", denom), amount=balance.get("amount", "0")
@@ -235,128 +909,163 @@ class CosmosSDKClient:
 
     def get_balances(self, address: str) -> List[Coin]:
         """Get all token balances for address"""
-        data = self._api_get(f"cosmos/bank/v1beta1/balances/{address}")
-        balances = data.get("balances", [])
-        return [Coin(denom=b["denom"], amount=b["amount"]) for b in balances]
+        return self._get_coins(f"{self._bank}/balances/{address}", "balances")
 
+    @_ttl_cached(SUPPLY_TTL)
     def get_supply(self, denom: str) -> Coin:
         """Get total supply of denomination"""
-        data = self._api_get(f"cosmos/bank/v1beta1/supply/{denom}")
+        data = self._get(f"{self._bank}/supply/{denom}")
         supply = data.get("amount", {})
         return Coin(denom=supply.get("denom", denom), amount=supply.get("amount", "0"))
 
     def get_total_supply(self) -> List[Coin]:
         """Get total supply of all denominations"""
-        data = self._api_get("cosmos/bank/v1beta1/supply")
-        supply = data.get("supply", [])
-        return [Coin(denom=s["denom"], amount=s["amount"]) for s in supply]
+        return self._get_coins(f"{self._bank}/supply", "supply")
 
     # ==================== STAKING MODULE ====================
 
     def get_staking_validators(
-        self, status: Optional[str] = None, pagination_limit: int = 100
+        self,
+        status: Optional[BondStatus | str] = None,
+        pagination_limit: int = 100,
+        fetch_delegations: bool = False,
     ) -> List[Validator]:
         """
         Get validator set with optional status filter
 
         Args:
-            status: BOND_STATUS_BONDED, BOND_STATUS_UNBONDING, BOND_STATUS_UNBONDED
+            status: BondStatus member or its string value; unknown values
+                raise ValueError instead of silently returning every validator
             pagination_limit: Max validators to return
+            fetch_delegations: Also load each validator's delegations,
+                fetched concurrently
         """
         params = {"pagination.limit": str(pagination_limit)}
         if status:
-            params["status"] = status
-
-        data = self._api_get("cosmos/staking/v1beta1/validators", params)
-        validators = data.get("validators", [])
-
-        return [
-            Validator(
-                operator_address=v["operator_address"],
-                consensus_address=v.get("consensus_pubkey", {}).get("key", ""),
-                jailed=v["jailed"],
-                status=v["status"],
-                tokens=v["tokens"],
-                delegator_shares=v["delegator_shares"],
-                description=v["description"],
-                unbonding_height=int(v.get("unbonding_height", 0)),
-                unbonding_time=v.get("unbonding_time", ""),
-                commission=v["commission"],
-                min_self_delegation=v["min_self_delegation"],
+            params["status"] = BondStatus(status).value
+
+        result = self._grpc_query(
+            "Validators",
+            lambda: staking_query_pb2.QueryValidatorsRequest(
+                status=params.get("status", ""),
+                pagination=PageRequest(limit=pagination_limit),
+            ),
+            lambda response: [_validator_from_proto(v) for v in response.validators],
+        )
+        if result is None:
+            data = self._get(f"{self._staking}/validators", params)
+            result = [_parse_validator(v) for v in data.get("validators", [])]
+
+        if fetch_delegations:
+            by_validator = self.get_validator_delegations_bulk(
+                [v.operator_address for v in result]
             )
-            for v in validators
-        ]
+            result = [
+                replace(v, delegations=by_validator[v.operator_address]) for v in result
+            ]
+        return result
 
+    @_ttl_cached(VALIDATOR_TTL)
     def get_validator(self, validator_address: str) -> Validator:
         """Get single validator details"""
-        data = self._api_get(f"cosmos/staking/v1beta1/validators/{validator_address}")
-        v = data["validator"]
-
-        return Validator(
-            operator_address=v["operator_address"],
-            consensus_address=v.get("consensus_pubkey", {}).get("key", ""),
-            jailed=v["jailed"],
-            status=v["status"],
-            tokens=v["tokens"],
-            delegator_shares=v["delegator_shares"],
-            description=v["description"],
-            unbonding_height=int(v.get("unbonding_height", 0)),
-            unbonding_time=v.get("unbonding_time", ""),
-            commission=v["commission"],
-            min_self_delegation=v["min_self_delegation"],
-        )
+        data = self._get(f"{self._staking}/validators/{validator_address}")
+        return _parse_validator(data["validator"])
 
     def get_delegations(self, delegator_address: str) -> List[Delegation]:
         """Get all delegations for address"""
-        data = self._api_get(f"cosmos/staking/v1beta1/delegations/{delegator_address}")
-        delegations = data.get("delegation_responses", [])
-
-        return [
-            Delegation(
-                delegator_address=d["delegation"]["delegator_address"],
-                validator_address=d["delegation"]["validator_address"],
-                shares=d["delegation"]["shares"],
-                balance=Coin(
-                    denom=d["balance"]["denom"], amount=d["balance"]["amount"]
-                ),
-            )
-            for d in delegations
-        ]
+        result = self._grpc_query(
+            "DelegatorDelegations",
+            lambda: staking_query_pb2.QueryDelegatorDelegationsRequest(
+                delegator_addr=delegator_address
+            ),
+            _delegations_from_proto,
+        )
+        if result is not None:
+            return result
+
+        data = self._get(f"{self._staking}/delegations/{delegator_address}")
+        delegations = data.get("delegation_responses") or ()
+        if not delegations:
+            return []
+
+        return [_parse_delegation(d) for d in delegations]
 
     def get_validator_delegations(self, validator_address: str) -> List[Delegation]:
         """Get all delegations to a validator"""
-        data = self._api_get(
-            f"cosmos/staking/v1beta1/validators/{validator_address}/delegations"
+        result = self._grpc_query(
+            "ValidatorDelegations",
+            lambda: staking_query_pb2.QueryValidatorDelegationsRequest(
+                validator_addr=validator_address
+            ),
+            _delegations_from_proto,
         )
-        delegations = data.get("delegation_responses", [])
-
-        return [
-            Delegation(
-                delegator_address=d["delegation"]["delegator_address"],
-                validator_address=d["delegation"]["validator_address"],
-                shares=d["delegation"]["shares"],
-                balance=Coin(
-                    denom=d["balance"]["denom"], amount=d["balance"]["amount"]
-                ),
-            )
-            for d in delegations
-        ]
+        if result is not None:
+            return result
+
+        data = self._get(f"{self._staking}/validators/{validator_address}/delegations")
+        delegations = data.get("delegation_responses") or ()
+        if not delegations:
+            return []
+
+        return [_parse_delegation(d) for d in delegations]
+
+    def get_validator_delegations_bulk(
+        self, validator_addresses: List[str]
+    ) -> Dict[str, List[Delegation]]:
+        """Get delegations to several validators concurrently"""
+        responses = self._parallel_get(
+            [
+                (
+                    f"{self._staking}/validators/{address}/delegations",
+                    None,
+                )
+                for address in validator_addresses
+            ]
+        )
+        return {
+            address: [
+                _parse_delegation(d) for d in data.get("delegation_responses", [])
+            ]
+            for address, data in zip(validator_addresses, responses)
+        }
 
     def get_staking_pool(self) -> Dict[str, str]:
         """Get staking pool totals"""
-        data = self._api_get("cosmos/staking/v1beta1/pool")
+        data = self._get(f"{self._staking}/pool")
         return data.get("pool", {})
 
+    @_ttl_cached(PARAMS_TTL)
     def get_staking_params(self) -> Dict[str, Any]:
         """Get staking module parameters"""
-        data = self._api_get("cosmos/staking/v1beta1/params")
+        data = self._get(f"{self._staking}/params")
         return data.get("params", {})
 
+    # ==================== OVERVIEW ====================
+
+    def get_network_overview(self) -> NetworkOverview:
+        """
+        Get the network stats shown on the home page in one call
+
+        The three queries run concurrently, so the wait is the slowest
+        round trip rather than their sum. Prefer this over chaining
+        get_staking_pool, get_total_supply and get_staking_params.
+        """
+        queries = (
+            self.get_staking_pool,
+            self.get_total_supply,
+            self.get_staking_params,
+        )
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            pool, total_supply, staking_params = executor.map(
+                lambda query: query(), queries
+            )
+        return NetworkOverview(pool, total_supply, staking_params)
+
     # ==================== GOVERNANCE MODULE ====================
 
     def get_proposals(
         self,
-        status: Optional[str] = None,
+        status: Optional[ProposalStatus | str] = None,
         voter: Optional[str] = None,
         depositor: Optional[str] = None,
     ) -> List[Proposal]:
@@ -364,70 +1073,51 @@ class CosmosSDKClient:
         Get governance proposals with optional filters
 
         Args:
-            status: PROPOSAL_STATUS_VOTING_PERIOD, PROPOSAL_STATUS_PASSED, etc.
+            status: ProposalStatus member or its string value; unknown values
+                raise ValueError
             voter: Filter by voter address
             depositor: Filter by depositor address
         """
         params = {"pagination.limit": "100"}
         if status:
-            params["proposal_status"] = status
+            params["proposal_status"] = ProposalStatus(status).value
         if voter:
             params["voter"] = voter
         if depositor:
             params["depositor"] = depositor
 
-        data = self._api_get("cosmos/gov/v1beta1/proposals", params)
-        proposals = data.get("proposals", [])
-
-        return [
-            Proposal(
-                proposal_id=int(p["proposal_id"]),
-                content=p.get("content", {}),
-                status=p["status"],
-                final_tally_result=p.get("final_tally_result", {}),
-                submit_time=p["submit_time"],
-                deposit_end_time=p["deposit_end_time"],
-                total_deposit=[
-                    Coin(denom=c["denom"], amount=c["amount"])
-                    for c in p.get("total_deposit", [])
-                ],
-                voting_start_time=p.get("voting_start_time", ""),
-                voting_end_time=p.get("voting_end_time", ""),
-            )
-            for p in proposals
-        ]
+        data = self._get(f"{self._gov}/proposals", params)
+        proposals = data.get("proposals") or ()
+        if not proposals:
+            return []
 
+        return [_parse_proposal(p) for p in proposals]
+
+    @_ttl_cached(_proposal_ttl)
     def get_proposal(self, proposal_id: int) -> Proposal:
-        """Get single proposal details"""
-        data = self._api_get(f"cosmos/gov/v1beta1/proposals/{proposal_id}")
-        p = data["proposal"]
-
-        return Proposal(
-            proposal_id=int(p["proposal_id"]),
-            content=p.get("content", {}),
-            status=p["status"],
-            final_tally_result=p.get("final_tally_result", {}),
-            submit_time=p["submit_time"],
-            deposit_end_time=p["deposit_end_time"],
-            total_deposit=[
-                Coin(denom=c["denom"], amount=c["amount"])
-                for c in p.get("total_deposit", [])
-            ],
-            voting_start_time=p.get("voting_start_time", ""),
-            voting_end_time=p.get("voting_end_time", ""),
-        )
+        """Get single proposal details (cached once voting has concluded)"""
+        data = self._get(f"{self._gov}/proposals/{proposal_id}")
+        return _parse_proposal(data["proposal"])
 
     def get_proposal_votes(self, proposal_id: int) -> Dict[str, Any]:
         """Get votes for proposal"""
-        data = self._api_get(
-            f"cosmos/gov/v1beta1/proposals/{proposal_id}/votes",
+        data = self._get(
+            f"{self._gov}/proposals/{proposal_id}/votes",
             {"pagination.limit": "1000"},
         )
         return data
 
+    def iter_proposal_votes(self, proposal_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream votes for proposal without materializing the whole page"""
+        return self._stream_get(
+            f"{self._gov}/proposals/{proposal_id}/votes",
+            "votes.item",
+            {"pagination.limit": "1000"},
+        )
+
     def get_proposal_tally(self, proposal_id: int) -> Dict[str, str]:
         """Get current tally for proposal"""
-        data = self._api_get(f"cosmos/gov/v1beta1/proposals/{proposal_id}/tally")
+        data = self._get(f"{self._gov}/proposals/{proposal_id}/tally")
         return data.get("tally", {})
 
     # ==================== DISTRIBUTION MODULE ====================
@@ -437,41 +1127,37 @@ class CosmosSDKClient:
     ) -> List[Coin]:
         """Get delegation rewards"""
         if validator_address:
-            endpoint = f"cosmos/distribution/v1beta1/delegators/{delegator_address}/rewards/{validator_address}"
+            url = f"{self._distribution}/delegators/{delegator_address}/rewards/{validator_address}"
         else:
-            endpoint = (
-                f"cosmos/distribution/v1beta1/delegators/{delegator_address}/rewards"
-            )
+            url = f"{self._distribution}/delegators/{delegator_address}/rewards"
 
-        data = self._api_get(endpoint)
+        data = self._get(url)
 
         if validator_address:
             rewards = data.get("rewards", [])
         else:
             rewards = data.get("total", [])
 
-        return [Coin(denom=r["denom"], amount=r["amount"]) for r in rewards]
+        return _parse_coins(rewards)
 
     def get_validator_commission(self, validator_address: str) -> List[Coin]:
         """Get validator commission"""
-        data = self._api_get(
-            f"cosmos/distribution/v1beta1/validators/{validator_address}/commission"
+        data = self._get(
+            f"{self._distribution}/validators/{validator_address}/commission"
         )
         commission = data.get("commission", {}).get("commission", [])
-        return [Coin(denom=c["denom"], amount=c["amount"]) for c in commission]
+        return _parse_coins(commission)
 
     def get_community_pool(self) -> List[Coin]:
         """Get community pool balance"""
-        data = self._api_get("cosmos/distribution/v1beta1/community_pool")
-        pool = data.get("pool", [])
-        return [Coin(denom=p["denom"], amount=p["amount"]) for p in pool]
+        return self._get_coins(f"{self._distribution}/community_pool", "pool")
 
     # ==================== AURA CUSTOM MODULES ====================
 
     def get_did_document(self, did: str) -> Optional[DIDDocument]:
         """Query identity module for DID document"""
         try:
-            data = self._api_get(f"aura/identity/v1/dids/{did}")
+            data = self._get(f"{self._identity}/dids/{did}")
             doc = data.get("did_document", {})
 
             return DIDDocument(
@@ -483,13 +1169,13 @@ class CosmosSDKClient:
                 service=doc.get("service", []),
             )
         except Exception as e:
-            logger.error(f"Failed to get DID document: {e}")
+            logger.error("Failed to get DID document: %s", e)
             return None
 
     def get_verifiable_credentials(self, holder: str) -> List[VerifiableCredential]:
         """Query vcregistry module for credentials"""
         try:
-            data = self._api_get(f"aura/vcregistry/v1/credentials/holder/{holder}")
+            data = self._get(f"{self._vcregistry}/credentials/holder/{holder}")
             credentials = data.get("credentials", [])
 
             return [
@@ -506,13 +1192,13 @@ class CosmosSDKClient:
                 for vc in credentials
             ]
         except Exception as e:
-            logger.error(f"Failed to get VCs: {e}")
+            logger.error("Failed to get VCs: %s", e)
             return []
 
     def get_dex_pools(self) -> List[Pool]:
         """Query DEX module for liquidity pools"""
         try:
-            data = self._api_get("aura/dex/v1/pools")
+            data = self._get(f"{self._dex}/pools")
             pools = data.get("pools", [])
 
             return [
@@ -528,13 +1214,13 @@ class CosmosSDKClient:
                 for p in pools
             ]
         except Exception as e:
-            logger.error(f"Failed to get DEX pools: {e}")
+            logger.error("Failed to get DEX pools: %s", e)
             return []
 
     def get_dex_pool(self, pool_id: int) -> Optional[Pool]:
         """Query DEX module for single pool"""
         try:
-            data = self._api_get(f"aura/dex/v1/pools/{pool_id}")
+            data = self._get(f"{self._dex}/pools/{pool_id}")
             p = data.get("pool", {})
 
             return Pool(
@@ -547,13 +1233,13 @@ class CosmosSDKClient:
                 swap_fee=p.get("swap_fee", "0"),
             )
         except Exception as e:
-            logger.error(f"Failed to get DEX pool: {e}")
+            logger.error("Failed to get DEX pool: %s", e)
             return None
 
     def get_bridge_state(self) -> Optional[BridgeState]:
         """Query bridge module state"""
         try:
-            data = self._api_get("aura/bridge/v1/state")
+            data = self._get(f"{self._bridge}/state")
             state = data.get("state", {})
 
             return BridgeState(
@@ -563,7 +1249,7 @@ class CosmosSDKClient:
                 active_transfers=int(state.get("active_transfers", 0)),
             )
         except Exception as e:
-            logger.error(f"Failed to get bridge state: {e}")
+            logger.error("Failed to get bridge state: %s", e)
             return None
 
     def get_bridge_transfers(
@@ -580,30 +1266,29 @@ class CosmosSDKClient:
             if status:
                 params["status"] = status
 
-            data = self._api_get("aura/bridge/v1/transfers", params)
+            data = self._get(f"{self._bridge}/transfers", params)
             return data.get("transfers", [])
         except Exception as e:
-            logger.error(f"Failed to get bridge transfers: {e}")
+            logger.error("Failed to get bridge transfers: %s", e)
             return []
 
     def get_contracts(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Query WASM module for deployed contracts"""
         try:
-            data = self._api_get(
-                "cosmwasm/wasm/v1/code", {"pagination.limit": str(limit)}
-            )
+            data = self._get(f"{self._wasm}/code", {"pagination.limit": str(limit)})
             return data.get("code_infos", [])
         except Exception as e:
-            logger.error(f"Failed to get contracts: {e}")
+            logger.error("Failed to get contracts: %s", e)
             return []
 
+    @_ttl_cached(CONTRACT_INFO_TTL)
     def get_contract_info(self, contract_address: str) -> Optional[Dict[str, Any]]:
         """Query contract info"""
         try:
-            data = self._api_get(f"cosmwasm/wasm/v1/contract/{contract_address}")
+            data = self._get(f"{self._wasm}/contract/{contract_address}")
             return data.get("contract_info", {})
         except Exception as e:
-            logger.error(f"Failed to get contract info: {e}")
+            logger.error("Failed to get contract info: %s", e)
             return None
 
     def query_contract(
@@ -611,13 +1296,233 @@ class CosmosSDKClient:
     ) -> Optional[Dict[str, Any]]:
         """Execute smart contract query"""
         try:
-            import base64
-
-            query_data = base64.b64encode(json.dumps(query_msg).encode()).decode()
-            data = self._api_get(
-                f"cosmwasm/wasm/v1/contract/{contract_address}/smart/{query_data}"
+            # URL-safe alphabet: the payload is a path segment, where the
+            # standard alphabet's "/" and "+" would be misread
+            query_data = base64.urlsafe_b64encode(_dumps(query_msg)).decode()
+            data = self._get(
+                f"{self._wasm}/contract/{contract_address}/smart/{query_data}"
             )
             return data.get("data", {})
         except Exception as e:
-            logger.error(f"Failed to query contract: {e}")
+            logger.error("Failed to query contract: %s", e)
             return None
+
+
+# ==================== ASYNC COSMOS SDK CLIENT ====================
+
+
+class AsyncCosmosSDKClient(_RoutePrefixes):
+    """
+    Asynchronous Cosmos SDK query client for Aura blockchain
+
+    Issues requests over a pooled aiohttp session so independent queries
+    (e.g. pool, supply and proposals for one dashboard) overlap instead of
+    paying their round trips one after another. Use as an async context
+    manager or call close() when done.
+    """
+
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    BACKOFF_FACTOR = 0.5
+
+    def __init__(
+        self,
+        rpc_url: str,
+        api_url: str,
+        timeout: int = 10,
+        retry_count: int = 3,
+        max_concurrency: int = 64,
+        limit_per_host: int = 64,
+    ):
+        """
+        Initialize async Cosmos SDK client
+
+        Args:
+            rpc_url: Tendermint RPC endpoint (e.g., http://localhost:26657)
+            api_url: Cosmos SDK REST API endpoint (e.g., http://localhost:1317)
+            timeout: Request timeout in seconds
+            retry_count: Number of retries for failed requests
+            max_concurrency: Max requests in flight across all hosts
+            limit_per_host: Max pooled connections per host
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncCosmosSDKClient requires aiohttp")
+
+        self.rpc_url = rpc_url.rstrip("/")
+        self.api_url = api_url.rstrip("/")
+        self._init_routes(self.api_url)
+        self.timeout = timeout
+        self.retry_count = retry_count
+        self.limit_per_host = limit_per_host
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight = AsyncSingleFlight()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> AsyncCosmosSDKClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session on first use (needs a running loop)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host, keepalive_timeout=75
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying connection pool"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make GET request, sharing one round trip among identical callers"""
+        return await self._inflight.do(
+            _flight_key(url, params), self._fetch, url, params
+        )
+
+    async def _fetch(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make GET request, retrying 5xx and connection errors with backoff"""
+        session = self._get_session()
+        attempt = 0
+        async with self._semaphore:
+            while True:
+                try:
+                    async with session.get(url, params=params) as response:
+                        if (
+                            response.status not in self.RETRY_STATUSES
+                            or attempt >= self.retry_count
+                        ):
+                            response.raise_for_status()
+                            return _loads(await response.read())
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt >= self.retry_count:
+                        logger.error("Request failed: %s - %s", url, e)
+                        raise
+                except aiohttp.ClientError as e:
+                    logger.error("Request failed: %s - %s", url, e)
+                    raise
+                except ValueError as e:
+                    logger.error("Invalid JSON response: %s - %s", url, e)
+                    raise
+
+                await asyncio.sleep(self.BACKOFF_FACTOR * 2**attempt)
+                attempt += 1
+
+    async def _rpc_get(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Query Tendermint RPC"""
+        return await self._get(f"{self.rpc_url}/{endpoint}", params)
+
+    async def _api_get(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Query Cosmos SDK REST API"""
+        return await self._get(f"{self.api_url}/{endpoint}", params)
+
+    # ==================== TENDERMINT RPC ====================
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Get node status"""
+        return await self._rpc_get("status")
+
+    async def get_block(self, height: Optional[int] = None) -> Dict[str, Any]:
+        """Get block at height (latest if None)"""
+        params = {"height": str(height)} if height else None
+        return await self._rpc_get("block", params)
+
+    async def get_validators(self, height: Optional[int] = None) -> Dict[str, Any]:
+        """Get validator set at height"""
+        params = {"height": str(height)} if height else None
+        return await self._rpc_get("validators", params)
+
+    # ==================== BANK MODULE ====================
+
+    async def get_balances(self, address: str) -> List[Coin]:
+        """Get all token balances for address"""
+        data = await self._get(f"{self._bank}/balances/{address}")
+        return _parse_coins(data.get("balances", []))
+
+    async def get_total_supply(self) -> List[Coin]:
+        """Get total supply of all denominations"""
+        data = await self._get(f"{self._bank}/supply")
+        return _parse_coins(data.get("supply", []))
+
+    # ==================== STAKING MODULE ====================
+
+    async def get_staking_validators(
+        self, status: Optional[BondStatus | str] = None, pagination_limit: int = 100
+    ) -> List[Validator]:
+        """Get validator set with optional status filter"""
+        params = {"pagination.limit": str(pagination_limit)}
+        if status:
+            params["status"] = BondStatus(status).value
+
+        data = await self._get(f"{self._staking}/validators", params)
+        return [_parse_validator(v) for v in data.get("validators", [])]
+
+    async def get_validator(self, validator_address: str) -> Validator:
+        """Get single validator details"""
+        data = await self._get(f"{self._staking}/validators/{validator_address}")
+        return _parse_validator(data["validator"])
+
+    async def get_delegations(self, delegator_address: str) -> List[Delegation]:
+        """Get all delegations for address"""
+        data = await self._get(f"{self._staking}/delegations/{delegator_address}")
+        return [_parse_delegation(d) for d in data.get("delegation_responses", [])]
+
+    async def get_validator_delegations(
+        self, validator_address: str
+    ) -> List[Delegation]:
+        """Get all delegations to a validator"""
+        data = await self._get(
+            f"{self._staking}/validators/{validator_address}/delegations"
+        )
+        return [_parse_delegation(d) for d in data.get("delegation_responses", [])]
+
+    async def get_staking_pool(self) -> Dict[str, str]:
+        """Get staking pool totals"""
+        data = await self._get(f"{self._staking}/pool")
+        return data.get("pool", {})
+
+    async def get_staking_params(self) -> Dict[str, Any]:
+        """Get staking module parameters"""
+        data = await self._get(f"{self._staking}/params")
+        return data.get("params", {})
+
+    # ==================== GOVERNANCE MODULE ====================
+
+    async def get_proposals(
+        self, status: Optional[ProposalStatus | str] = None
+    ) -> List[Proposal]:
+        """Get governance proposals with optional status filter"""
+        params = {"pagination.limit": "100"}
+        if status:
+            params["proposal_status"] = ProposalStatus(status).value
+
+        data = await self._get(f"{self._gov}/proposals", params)
+        return [_parse_proposal(p) for p in data.get("proposals", [])]
+
+    async def get_proposal(self, proposal_id: int) -> Proposal:
+        """Get single proposal details"""
+        data = await self._get(f"{self._gov}/proposals/{proposal_id}")
+        return _parse_proposal(data["proposal"])
+
+    async def get_proposal_tally(self, proposal_id: int) -> Dict[str, str]:
+        """Get current tally for proposal"""
+        data = await self._get(f"{self._gov}/proposals/{proposal_id}/tally")
+        return data.get("tally", {})
+
+    # ==================== DISTRIBUTION MODULE ====================
+
+    async def get_community_pool(self) -> List[Coin]:
+        """Get community pool balance"""
+        data = await self._get(f"{self._distribution}/community_pool")
+        return _parse_coins(data.get("pool", []))
@@ -5,24 +5,50 @@ Advanced analytics, search, and real-time capabilities for AURA blockchain
 
 from __future__ import annotations
 
+import atexit
+import heapq
+import itertools
 import json
 import logging
 import os
+import queue
+import re
 import sqlite3
 import threading
 import time
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Set
 from dataclasses import dataclass, field, asdict
 from enum import Enum
+from functools import lru_cache, wraps
+from operator import itemgetter
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from flask_sock import Sock
 from flasgger import Swagger
 
+from cache import MemoryCache, SingleFlight
+
+# orjson parses response bytes directly and (de)serializes several times
+# faster than json, which remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson walks large list responses incrementally; without it they are
+# parsed whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Import AURA configuration
 try:
     from config import config
@@ -71,7 +97,7 @@ class SearchType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Search result data"""
 
@@ -81,7 +107,7 @@ class SearchResult:
     timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressLabel:
     """Address labeling system"""
 
@@ -92,7 +118,7 @@ class AddressLabel:
     created_at: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedMetric:
     """Cached metric data"""
 
@@ -103,21 +129,149 @@ class CachedMetric:
 
 # ==================== DATABASE MANAGEMENT ====================
 
+# Kept as constants so every queued row of a kind shares one SQL string,
+# letting the writer batch them through executemany()
+_INSERT_SEARCH_SQL = (
+    "INSERT INTO search_history (query, search_type, user_id, timestamp, result_found)"
+    " VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_METRIC_SQL = (
+    "INSERT INTO analytics (metric_type, timestamp, value, data) VALUES (?, ?, ?, ?)"
+)
+# Updates existing keys in place rather than INSERT OR REPLACE's
+# delete + reinsert, which also rewrote both indexes
+_UPSERT_CACHE_SQL = (
+    "INSERT INTO explorer_cache (key, value, ttl) VALUES (?, ?, ?)"
+    " ON CONFLICT(key) DO UPDATE SET value = excluded.value, ttl = excluded.ttl"
+)
+_PURGE_CACHE_SQL = "DELETE FROM explorer_cache WHERE ttl < ?"
+_UPSERT_STALE_SQL = (
+    "INSERT INTO explorer_stale_cache (key, value, ttl) VALUES (?, ?, ?)"
+    " ON CONFLICT(key) DO UPDATE SET value = excluded.value, ttl = excluded.ttl"
+)
+_PURGE_STALE_SQL = "DELETE FROM explorer_stale_cache WHERE ttl < ?"
+# Read statements are shared constants so every call hands sqlite3 the
+# same text and reuses the prepared statement from its per-connection cache
+_RECENT_SEARCHES_SQL = (
+    "SELECT query, search_type, timestamp FROM search_history"
+    " ORDER BY timestamp DESC LIMIT ?"
+)
+# A half-open range on idx_search_query is an indexed, case-sensitive
+# startswith() with no LIKE wildcards to escape
+_SEARCH_SUGGESTIONS_SQL = (
+    "SELECT query FROM search_history WHERE query >= ? AND query < ?"
+    " GROUP BY query ORDER BY MAX(timestamp) DESC LIMIT ?"
+)
+_ADDRESS_LABEL_SQL = (
+    "SELECT address, label, category, description, created_at"
+    " FROM address_labels WHERE address = ?"
+)
+_ADDRESS_LABELS_SQL = (
+    "SELECT address, label, category, description, created_at"
+    " FROM address_labels WHERE address IN"
+)
+_METRICS_SQL = (
+    "SELECT timestamp, value, data FROM analytics"
+    " WHERE metric_type = ? AND timestamp > ? ORDER BY timestamp ASC"
+)
+_GET_CACHE_SQL = "SELECT value, ttl FROM explorer_cache WHERE key = ? AND ttl > ?"
+_GET_STALE_SQL = "SELECT value FROM explorer_stale_cache WHERE key = ? AND ttl > ?"
+
 
 class ExplorerDatabase:
-    """SQLite database for explorer data with indexing"""
+    """SQLite database for explorer data with indexing
+
+    High-frequency writes (searches, metrics, cache entries) are queued and
+    committed in batches by a background thread instead of one fsync per
+    insert. Reads flush the queue first, so callers still see their writes.
+
+    Writes go through the shared ``conn`` under ``lock``; reads check out a
+    connection from a small pool and never take the lock.
+    """
+
+    # Seconds between background commits
+    COMMIT_INTERVAL = 0.05
+    # Queued rows that trigger an early commit
+    COMMIT_BATCH = 500
+    # Seconds between sweeps of expired explorer_cache rows
+    CACHE_SWEEP_INTERVAL = 60
+    # Entries kept in the in-process front of explorer_cache
+    MEMORY_CACHE_SIZE = 4096
+    # Idle read connections kept open between reads
+    READ_POOL_SIZE = 8
+
+    _memory_ids = itertools.count()
 
     def __init__(self, db_path: str = ":memory:"):
         """Initialize database"""
         self.db_path = db_path
+        # Pooled read connections need a named in-memory database to share
+        self._memory = db_path == ":memory:"
+        if self._memory:
+            self._target = (
+                f"file:explorer-{next(self._memory_ids)}?mode=memory&cache=shared"
+            )
+        else:
+            self._target = db_path
         self.conn: Optional[sqlite3.Connection] = None
         self.lock = threading.RLock()
+        # Request threads are short-lived, so read connections are pooled
+        # rather than per thread
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(
+            maxsize=self.READ_POOL_SIZE
+        )
+        # Warm get_cache hits are served from here without touching SQLite
+        self._mem_cache = MemoryCache(max_size=self.MEMORY_CACHE_SIZE)
+        self._write_queue: queue.Queue[Tuple[str, Tuple[Any, ...]]] = queue.Queue()
+        # Writes queued but not yet committed, including a batch the writer
+        # thread has dequeued and is still committing
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
         self._init_database()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="explorer-db-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self, **kwargs: Any) -> sqlite3.Connection:
+        """Open a connection to the database with the explorer pragmas"""
+        conn = sqlite3.connect(
+            self._target, uri=self._memory, check_same_thread=False, **kwargs
+        )
+        # WAL lets readers proceed while a batch commits; NORMAL only
+        # fsyncs at checkpoints, which is safe in WAL mode
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        if self._memory:
+            # Shared-cache readers would otherwise hit table locks
+            conn.execute("PRAGMA read_uncommitted=1")
+        return conn
+
+    def _read(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        """Run a query on a pooled read connection and return every row"""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect(isolation_level=None)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
 
     def _init_database(self) -> None:
         """Initialize database schema"""
         try:
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # Schema setup runs once on the shared connection, before any
+            # read connection exists
+            self.conn = self._connect()
             cursor = self.conn.cursor()
 
             # Search history table
@@ -136,8 +290,10 @@ class ExplorerDatabase:
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_search_query ON search_history(query)"
             )
+            # Serves get_recent_searches' ORDER BY timestamp DESC LIMIT
+            cursor.execute("DROP INDEX IF EXISTS idx_search_timestamp")
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_search_timestamp ON search_history(timestamp)"
+                "CREATE INDEX IF NOT EXISTS idx_search_ts_desc ON search_history(timestamp DESC)"
             )
 
             # Address labels table
@@ -168,11 +324,12 @@ class ExplorerDatabase:
                 )
             """
             )
+            # get_metrics filters on both columns; the single-column indexes
+            # this replaces are prefixes of it or unused
+            cursor.execute("DROP INDEX IF EXISTS idx_metric_type")
+            cursor.execute("DROP INDEX IF EXISTS idx_metric_timestamp")
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_metric_type ON analytics(metric_type)"
-            )
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_metric_timestamp ON analytics(timestamp)"
+                "CREATE INDEX IF NOT EXISTS idx_metric_type_ts ON analytics(metric_type, timestamp DESC)"
             )
 
             # Block explorer cache
@@ -185,6 +342,24 @@ class ExplorerDatabase:
                 )
             """
             )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_ttl ON explorer_cache(ttl)"
+            )
+
+            # Last good copy of cached responses, served when upstream fails
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS explorer_stale_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    ttl REAL NOT NULL
+                )
+            """
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_stale_cache_ttl"
+                " ON explorer_stale_cache(ttl)"
+            )
 
             self.conn.commit()
             logger.info("Database initialized successfully")
@@ -192,6 +367,91 @@ class ExplorerDatabase:
             logger.error(f"Database initialization error: {e}")
             raise
 
+    def _enqueue_write(self, sql: str, params: Tuple[Any, ...]) -> None:
+        """Queue a write for the next batched commit"""
+        with self._pending_lock:
+            self._pending += 1
+        self._write_queue.put((sql, params))
+        if self._write_queue.qsize() >= self.COMMIT_BATCH:
+            self._wake.set()
+
+    def _writer_loop(self) -> None:
+        """Commit queued writes every COMMIT_INTERVAL or COMMIT_BATCH rows"""
+        next_sweep = time.monotonic() + self.CACHE_SWEEP_INTERVAL
+        while not self._closed.is_set():
+            self._wake.wait(self.COMMIT_INTERVAL)
+            self._wake.clear()
+            if time.monotonic() >= next_sweep:
+                self.purge_expired_cache()
+                next_sweep = time.monotonic() + self.CACHE_SWEEP_INTERVAL
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit all queued writes in a single transaction
+
+        Returns once every write queued before the call is committed, even
+        if the writer thread had already dequeued it.
+        """
+        if not self._pending:
+            return
+        # Waits out a batch the writer thread is committing, if any
+        with self.lock:
+            batch = []
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            # Bucket rows by statement, keeping each bucket in queue order
+            buckets: Dict[str, List[Tuple[Any, ...]]] = defaultdict(list)
+            for sql, params in batch:
+                buckets[sql].append(params)
+            try:
+                cursor = self.conn.cursor()
+                if not self.conn.in_transaction:
+                    cursor.execute("BEGIN")
+                for sql, rows in buckets.items():
+                    self._apply_rows(cursor, sql, rows)
+                self.conn.commit()
+            except Exception as e:
+                logger.error(f"Error committing {len(batch)} queued writes: {e}")
+            finally:
+                with self._pending_lock:
+                    self._pending -= len(batch)
+
+    @staticmethod
+    def _apply_rows(
+        cursor: sqlite3.Cursor, sql: str, rows: List[Tuple[Any, ...]]
+    ) -> None:
+        """executemany() one bucket, isolating bad rows if it fails"""
+        cursor.execute("SAVEPOINT queued_rows")
+        try:
+            cursor.executemany(sql, rows)
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK TO queued_rows")
+            for params in rows:
+                try:
+                    cursor.execute(sql, params)
+                except sqlite3.Error as e:
+                    logger.error(f"Error applying queued write: {e}")
+        cursor.execute("RELEASE queued_rows")
+
+    def close(self) -> None:
+        """Stop the writer thread, commit pending writes and close"""
+        self._closed.set()
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self.lock:
+            self.conn.close()
+
     def add_search(
         self,
         query: str,
@@ -201,41 +461,37 @@ class ExplorerDatabase:
     ) -> None:
         """Record search query"""
         try:
-            with self.lock:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO search_history (query, search_type, user_id, timestamp, result_found)
-                    VALUES (?, ?, ?, ?, ?)
-                """,
-                    (query, search_type, user_id, time.time(), int(result_found)),
-                )
-                self.conn.commit()
+            self._enqueue_write(
+                _INSERT_SEARCH_SQL,
+                (query, search_type, user_id, time.time(), int(result_found)),
+            )
         except Exception as e:
             logger.error(f"Error recording search: {e}")
 
     def get_recent_searches(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent searches"""
         try:
-            with self.lock:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT query, search_type, timestamp
-                    FROM search_history
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """,
-                    (limit,),
-                )
-                return [
-                    {"query": row[0], "type": row[1], "timestamp": row[2]}
-                    for row in cursor.fetchall()
-                ]
+            self.flush()
+            return [
+                {"query": row[0], "type": row[1], "timestamp": row[2]}
+                for row in self._read(_RECENT_SEARCHES_SQL, (limit,))
+            ]
         except Exception as e:
             logger.error(f"Error fetching recent searches: {e}")
             return []
 
+    def get_search_suggestions(self, prefix: str, limit: int = 10) -> List[str]:
+        """Get distinct past queries starting with prefix, most recent first"""
+        try:
+            self.flush()
+            rows = self._read(
+                _SEARCH_SUGGESTIONS_SQL, (prefix, prefix + "\U0010ffff", limit)
+            )
+            return [row[0] for row in rows]
+        except Exception as e:
+            logger.error(f"Error fetching search suggestions: {e}")
+            return []
+
     def add_address_label(self, label: AddressLabel) -> None:
         """Add address label"""
         try:
@@ -261,118 +517,279 @@ class ExplorerDatabase:
     def get_address_label(self, address: str) -> Optional[AddressLabel]:
         """Get address label"""
         try:
-            with self.lock:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT address, label, category, description, created_at
-                    FROM address_labels
-                    WHERE address = ?
-                """,
-                    (address,),
-                )
-                row = cursor.fetchone()
-                if row:
-                    return AddressLabel(*row)
+            rows = self._read(_ADDRESS_LABEL_SQL, (address,))
+            if rows:
+                return AddressLabel(*rows[0])
         except Exception as e:
             logger.error(f"Error fetching label: {e}")
         return None
 
+    def get_address_labels(self, addresses: List[str]) -> Dict[str, AddressLabel]:
+        """Get labels for many addresses in one query, keyed by address"""
+        labels: Dict[str, AddressLabel] = {}
+        try:
+            # Stay under SQLite's default bound-parameter limit
+            for start in range(0, len(addresses), 900):
+                chunk = addresses[start : start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._read(f"{_ADDRESS_LABELS_SQL} ({placeholders})", chunk):
+                    labels[row[0]] = AddressLabel(*row)
+        except Exception as e:
+            logger.error(f"Error fetching labels: {e}")
+        return labels
+
     def record_metric(
         self, metric_type: str, value: float, data: Optional[Dict] = None
     ) -> None:
         """Record analytics metric"""
         try:
-            with self.lock:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO analytics (metric_type, timestamp, value, data)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (
-                        metric_type,
-                        time.time(),
-                        value,
-                        json.dumps(data) if data else None,
-                    ),
-                )
-                self.conn.commit()
+            self._enqueue_write(
+                _INSERT_METRIC_SQL,
+                (
+                    metric_type,
+                    time.time(),
+                    value,
+                    json.dumps(data) if data else None,
+                ),
+            )
         except Exception as e:
             logger.error(f"Error recording metric: {e}")
 
     def get_metrics(self, metric_type: str, hours: int = 24) -> List[Dict[str, Any]]:
         """Get metrics for time period"""
         try:
-            with self.lock:
-                cursor = self.conn.cursor()
-                cutoff_time = time.time() - (hours * 3600)
-                cursor.execute(
-                    """
-                    SELECT timestamp, value, data
-                    FROM analytics
-                    WHERE metric_type = ? AND timestamp > ?
-                    ORDER BY timestamp ASC
-                """,
-                    (metric_type, cutoff_time),
-                )
-                return [
-                    {
-                        "timestamp": row[0],
-                        "value": row[1],
-                        "data": json.loads(row[2]) if row[2] else None,
-                    }
-                    for row in cursor.fetchall()
-                ]
+            self.flush()
+            cutoff_time = time.time() - (hours * 3600)
+            rows = self._read(_METRICS_SQL, (metric_type, cutoff_time))
+            return [
+                {
+                    "timestamp": row[0],
+                    "value": row[1],
+                    "data": json.loads(row[2]) if row[2] else None,
+                }
+                for row in rows
+            ]
         except Exception as e:
             logger.error(f"Error fetching metrics: {e}")
             return []
 
-    def set_cache(self, key: str, value: str, ttl: int = 300) -> None:
-        """Set cache value"""
+    def set_cache(
+        self, key: str, value: str, ttl: int = 300, stale_ttl: int = 0
+    ) -> None:
+        """Set cache value (memory first, SQLite write-through)
+
+        With stale_ttl, a copy is also kept for get_stale_cache until that
+        many seconds have passed.
+        """
         try:
-            with self.lock:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO explorer_cache (key, value, ttl)
-                    VALUES (?, ?, ?)
-                """,
-                    (key, value, time.time() + ttl),
-                )
-                self.conn.commit()
+            self._mem_cache.set(key, value, ttl)
+            now = time.time()
+            self._enqueue_write(_UPSERT_CACHE_SQL, (key, value, now + ttl))
+            if stale_ttl > 0:
+                self._enqueue_write(_UPSERT_STALE_SQL, (key, value, now + stale_ttl))
         except Exception as e:
             logger.error(f"Error setting cache: {e}")
 
+    def purge_expired_cache(self) -> None:
+        """Queue deletion of expired cache rows"""
+        now = time.time()
+        self._enqueue_write(_PURGE_CACHE_SQL, (now,))
+        self._enqueue_write(_PURGE_STALE_SQL, (now,))
+
+    def get_stale_cache(self, key: str) -> Optional[str]:
+        """Get the last value stored with a stale_ttl, even if no longer fresh"""
+        try:
+            self.flush()
+            rows = self._read(_GET_STALE_SQL, (key, time.time()))
+            return rows[0][0] if rows else None
+        except Exception as e:
+            logger.error(f"Error getting stale cache: {e}")
+        return None
+
     def get_cache(self, key: str) -> Optional[str]:
-        """Get cache value"""
+        """Get cache value (memory, then SQLite)"""
+        value = self._mem_cache.get(key)
+        if value is not None:
+            return value
         try:
-            with self.lock:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT value FROM explorer_cache
-                    WHERE key = ? AND ttl > ?
-                """,
-                    (key, time.time()),
-                )
-                row = cursor.fetchone()
-                return row[0] if row else None
+            self.flush()
+            now = time.time()
+            rows = self._read(_GET_CACHE_SQL, (key, now))
+            if rows:
+                value, ttl = rows[0]
+                self._mem_cache.set(key, value, ttl - now)
+                return value
+            return None
         except Exception as e:
             logger.error(f"Error getting cache: {e}")
         return None
 
 
+# ==================== HTTP ====================
+
+
+def _pooled_session() -> requests.Session:
+    """Create a keep-alive session with a connection pool sized for the node"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def _loads(data: str | bytes) -> Any:
+    """Parse a JSON response body or cached document"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to a JSON string for the cache"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+# (min, max) cache lifetime in seconds per family of cache keys. Chain
+# parameters change only through governance; blocks and transactions move
+# every few seconds.
+CACHE_TTL: Dict[str, Tuple[int, int]] = {
+    "gov_params": (3600, 3600),
+    "staking_params": (3600, 3600),
+    "staking_pool": (120, 300),
+    "proposals": (30, 120),
+    "proposal": (30, 120),
+    "votes": (30, 120),
+    "validators": (30, 60),
+    "delegations": (30, 60),
+    "unbonding": (30, 60),
+    "rewards": (30, 60),
+    "core_stats": (10, 30),
+    "blocks": (5, 15),
+    "txs": (5, 15),
+}
+
+
+# Stale copies outlive the fresh entry by this factor
+STALE_TTL_FACTOR = 60
+
+
+def _cache_ttl(kind: str, started: float) -> int:
+    """Cache lifetime for a response, longer when it was slow to build
+
+    Args:
+        kind: CACHE_TTL family of the cache key
+        started: time.monotonic() when the upstream fetch began
+    """
+    low, high = CACHE_TTL[kind]
+    return min(high, low + int((time.monotonic() - started) * 10))
+
+
+def _cache_response(
+    db: ExplorerDatabase, cache_key: str, kind: str, started: float, result: Any
+) -> None:
+    """Cache a service response, keeping a stale copy for upstream outages"""
+    ttl = _cache_ttl(kind, started)
+    db.set_cache(cache_key, _dumps(result), ttl=ttl, stale_ttl=ttl * STALE_TTL_FACTOR)
+
+
+def _stale_response(db: ExplorerDatabase, cache_key: str) -> Optional[Dict[str, Any]]:
+    """Last cached response for cache_key, marked stale, if one is kept"""
+    stale = db.get_stale_cache(cache_key)
+    if stale is None:
+        return None
+    result = _loads(stale)
+    result["stale"] = True
+    return result
+
+
+def _iter_items(response: requests.Response, item_path: str) -> Iterator[Any]:
+    """Yield the items of a JSON array in a streamed response body
+
+    Args:
+        response: Response fetched with stream=True
+        item_path: ijson prefix of the array items, e.g. "result.block_metas.item"
+    """
+    if ijson is not None:
+        # Let urllib3 undo gzip/deflate before ijson reads the stream
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, item_path, use_float=True)
+        return
+
+    items = _loads(response.content)
+    for key in item_path.split(".")[:-1]:
+        items = items.get(key) if isinstance(items, dict) else None
+    if isinstance(items, list):
+        yield from items
+
+
 # ==================== ANALYTICS ENGINE ====================
 
 
+def _sum_positive_deltas(values: List[float]) -> Tuple[float, int]:
+    """Sum and count the positive steps between consecutive values"""
+    total = 0.0
+    count = 0
+    for prev, cur in itertools.pairwise(values):
+        delta = cur - prev
+        if delta > 0:
+            total += delta
+            count += 1
+    return total, count
+
+
+@lru_cache(maxsize=4096)
+def _rfc3339_timestamp(value: str) -> float:
+    """Convert a node RFC 3339 time to a unix timestamp
+
+    fromisoformat() handles "Z" and nanosecond fractions natively on 3.11+.
+    Analytics refetch the same recent blocks on every call, so repeated
+    timestamps are served from the cache.
+    """
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _coalesced(method):
+    """Share one in-flight call among concurrent callers with equal arguments
+
+    Requests that miss the cache together would otherwise each hit the
+    node; the first caller fetches and the rest wait for its result. The
+    instance provides the SingleFlight as self._inflight.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = f"{method.__name__}:{args}:{sorted(kwargs.items())}"
+        return self._inflight.do(key, method, self, *args, **kwargs)
+
+    return wrapper
+
+
 class AnalyticsEngine:
-    """Real-time analytics and metrics collection"""
+    """Real-time analytics and metrics collection
+
+    Public metric getters are coalesced: concurrent requests for the same
+    metric wait on the first one's node queries instead of repeating them.
+    """
+
+    # Threads overlapping independent node queries
+    FETCH_WORKERS = 16
 
     def __init__(self, node_url: str, db: ExplorerDatabase):
         """Initialize analytics engine"""
         self.node_url = node_url
         self.db = db
+        self.http = _pooled_session()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.FETCH_WORKERS, thread_name_prefix="analytics"
+        )
+        self._inflight = SingleFlight()
         self.metrics_cache: Dict[str, CachedMetric] = {}
         self.lock = threading.RLock()
 
@@ -384,12 +801,28 @@ class AnalyticsEngine:
         self.active_addresses: Set[str] = set()
         self.mempool_sizes: deque = deque(maxlen=1440)
 
+    @_coalesced
+    def get_dashboard(self) -> Dict[str, Any]:
+        """Compute every dashboard metric, overlapping their node queries"""
+        futures = {
+            "hashrate": self._pool.submit(self.get_network_hashrate),
+            "transaction_volume": self._pool.submit(self.get_transaction_volume),
+            "active_addresses": self._pool.submit(self.get_active_addresses),
+            "average_block_time": self._pool.submit(self.get_average_block_time),
+            "mempool": self._pool.submit(self.get_mempool_size),
+            "difficulty": self._pool.submit(self.get_network_difficulty),
+        }
+        dashboard = {name: future.result() for name, future in futures.items()}
+        dashboard["timestamp"] = time.time()
+        return dashboard
+
+    @_coalesced
     def get_network_hashrate(self) -> Dict[str, Any]:
         """Calculate network hashrate"""
         cache_key = "hashrate"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
 
         try:
             stats = self._fetch_stats()
@@ -411,19 +844,20 @@ class AnalyticsEngine:
                 "timestamp": time.time(),
             }
 
-            self.db.set_cache(cache_key, json.dumps(result))
+            self.db.set_cache(cache_key, _dumps(result))
             self.db.record_metric("hashrate", estimated_hashrate)
             return result
         except Exception as e:
             logger.error(f"Error calculating hashrate: {e}")
             return {"error": str(e)}
 
+    @_coalesced
     def get_transaction_volume(self, period: str = "24h") -> Dict[str, Any]:
         """Get transaction volume metrics"""
         cache_key = f"tx_volume_{period}"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
 
         try:
             hours_map = {"24h": 24, "7d": 168, "30d": 720}
@@ -459,19 +893,20 @@ class AnalyticsEngine:
                 "timestamp": time.time(),
             }
 
-            self.db.set_cache(cache_key, json.dumps(result))
+            self.db.set_cache(cache_key, _dumps(result))
             self.db.record_metric(f"tx_volume_{period}", tx_count, result)
             return result
         except Exception as e:
             logger.error(f"Error calculating transaction volume: {e}")
             return {"error": str(e)}
 
+    @_coalesced
     def get_active_addresses(self) -> Dict[str, Any]:
         """Get count of active addresses"""
         cache_key = "active_addresses"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
 
         try:
             blocks_data = self._fetch_blocks()
@@ -493,66 +928,63 @@ class AnalyticsEngine:
                 "timestamp": time.time(),
             }
 
-            self.db.set_cache(cache_key, json.dumps(result))
+            self.db.set_cache(cache_key, _dumps(result))
             self.db.record_metric("active_addresses", len(addresses))
             return result
         except Exception as e:
             logger.error(f"Error calculating active addresses: {e}")
             return {"error": str(e)}
 
+    @_coalesced
     def get_average_block_time(self) -> Dict[str, Any]:
         """Calculate average block time"""
         cache_key = "avg_block_time"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
 
         try:
             blocks_data = self._fetch_blocks()
             if not blocks_data:
                 return {"error": "Unable to fetch blocks"}
 
-            blocks = sorted(
-                blocks_data.get("blocks", []), key=lambda b: b.get("timestamp", 0)
+            # _fetch_blocks always sets a timestamp; sorting the bare floats
+            # avoids a Python key call per block
+            timestamps = sorted(
+                map(itemgetter("timestamp"), blocks_data.get("blocks", []))
             )
 
-            if len(blocks) < 2:
+            if len(timestamps) < 2:
                 return {"error": "Insufficient blocks for calculation"}
 
-            block_times = []
-            for i in range(1, len(blocks)):
-                time_diff = blocks[i].get("timestamp", 0) - blocks[i - 1].get(
-                    "timestamp", 0
-                )
-                if time_diff > 0:
-                    block_times.append(time_diff)
-
-            avg_block_time = sum(block_times) / len(block_times) if block_times else 0
+            total, sampled = _sum_positive_deltas(timestamps)
+            avg_block_time = total / sampled if sampled else 0
 
             result = {
                 "average_block_time_seconds": avg_block_time,
-                "blocks_sampled": len(block_times),
+                "blocks_sampled": sampled,
                 "timestamp": time.time(),
             }
 
-            self.db.set_cache(cache_key, json.dumps(result))
+            self.db.set_cache(cache_key, _dumps(result))
             self.db.record_metric("avg_block_time", avg_block_time)
             return result
         except Exception as e:
             logger.error(f"Error calculating average block time: {e}")
             return {"error": str(e)}
 
+    @_coalesced
     def get_mempool_size(self) -> Dict[str, Any]:
         """Get pending transactions (mempool) size"""
         cache_key = "mempool_size"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
 
         try:
-            response = requests.get(f"{self.node_url}/transactions", timeout=15)
+            response = self.http.get(f"{self.node_url}/transactions", timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             pending_count = data.get("count", 0)
             transactions = data.get("transactions", [])
@@ -571,13 +1003,14 @@ class AnalyticsEngine:
                 "timestamp": time.time(),
             }
 
-            self.db.set_cache(cache_key, json.dumps(result))
+            self.db.set_cache(cache_key, _dumps(result))
             self.db.record_metric("mempool_size", pending_count, result)
             return result
         except Exception as e:
             logger.error(f"Error getting mempool size: {e}")
             return {"error": str(e)}
 
+    @_coalesced
     def get_network_difficulty(self) -> Dict[str, Any]:
         """Get network difficulty trend"""
         try:
@@ -599,9 +1032,9 @@ class AnalyticsEngine:
         """Fetch stats from Cosmos SDK node"""
         try:
             # Get blockchain info from Cosmos SDK RPC
-            response = requests.get(f"{self.node_url}/blockchain", timeout=15)
+            response = self.http.get(f"{self.node_url}/blockchain", timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             if data.get("result"):
                 last_height = data["result"].get("last_height", "0")
@@ -620,20 +1053,21 @@ class AnalyticsEngine:
         """Fetch blocks from Cosmos SDK node"""
         try:
             # Get latest blockchain info
-            blockchain_response = requests.get(
-                f"{self.node_url}/blockchain?minHeight=1&maxHeight={limit}", timeout=30
+            blockchain_response = self.http.get(
+                f"{self.node_url}/blockchain?minHeight=1&maxHeight={limit}",
+                timeout=30,
+                stream=True,
             )
             blockchain_response.raise_for_status()
-            data = blockchain_response.json()
 
+            # Only one block meta is materialized at a time
             blocks = []
-            if data.get("result") and data["result"].get("block_metas"):
-                for meta in data["result"]["block_metas"]:
-                    block_time = meta["header"]["time"]
+            with blockchain_response:
+                metas = _iter_items(blockchain_response, "result.block_metas.item")
+                for meta in metas:
                     # Parse ISO timestamp to unix timestamp
                     try:
-                        dt = datetime.fromisoformat(block_time.replace("Z", "+00:00"))
-                        timestamp = dt.timestamp()
+                        timestamp = _rfc3339_timestamp(meta["header"]["time"])
                     except Exception:
                         timestamp = time.time()
 
@@ -656,6 +1090,35 @@ class AnalyticsEngine:
 # ==================== SEARCH ENGINE ====================
 
 
+# Transaction and block hashes: exactly 64 hex characters
+_HEX64 = re.compile(r"[0-9a-fA-F]{64}")
+
+# BIP-173 bech32 alphabet and checksum generator
+_BECH32_VALUES = {c: i for i, c in enumerate("qpzry9x8gf2tvdw0s3jn54khce6mua7l")}
+_BECH32_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+@lru_cache(maxsize=4096)
+def _is_aura_address(query: str) -> bool:
+    """Check for a lowercase bech32 string with a valid checksum and 'aura' prefix"""
+    hrp, _, data = query.rpartition("1")
+    if hrp != "aura" or len(data) < 6:
+        return False
+    try:
+        values = [_BECH32_VALUES[c] for c in data]
+    except KeyError:
+        return False
+
+    checksum = 1
+    for value in [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp] + values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for i, generator in enumerate(_BECH32_GENERATOR):
+            if (top >> i) & 1:
+                checksum ^= generator
+    return checksum == 1
+
+
 class SearchEngine:
     """Advanced search with autocomplete and history"""
 
@@ -663,6 +1126,7 @@ class SearchEngine:
         """Initialize search engine"""
         self.node_url = node_url
         self.db = db
+        self.http = _pooled_session()
         self.recent_searches: deque = deque(maxlen=100)
 
     def search(self, query: str, user_id: str = "anonymous") -> Dict[str, Any]:
@@ -701,11 +1165,7 @@ class SearchEngine:
     def get_autocomplete_suggestions(self, prefix: str, limit: int = 10) -> List[str]:
         """Get autocomplete suggestions from recent searches"""
         try:
-            recent = self.db.get_recent_searches(limit * 2)
-            suggestions = [
-                item["query"] for item in recent if item["query"].startswith(prefix)
-            ]
-            return suggestions[:limit]
+            return self.db.get_search_suggestions(prefix, limit)
         except Exception as e:
             logger.error(f"Autocomplete error: {e}")
             return []
@@ -716,19 +1176,20 @@ class SearchEngine:
 
     def _identify_search_type(self, query: str) -> SearchType:
         """Identify search query type - AURA compatible"""
-        if query.isdigit():
+        # ASCII only: isdigit() alone accepts digits int() cannot parse
+        if query.isascii() and query.isdigit():
             return SearchType.BLOCK_HEIGHT
 
-        # AURA uses bech32 addresses starting with 'aura'
-        if query.startswith("aura") and len(query) > 10:
+        # AURA uses bech32 addresses starting with 'aura'; malformed ones
+        # are rejected here instead of by a node round-trip
+        if query.startswith("aura") and _is_aura_address(query):
             return SearchType.ADDRESS
 
-        # Cosmos SDK transaction hashes are uppercase hex strings
-        if len(query) == 64 and all(c in "0123456789abcdefABCDEF" for c in query):
-            return SearchType.TRANSACTION_ID
-
-        # Block hash format
         if len(query) == 64:
+            # Cosmos SDK transaction hashes are uppercase hex strings
+            if _HEX64.fullmatch(query):
+                return SearchType.TRANSACTION_ID
+            # Block hash format
             return SearchType.BLOCK_HASH
 
         return SearchType.UNKNOWN
@@ -737,11 +1198,11 @@ class SearchEngine:
         """Search by block height - Cosmos SDK RPC"""
         try:
             # Use Cosmos SDK RPC endpoint
-            response = requests.get(
+            response = self.http.get(
                 f"{self.node_url}/block?height={height}", timeout=15
             )
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data.get("result"):
                     block = data["result"]["block"]
                     return {
@@ -762,11 +1223,11 @@ class SearchEngine:
         """Search by block hash - Cosmos SDK RPC"""
         try:
             # Use Cosmos SDK RPC to get block by hash
-            response = requests.get(
+            response = self.http.get(
                 f"{self.node_url}/block_by_hash?hash=0x{block_hash}", timeout=15
             )
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data.get("result"):
                     block = data["result"]["block"]
                     return {
@@ -784,9 +1245,9 @@ class SearchEngine:
         """Search by transaction ID - Cosmos SDK RPC"""
         try:
             # Use Cosmos SDK RPC to get transaction
-            response = requests.get(f"{self.node_url}/tx?hash=0x{txid}", timeout=15)
+            response = self.http.get(f"{self.node_url}/tx?hash=0x{txid}", timeout=15)
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data.get("result"):
                     return data["result"]
         except Exception as e:
@@ -802,12 +1263,12 @@ class SearchEngine:
                 if hasattr(config, "NODE_API_URL")
                 else "http://localhost:1317"
             )
-            balance_response = requests.get(
+            balance_response = self.http.get(
                 f"{api_url}/cosmos/bank/v1beta1/balances/{address}", timeout=15
             )
 
             if balance_response.status_code == 200:
-                balance_data = balance_response.json()
+                balance_data = _loads(balance_response.content)
                 balances = balance_data.get("balances", [])
 
                 # Calculate total balance in uaura
@@ -833,10 +1294,17 @@ class SearchEngine:
 class RichListManager:
     """Manage top address holders"""
 
-    def __init__(self, node_url: str, db: ExplorerDatabase):
+    # denom_owners page size
+    PAGE_SIZE = 1000
+
+    def __init__(
+        self, node_url: str, db: ExplorerDatabase, api_url: Optional[str] = None
+    ):
         """Initialize rich list manager"""
         self.node_url = node_url
+        self.api_url = (api_url or config.NODE_API_URL).rstrip("/")
         self.db = db
+        self.http = _pooled_session()
         self.rich_list_cache: Optional[List[Dict[str, Any]]] = None
         self.cache_timestamp: float = 0
 
@@ -849,14 +1317,14 @@ class RichListManager:
         if not refresh:
             cached = self.db.get_cache(cache_key)
             if cached:
-                return json.loads(cached)
+                return _loads(cached)
 
         try:
             rich_list = self._calculate_rich_list(limit)
 
             if rich_list:
                 self.db.set_cache(
-                    cache_key, json.dumps(rich_list), ttl=600
+                    cache_key, _dumps(rich_list), ttl=600
                 )  # Cache for 10 minutes
                 self.db.record_metric("richlist_top_holder", rich_list[0]["balance"])
 
@@ -866,37 +1334,17 @@ class RichListManager:
             return []
 
     def _calculate_rich_list(self, limit: int) -> List[Dict[str, Any]]:
-        """Calculate rich list from blockchain"""
+        """Calculate rich list from the bank module's denom owners"""
         try:
-            blocks_response = requests.get(
-                f"{self.node_url}/blocks?limit=10000", timeout=30
-            )
-            blocks_response.raise_for_status()
-            blocks = blocks_response.json().get("blocks", [])
-
-            # Aggregate all transactions
-            address_balances: Dict[str, float] = defaultdict(float)
-
-            for block in blocks:
-                for tx in block.get("transactions", []):
-                    # Handle sender
-                    if tx.get("sender") and tx.get("sender") != "COINBASE":
-                        address_balances[tx["sender"]] -= float(tx.get("amount", 0))
-                        address_balances[tx["sender"]] -= float(tx.get("fee", 0))
-
-                    # Handle recipient
-                    if tx.get("recipient"):
-                        address_balances[tx["recipient"]] += float(tx.get("amount", 0))
+            owners = self._fetch_denom_owners()
+            total_supply = sum(balance for _, balance in owners)
 
-            # Sort by balance
-            sorted_addresses = sorted(
-                address_balances.items(), key=lambda x: x[1], reverse=True
-            )
-
-            # Build rich list with labels
+            # Build rich list with labels, looked up in a single query
             rich_list = []
-            for rank, (address, balance) in enumerate(sorted_addresses[:limit], 1):
-                label_data = self.db.get_address_label(address)
+            top = heapq.nlargest(limit, owners, key=itemgetter(1))
+            labels = self.db.get_address_labels([address for address, _ in top])
+            for rank, (address, balance) in enumerate(top, 1):
+                label_data = labels.get(address)
                 rich_list.append(
                     {
                         "rank": rank,
@@ -904,11 +1352,8 @@ class RichListManager:
                         "balance": balance,
                         "label": label_data.label if label_data else None,
                         "category": label_data.category if label_data else None,
-                        "percentage_of_supply": (
-                            balance / sum(dict(address_balances).values())
-                        )
-                        * 100
-                        if sum(address_balances.values()) > 0
+                        "percentage_of_supply": (balance / total_supply) * 100
+                        if total_supply > 0
                         else 0,
                     }
                 )
@@ -918,6 +1363,24 @@ class RichListManager:
             logger.error(f"Error calculating rich list: {e}")
             return []
 
+    def _fetch_denom_owners(self) -> List[Tuple[str, int]]:
+        """Page through every holder of the chain denom"""
+        url = f"{self.api_url}/cosmos/bank/v1beta1/denom_owners/{config.DENOM}"
+        params: Dict[str, Any] = {"pagination.limit": self.PAGE_SIZE}
+        owners = []
+        while True:
+            response = self.http.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            data = _loads(response.content)
+
+            for owner in data.get("denom_owners") or ():
+                owners.append((owner["address"], int(owner["balance"]["amount"])))
+
+            next_key = (data.get("pagination") or {}).get("next_key")
+            if not next_key:
+                return owners
+            params["pagination.key"] = next_key
+
 
 # ==================== CSV EXPORT ====================
 
@@ -928,11 +1391,12 @@ class ExportManager:
     def __init__(self, node_url: str):
         """Initialize export manager"""
         self.node_url = node_url
+        self.http = _pooled_session()
 
     def export_transactions_csv(self, address: str) -> Optional[str]:
         """Export address transactions as CSV"""
         try:
-            history_response = requests.get(
+            history_response = self.http.get(
                 f"{self.node_url}/history/{address}", timeout=15
             )
             if history_response.status_code != 200:
@@ -971,66 +1435,110 @@ class GovernanceService:
     Uses Cosmos SDK REST API endpoints.
     """
 
+    # Threads for the independent lookups behind one proposal or params call
+    FETCH_WORKERS = 4
+    PARAM_TYPES = ("deposit", "voting", "tallying")
+    # Proposals and votes fetched per upstream call and sliced into pages
+    LIST_FETCH_LIMIT = 500
+
+    # Lookup tables shared by the formatters instead of rebuilt per item
+    PROPOSAL_STATUSES = {
+        "PROPOSAL_STATUS_DEPOSIT_PERIOD": "Deposit",
+        "PROPOSAL_STATUS_VOTING_PERIOD": "Voting",
+        "PROPOSAL_STATUS_PASSED": "Passed",
+        "PROPOSAL_STATUS_REJECTED": "Rejected",
+        "PROPOSAL_STATUS_FAILED": "Failed",
+    }
+    STATUS_FILTERS = {
+        "voting": "PROPOSAL_STATUS_VOTING_PERIOD",
+        "passed": "PROPOSAL_STATUS_PASSED",
+        "rejected": "PROPOSAL_STATUS_REJECTED",
+        "deposit": "PROPOSAL_STATUS_DEPOSIT_PERIOD",
+        "failed": "PROPOSAL_STATUS_FAILED",
+    }
+    VOTE_OPTIONS = {
+        "VOTE_OPTION_YES": "Yes",
+        "VOTE_OPTION_NO": "No",
+        "VOTE_OPTION_ABSTAIN": "Abstain",
+        "VOTE_OPTION_NO_WITH_VETO": "No with Veto",
+    }
+
     def __init__(self, api_url: str, db: ExplorerDatabase):
         self.api_url = api_url.rstrip("/")
         self.db = db
+        self.http = _pooled_session()
+        self._inflight = SingleFlight()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.FETCH_WORKERS, thread_name_prefix="governance"
+        )
 
+    @_coalesced
     def get_proposals(
         self, status: Optional[str] = None, limit: int = 20, offset: int = 0
     ) -> Dict[str, Any]:
         """Get list of governance proposals with optional status filter."""
-        cache_key = f"proposals:{status or 'all'}:{limit}:{offset}"
-        cached = self.db.get_cache(cache_key)
-        if cached:
-            return json.loads(cached)
-
+        cache_key = f"proposals:{status or 'all'}"
         try:
-            params = {
-                "pagination.limit": str(limit),
-                "pagination.offset": str(offset),
-                "pagination.reverse": "true",
-            }
-            if status:
-                # Map friendly status to Cosmos SDK status
-                status_map = {
-                    "voting": "PROPOSAL_STATUS_VOTING_PERIOD",
-                    "passed": "PROPOSAL_STATUS_PASSED",
-                    "rejected": "PROPOSAL_STATUS_REJECTED",
-                    "deposit": "PROPOSAL_STATUS_DEPOSIT_PERIOD",
-                    "failed": "PROPOSAL_STATUS_FAILED",
-                }
-                cosmos_status = status_map.get(status.lower(), status)
-                params["proposal_status"] = cosmos_status
-
-            response = requests.get(
-                f"{self.api_url}/cosmos/gov/v1beta1/proposals",
-                params=params,
-                timeout=30,
+            return self._list_page(
+                cache_key,
+                "proposals",
+                "proposals",
+                lambda page_limit, page_offset: self._fetch_proposals(
+                    status, page_limit, page_offset
+                ),
+                limit,
+                offset,
             )
-            response.raise_for_status()
-            data = response.json()
-
-            proposals = []
-            for prop in data.get("proposals", []):
-                proposals.append(self._format_proposal(prop))
-
-            total = int(data.get("pagination", {}).get("total", len(proposals)))
-            result = {"proposals": proposals, "total": total}
-            self.db.set_cache(cache_key, json.dumps(result), ttl=30)
-            return result
         except Exception as e:
             logger.error(f"Proposals fetch error: {e}")
-            return {"proposals": [], "error": str(e)}
+            return self._stale_list_page(cache_key, "proposals", limit, offset, e)
+
+    def _fetch_proposals(
+        self, status: Optional[str], limit: int, offset: int
+    ) -> Dict[str, Any]:
+        """Fetch one page of proposals, newest first"""
+        params = {
+            "pagination.limit": str(limit),
+            "pagination.offset": str(offset),
+            "pagination.reverse": "true",
+        }
+        if status:
+            # Map friendly status to Cosmos SDK status
+            cosmos_status = self.STATUS_FILTERS.get(status.lower(), status)
+            params["proposal_status"] = cosmos_status
+
+        response = self.http.get(
+            f"{self.api_url}/cosmos/gov/v1beta1/proposals",
+            params=params,
+            timeout=30,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        proposals = []
+        for prop in data.get("proposals", []):
+            proposals.append(self._format_proposal(prop))
 
+        total = int(data.get("pagination", {}).get("total", len(proposals)))
+        return {"proposals": proposals, "total": total}
+
+    @_coalesced
     def get_proposal(self, proposal_id: int) -> Dict[str, Any]:
         """Get single proposal details."""
         cache_key = f"proposal:{proposal_id}"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
-            response = requests.get(
+            # The tally is fetched alongside the proposal, not after it
+            tally_future = self._pool.submit(
+                self.http.get,
+                f"{self.api_url}/cosmos/gov/v1beta1/proposals/{proposal_id}/tally",
+                timeout=30,
+            )
+            response = self.http.get(
                 f"{self.api_url}/cosmos/gov/v1beta1/proposals/{proposal_id}", timeout=30
             )
             response.raise_for_status()
@@ -1038,74 +1546,151 @@ class GovernanceService:
 
             proposal = self._format_proposal(data.get("proposal", {}))
 
-            # Also fetch tally results
-            tally_response = requests.get(
-                f"{self.api_url}/cosmos/gov/v1beta1/proposals/{proposal_id}/tally",
-                timeout=30,
-            )
+            tally_response = tally_future.result()
             if tally_response.status_code == 200:
                 tally_data = tally_response.json()
                 proposal["tally"] = self._format_tally(tally_data.get("tally", {}))
 
-            self.db.set_cache(cache_key, json.dumps(proposal), ttl=30)
+            _cache_response(self.db, cache_key, "proposal", started, proposal)
             return proposal
         except Exception as e:
             logger.error(f"Proposal {proposal_id} fetch error: {e}")
-            return {"error": str(e)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"error": str(e)}
 
+    @_coalesced
     def get_proposal_votes(
         self, proposal_id: int, limit: int = 50, offset: int = 0
     ) -> Dict[str, Any]:
         """Get votes for a proposal."""
-        cache_key = f"votes:{proposal_id}:{limit}:{offset}"
-        cached = self.db.get_cache(cache_key)
-        if cached:
-            return json.loads(cached)
-
+        cache_key = f"votes:{proposal_id}"
         try:
-            params = {"pagination.limit": str(limit), "pagination.offset": str(offset)}
-            response = requests.get(
-                f"{self.api_url}/cosmos/gov/v1beta1/proposals/{proposal_id}/votes",
-                params=params,
-                timeout=30,
+            return self._list_page(
+                cache_key,
+                "votes",
+                "votes",
+                lambda page_limit, page_offset: self._fetch_votes(
+                    proposal_id, page_limit, page_offset
+                ),
+                limit,
+                offset,
             )
-            response.raise_for_status()
-            data = response.json()
-
-            votes = []
-            for vote in data.get("votes", []):
-                votes.append(self._format_vote(vote))
-
-            total = int(data.get("pagination", {}).get("total", len(votes)))
-            result = {"votes": votes, "total": total, "proposal_id": proposal_id}
-            self.db.set_cache(cache_key, json.dumps(result), ttl=30)
-            return result
         except Exception as e:
             logger.error(f"Votes fetch error for proposal {proposal_id}: {e}")
-            return {"votes": [], "error": str(e)}
+            return self._stale_list_page(cache_key, "votes", limit, offset, e)
+
+    def _fetch_votes(self, proposal_id: int, limit: int, offset: int) -> Dict[str, Any]:
+        """Fetch one page of votes for a proposal"""
+        params = {"pagination.limit": str(limit), "pagination.offset": str(offset)}
+        response = self.http.get(
+            f"{self.api_url}/cosmos/gov/v1beta1/proposals/{proposal_id}/votes",
+            params=params,
+            timeout=30,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        votes = []
+        for vote in data.get("votes", []):
+            votes.append(self._format_vote(vote))
+
+        total = int(data.get("pagination", {}).get("total", len(votes)))
+        return {"votes": votes, "total": total, "proposal_id": proposal_id}
+
+    def _list_page(
+        self,
+        cache_key: str,
+        kind: str,
+        field: str,
+        fetch: Callable[[int, int], Dict[str, Any]],
+        limit: int,
+        offset: int,
+    ) -> Dict[str, Any]:
+        """Slice a page out of the cached first LIST_FETCH_LIMIT items
+
+        Every page inside that window is served from one upstream call;
+        pages past it are fetched and cached individually.
+
+        Args:
+            cache_key: Cache key of the whole listing
+            kind: CACHE_TTL family
+            field: Key of the item list in the listing
+            fetch: Callable(limit, offset) returning one upstream page
+            limit: Page size
+            offset: Items to skip
+        """
+        cached = self.db.get_cache(cache_key)
+        if cached:
+            listing = _loads(cached)
+        else:
+            started = time.monotonic()
+            listing = fetch(self.LIST_FETCH_LIMIT, 0)
+            _cache_response(self.db, cache_key, kind, started, listing)
+
+        items = listing[field]
+        if self._past_listing(listing, field, limit, offset):
+            page_key = self._page_key(cache_key, limit, offset)
+            cached = self.db.get_cache(page_key)
+            if cached:
+                return _loads(cached)
+            started = time.monotonic()
+            page = fetch(limit, offset)
+            _cache_response(self.db, page_key, kind, started, page)
+            return page
+
+        return {**listing, field: items[offset : offset + limit]}
 
+    def _stale_list_page(
+        self, cache_key: str, field: str, limit: int, offset: int, error: Exception
+    ) -> Dict[str, Any]:
+        """Serve a page from stale copies kept by _list_page, else the error"""
+        listing = _stale_response(self.db, cache_key)
+        if listing and not self._past_listing(listing, field, limit, offset):
+            return {**listing, field: listing[field][offset : offset + limit]}
+        page = _stale_response(self.db, self._page_key(cache_key, limit, offset))
+        return page or {field: [], "error": str(error)}
+
+    @staticmethod
+    def _past_listing(
+        listing: Dict[str, Any], field: str, limit: int, offset: int
+    ) -> bool:
+        """Whether a page reaches beyond the items held in a partial listing"""
+        items = listing[field]
+        return offset + limit > len(items) and len(items) < listing["total"]
+
+    @staticmethod
+    def _page_key(cache_key: str, limit: int, offset: int) -> str:
+        """Cache key of a page fetched on its own past the listing"""
+        return f"{cache_key}:{limit}:{offset}"
+
+    @_coalesced
     def get_governance_params(self) -> Dict[str, Any]:
         """Get governance parameters."""
         cache_key = "gov_params"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
             params = {}
-            for param_type in ["deposit", "voting", "tallying"]:
-                response = requests.get(
+            responses = self._pool.map(
+                lambda param_type: self.http.get(
                     f"{self.api_url}/cosmos/gov/v1beta1/params/{param_type}", timeout=15
-                )
+                ),
+                self.PARAM_TYPES,
+            )
+            for param_type, response in zip(self.PARAM_TYPES, responses):
                 if response.status_code == 200:
                     data = response.json()
                     params[param_type] = data.get(f"{param_type}_params", {})
 
-            self.db.set_cache(cache_key, json.dumps(params), ttl=300)
+            _cache_response(self.db, cache_key, "gov_params", started, params)
             return params
         except Exception as e:
             logger.error(f"Governance params fetch error: {e}")
-            return {"error": str(e)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"error": str(e)}
 
     def _format_proposal(self, prop: Dict[str, Any]) -> Dict[str, Any]:
         """Format proposal data for frontend."""
@@ -1160,12 +1745,7 @@ class GovernanceService:
     def _format_vote(self, vote: Dict[str, Any]) -> Dict[str, Any]:
         """Format vote data."""
         option = vote.get("option", "")
-        option_friendly = {
-            "VOTE_OPTION_YES": "Yes",
-            "VOTE_OPTION_NO": "No",
-            "VOTE_OPTION_ABSTAIN": "Abstain",
-            "VOTE_OPTION_NO_WITH_VETO": "No with Veto",
-        }.get(option, option)
+        option_friendly = self.VOTE_OPTIONS.get(option, option)
 
         return {
             "voter": vote.get("voter"),
@@ -1175,14 +1755,7 @@ class GovernanceService:
 
     def _friendly_status(self, status: str) -> str:
         """Convert Cosmos SDK status to friendly name."""
-        status_map = {
-            "PROPOSAL_STATUS_DEPOSIT_PERIOD": "Deposit",
-            "PROPOSAL_STATUS_VOTING_PERIOD": "Voting",
-            "PROPOSAL_STATUS_PASSED": "Passed",
-            "PROPOSAL_STATUS_REJECTED": "Rejected",
-            "PROPOSAL_STATUS_FAILED": "Failed",
-        }
-        return status_map.get(status, status)
+        return self.PROPOSAL_STATUSES.get(status, status)
 
     def _format_coins(self, coins: List[Dict[str, Any]]) -> str:
         """Format coin amounts."""
@@ -1212,16 +1785,20 @@ class StakingService:
     def __init__(self, api_url: str, db: ExplorerDatabase):
         self.api_url = api_url.rstrip("/")
         self.db = db
+        self.http = _pooled_session()
+        self._inflight = SingleFlight()
 
+    @_coalesced
     def get_staking_pool(self) -> Dict[str, Any]:
         """Get staking pool information."""
         cache_key = "staking_pool"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/cosmos/staking/v1beta1/pool", timeout=15
             )
             response.raise_for_status()
@@ -1242,21 +1819,24 @@ class StakingService:
                 "total_formatted": f"{total / 1_000_000:.2f} AURA",
             }
 
-            self.db.set_cache(cache_key, json.dumps(result), ttl=60)
+            _cache_response(self.db, cache_key, "staking_pool", started, result)
             return result
         except Exception as e:
             logger.error(f"Staking pool fetch error: {e}")
-            return {"error": str(e)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"error": str(e)}
 
+    @_coalesced
     def get_delegations(self, address: str) -> Dict[str, Any]:
         """Get delegations for an address."""
         cache_key = f"delegations:{address}"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/cosmos/staking/v1beta1/delegations/{address}",
                 params={"pagination.limit": "100"},
                 timeout=30,
@@ -1291,21 +1871,24 @@ class StakingService:
                 "count": len(delegations),
             }
 
-            self.db.set_cache(cache_key, json.dumps(result), ttl=30)
+            _cache_response(self.db, cache_key, "delegations", started, result)
             return result
         except Exception as e:
             logger.error(f"Delegations fetch error for {address}: {e}")
-            return {"delegations": [], "error": str(e)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"delegations": [], "error": str(e)}
 
+    @_coalesced
     def get_unbonding_delegations(self, address: str) -> Dict[str, Any]:
         """Get unbonding delegations for an address."""
         cache_key = f"unbonding:{address}"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/cosmos/staking/v1beta1/delegators/{address}/unbonding_delegations",
                 params={"pagination.limit": "100"},
                 timeout=30,
@@ -1340,21 +1923,24 @@ class StakingService:
                 "count": len(unbondings),
             }
 
-            self.db.set_cache(cache_key, json.dumps(result), ttl=30)
+            _cache_response(self.db, cache_key, "unbonding", started, result)
             return result
         except Exception as e:
             logger.error(f"Unbonding fetch error for {address}: {e}")
-            return {"unbonding_delegations": [], "error": str(e)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"unbonding_delegations": [], "error": str(e)}
 
+    @_coalesced
     def get_rewards(self, address: str) -> Dict[str, Any]:
         """Get pending rewards for an address."""
         cache_key = f"rewards:{address}"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/cosmos/distribution/v1beta1/delegators/{address}/rewards",
                 timeout=30,
             )
@@ -1401,21 +1987,28 @@ class StakingService:
                 "total_formatted": f"{total_amount / 1_000_000:.6f} AURA",
             }
 
-            self.db.set_cache(cache_key, json.dumps(result), ttl=30)
+            _cache_response(self.db, cache_key, "rewards", started, result)
             return result
         except Exception as e:
             logger.error(f"Rewards fetch error for {address}: {e}")
-            return {"rewards_by_validator": [], "total_rewards": [], "error": str(e)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {
+                "rewards_by_validator": [],
+                "total_rewards": [],
+                "error": str(e),
+            }
 
+    @_coalesced
     def get_staking_params(self) -> Dict[str, Any]:
         """Get staking parameters."""
         cache_key = "staking_params"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/cosmos/staking/v1beta1/params", timeout=15
             )
             response.raise_for_status()
@@ -1430,16 +2023,21 @@ class StakingService:
                 "bond_denom": params.get("bond_denom", config.DENOM),
             }
 
-            self.db.set_cache(cache_key, json.dumps(result), ttl=300)
+            _cache_response(self.db, cache_key, "staking_params", started, result)
             return result
         except Exception as e:
             logger.error(f"Staking params fetch error: {e}")
-            return {"error": str(e)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"error": str(e)}
 
 
 # ==================== CORE DATA SERVICE ====================
 
 
+# Leading coin of an event amount such as "1000uaura,5ibc/27394FB0..."
+_EVENT_COIN = re.compile(r"(\d+)([^,]+)")
+
+
 class BlockchainDataService:
     """
     Provides explorer-specific data aggregates for the frontend.
@@ -1447,21 +2045,32 @@ class BlockchainDataService:
     validators, and summary statistics.
     """
 
+    # Concurrent per-transaction lookups; stays under the node's
+    # 16-slot RPC work queue
+    FETCH_WORKERS = 15
+
     def __init__(self, node_url: str, api_url: str, db: ExplorerDatabase):
         self.node_url = node_url.rstrip("/")
         self.api_url = api_url.rstrip("/")
         self.db = db
+        self.http = _pooled_session()
+        self._inflight = SingleFlight()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.FETCH_WORKERS, thread_name_prefix="explorer-data"
+        )
         self.max_limit = 50
 
     # ------- Public API -------
 
+    @_coalesced
     def get_blocks(self, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
         """Return paginated block metadata for dashboard views."""
         limit, offset = self._normalize_pagination(limit, offset)
         cache_key = f"blocks:{limit}:{offset}"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
             latest_height = self._get_latest_height()
@@ -1479,12 +2088,14 @@ class BlockchainDataService:
             ]
 
             result = {"blocks": blocks, "latest_height": latest_height}
-            self.db.set_cache(cache_key, json.dumps(result), ttl=5)
+            _cache_response(self.db, cache_key, "blocks", started, result)
             return result
         except Exception as e:
             logger.error(f"Block fetch error: {e}")
-            return {"blocks": [], "error": str(e)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"blocks": [], "error": str(e)}
 
+    @_coalesced
     def get_transactions(
         self,
         limit: int = 20,
@@ -1500,7 +2111,8 @@ class BlockchainDataService:
         cache_key = f"txs:{limit}:{offset}:{tx_type_key}:{status_key}"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
             params = {
@@ -1509,7 +2121,7 @@ class BlockchainDataService:
                 "pagination.offset": str(offset),
                 "order_by": "ORDER_BY_DESC",
             }
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/cosmos/tx/v1beta1/txs", params=params, timeout=30
             )
             response.raise_for_status()
@@ -1526,7 +2138,7 @@ class BlockchainDataService:
 
             total = int(data.get("pagination", {}).get("total", len(formatted)))
             result = {"transactions": formatted, "total": total}
-            self.db.set_cache(cache_key, json.dumps(result), ttl=5)
+            _cache_response(self.db, cache_key, "txs", started, result)
             return result
         except Exception as e:
             logger.warning(f"Transaction fetch error (REST), falling back to RPC: {e}")
@@ -1540,53 +2152,139 @@ class BlockchainDataService:
                 "per_page": str(limit),
                 "order_by": '"desc"',
             }
-            rpc_response = requests.get(
+            rpc_response = self.http.get(
                 f"{self.node_url}/tx_search", params=rpc_params, timeout=30
             )
             rpc_response.raise_for_status()
             rpc_data = rpc_response.json().get("result", {})
 
-            formatted: List[Dict[str, Any]] = []
-            for raw in rpc_data.get("txs", []):
-                tx_hash = raw.get("hash")
-                if not tx_hash:
-                    continue
-                try:
-                    tx_detail = requests.get(
-                        f"{self.api_url}/cosmos/tx/v1beta1/txs/{tx_hash}", timeout=30
-                    )
-                    tx_detail.raise_for_status()
-                    tx_response = tx_detail.json().get("tx_response", {})
-                    formatted.append(self._format_transaction(tx_response))
-                except Exception as tx_err:
-                    logger.error(
-                        f"Transaction detail fetch error ({tx_hash}): {tx_err}"
-                    )
-                    formatted.append(
-                        {
-                            "hash": tx_hash,
-                            "height": int(raw.get("height", 0)),
-                            "type": "Unknown",
-                            "type_key": "unknown",
-                            "from": None,
-                            "to": None,
-                            "amount": None,
-                            "status": "success"
-                            if raw.get("tx_result", {}).get("code", 0) == 0
-                            else "failed",
-                            "fee": None,
-                            "time": None,
-                        }
-                    )
+            hits = [raw for raw in rpc_data.get("txs", []) if raw.get("hash")]
+            formatted = [self._format_tx_search_hit(raw) for raw in hits]
+
+            # Hits whose events can't be read fall back to concurrent REST
+            # detail lookups; map() keeps the search order
+            missing = [i for i, tx in enumerate(formatted) if tx is None]
+            details = self._pool.map(
+                self._fetch_transaction_detail, [hits[i] for i in missing]
+            )
+            for i, tx_entry in zip(missing, details):
+                formatted[i] = tx_entry
 
             total = int(rpc_data.get("total_count", len(formatted)))
             result = {"transactions": formatted, "total": total}
-            self.db.set_cache(cache_key, json.dumps(result), ttl=5)
+            _cache_response(self.db, cache_key, "txs", started, result)
             return result
         except Exception as rpc_error:
             logger.error(f"Transaction fetch error (RPC fallback): {rpc_error}")
-            return {"transactions": [], "error": str(rpc_error)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"transactions": [], "error": str(rpc_error)}
+
+    def _format_tx_search_hit(self, raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Format a tx_search hit from its own result events
+
+        Returns None when the events carry no message type URL (e.g. the
+        base64-encoded attributes of older Tendermint releases).
+        """
+        tx_result = raw.get("tx_result", {})
+        events = [
+            (event.get("type", ""), self._event_attributes(event))
+            for event in tx_result.get("events", [])
+        ]
+
+        # Ante-handler events (fee transfer, fee payer, signatures) come
+        # first; the first message's events start at the message event
+        # carrying its action and run until the next message's action
+        start = next(
+            (
+                i
+                for i, (kind, attrs) in enumerate(events)
+                if kind == "message" and attrs.get("action")
+            ),
+            None,
+        )
+        if start is None:
+            return None
+        msg_type = events[start][1]["action"]
+        if not msg_type.startswith("/"):
+            return None
+
+        # SDK v0.50+ also tags each message's events with its msg_index
+        msg_index = events[start][1].get("msg_index")
+        attributes: Dict[str, Dict[str, str]] = {"message": events[start][1]}
+        for kind, attrs in events[start + 1 :]:
+            if kind == "message" and attrs.get("action"):
+                break
+            if msg_index is not None and attrs.get("msg_index", msg_index) != msg_index:
+                continue
+            event_attrs = attributes.setdefault(kind, {})
+            for key, value in attrs.items():
+                event_attrs.setdefault(key, value)
+
+        # The fee is reported by the ante handler's tx event
+        fee: Dict[str, str] = {}
+        for kind, attrs in events[:start]:
+            if kind == "tx" and "fee" in attrs:
+                fee = attrs
+                break
+
+        friendly_type = self._friendly_type(msg_type)
+        return {
+            "hash": raw["hash"],
+            "height": int(raw.get("height", 0)),
+            "type": friendly_type,
+            "type_key": self._type_key(friendly_type),
+            "from": attributes["message"].get("sender"),
+            "to": attributes.get("transfer", {}).get("recipient"),
+            "amount": self._format_event_coins(attributes.get("transfer", {})),
+            "status": "success" if tx_result.get("code", 0) == 0 else "failed",
+            "fee": self._format_event_coins(fee, "fee"),
+            "time": None,  # tx_search results carry no block time
+        }
+
+    def _event_attributes(self, event: Dict[str, Any]) -> Dict[str, str]:
+        """Collapse an event's attribute list, keeping the first of each key"""
+        attrs: Dict[str, str] = {}
+        for attr in event.get("attributes", []):
+            attrs.setdefault(attr.get("key"), attr.get("value"))
+        return attrs
+
+    def _format_event_coins(
+        self, attrs: Dict[str, str], key: str = "amount"
+    ) -> Optional[str]:
+        """Format the first coin of an event's "1000uaura,5uatom" attribute"""
+        match = _EVENT_COIN.match(attrs.get(key) or "")
+        if not match:
+            return None
+        return self._format_coin(match.group(1), match.group(2))
+
+    def _fetch_transaction_detail(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a tx_search hit from its REST detail, or a stub on failure"""
+        tx_hash = raw["hash"]
+        try:
+            tx_detail = self.http.get(
+                f"{self.api_url}/cosmos/tx/v1beta1/txs/{tx_hash}", timeout=30
+            )
+            tx_detail.raise_for_status()
+            tx_response = tx_detail.json().get("tx_response", {})
+            return self._format_transaction(tx_response)
+        except Exception as tx_err:
+            logger.error(f"Transaction detail fetch error ({tx_hash}): {tx_err}")
+            return {
+                "hash": tx_hash,
+                "height": int(raw.get("height", 0)),
+                "type": "Unknown",
+                "type_key": "unknown",
+                "from": None,
+                "to": None,
+                "amount": None,
+                "status": "success"
+                if raw.get("tx_result", {}).get("code", 0) == 0
+                else "failed",
+                "fee": None,
+                "time": None,
+            }
 
+    @_coalesced
     def get_validators(self, sort_by: str = "voting_power") -> Dict[str, Any]:
         """Return validator list sorted by provided metric."""
         sort_key = (
@@ -1597,11 +2295,12 @@ class BlockchainDataService:
         cache_key = f"validators:{sort_key}"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
             params = {"status": "BOND_STATUS_BONDED", "pagination.limit": "200"}
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/cosmos/staking/v1beta1/validators",
                 params=params,
                 timeout=30,
@@ -1639,14 +2338,14 @@ class BlockchainDataService:
 
             validators.sort(key=lambda v: v[sort_key], reverse=True)
             result = {"validators": validators, "count": len(validators)}
-            self.db.set_cache(cache_key, json.dumps(result), ttl=30)
+            _cache_response(self.db, cache_key, "validators", started, result)
             return result
         except Exception as e:
             logger.warning(f"Validator fetch error (REST), falling back to RPC: {e}")
 
         try:
             rpc_params = {"page": "1", "per_page": "200"}
-            rpc_response = requests.get(
+            rpc_response = self.http.get(
                 f"{self.node_url}/validators", params=rpc_params, timeout=15
             )
             rpc_response.raise_for_status()
@@ -1669,18 +2368,21 @@ class BlockchainDataService:
 
             validators.sort(key=lambda v: v[sort_key], reverse=True)
             result = {"validators": validators, "count": len(validators)}
-            self.db.set_cache(cache_key, json.dumps(result), ttl=30)
+            _cache_response(self.db, cache_key, "validators", started, result)
             return result
         except Exception as rpc_error:
             logger.error(f"Validator fetch error (RPC fallback): {rpc_error}")
-            return {"validators": [], "error": str(rpc_error)}
+            stale = _stale_response(self.db, cache_key)
+            return stale or {"validators": [], "error": str(rpc_error)}
 
+    @_coalesced
     def get_core_stats(self) -> Dict[str, Any]:
         """Return base stats for quick dashboard cards."""
         cache_key = "core_stats"
         cached = self.db.get_cache(cache_key)
         if cached:
-            return json.loads(cached)
+            return _loads(cached)
+        started = time.monotonic()
 
         try:
             latest_height = self._get_latest_height()
@@ -1700,11 +2402,12 @@ class BlockchainDataService:
                 "total_txs": total_txs,
                 "active_validators": validator_count,
             }
-            self.db.set_cache(cache_key, json.dumps(stats), ttl=10)
+            _cache_response(self.db, cache_key, "core_stats", started, stats)
             return stats
         except Exception as e:
             logger.error(f"Stats fetch error: {e}")
-            return {
+            stale = _stale_response(self.db, cache_key)
+            return stale or {
                 "latest_block": 0,
                 "total_txs": 0,
                 "active_validators": 0,
@@ -1720,7 +2423,7 @@ class BlockchainDataService:
 
     def _get_latest_height(self) -> int:
         try:
-            response = requests.get(f"{self.node_url}/status", timeout=15)
+            response = self.http.get(f"{self.node_url}/status", timeout=15)
             response.raise_for_status()
             return int(
                 response.json()
@@ -1741,7 +2444,7 @@ class BlockchainDataService:
             chunk_end = cursor
             chunk_start = max(start_height, chunk_end - 19)
             try:
-                response = requests.get(
+                response = self.http.get(
                     f"{self.node_url}/blockchain",
                     params={"minHeight": str(chunk_start), "maxHeight": str(chunk_end)},
                     timeout=30,
@@ -1879,7 +2582,7 @@ class BlockchainDataService:
 
     def _get_total_transactions(self) -> int:
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/cosmos/tx/v1beta1/txs",
                 params={"events": "tx.height>0", "pagination.limit": "1"},
                 timeout=15,
@@ -1891,7 +2594,7 @@ class BlockchainDataService:
             logger.warning(f"Total tx fetch error (REST), falling back to RPC: {e}")
 
         try:
-            rpc_response = requests.get(
+            rpc_response = self.http.get(
                 f"{self.node_url}/tx_search",
                 params={
                     "query": '"tx.height>0"',
@@ -1968,9 +2671,11 @@ API_URL = getattr(config, "NODE_API_URL", "http://localhost:1317")
 DB_PATH = config.DB_PATH
 
 db = ExplorerDatabase(DB_PATH)
+# The writer is a daemon thread; commit whatever it still has queued on exit
+atexit.register(db.close)
 analytics = AnalyticsEngine(NODE_URL, db)
 search_engine = SearchEngine(NODE_URL, db)
-rich_list = RichListManager(NODE_URL, db)
+rich_list = RichListManager(NODE_URL, db, API_URL)
 export_manager = ExportManager(NODE_URL)
 data_service = BlockchainDataService(NODE_URL, API_URL, db)
 governance_service = GovernanceService(API_URL, db)
@@ -2212,17 +2917,7 @@ def get_analytics_dashboard():
       500:
         description: Server error
     """
-    return jsonify(
-        {
-            "hashrate": analytics.get_network_hashrate(),
-            "transaction_volume": analytics.get_transaction_volume(),
-            "active_addresses": analytics.get_active_addresses(),
-            "average_block_time": analytics.get_average_block_time(),
-            "mempool": analytics.get_mempool_size(),
-            "difficulty": analytics.get_network_difficulty(),
-            "timestamp": time.time(),
-        }
-    )
+    return jsonify(analytics.get_dashboard())
 
 
 # ==================== CORE DATA ENDPOINTS ====================
@@ -3801,8 +4496,8 @@ def richlist_endpoint():
                     type: string
                     description: Account address
                   balance:
-                    type: number
-                    description: Token balance
+                    type: integer
+                    description: Token balance in the base denom
                   label:
                     type: string
                     description: Address label (if available)
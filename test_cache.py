@@ -3,10 +3,14 @@ Comprehensive tests for cache.py
 Tests MemoryCache, RedisCache, MultiTierCache, and related utilities
 """
 
+import asyncio
+import json
 import pytest
+import threading
 import time
 import os
 from unittest.mock import Mock, patch, MagicMock
+import cache as cache_module
 from cache import (
     MemoryCache,
     RedisCache,
@@ -14,6 +18,9 @@ from cache import (
     cache_key,
     cached,
     CacheWarmer,
+    CountMinSketch,
+    SingleFlight,
+    AsyncSingleFlight,
 )
 
 
@@ -47,6 +54,47 @@ class TestMemoryCache:
         time.sleep(1.1)
         assert cache.get("key1") is None
 
+    def test_expired_entries_swept_without_reads(self):
+        """Test that expired entries are dropped even if never read again"""
+        cache = MemoryCache(max_size=10)
+        cache.set("short1", "value1", ttl=1)
+        cache.set("short2", "value2", ttl=1)
+        cache.set("long", "value3", ttl=60)
+
+        time.sleep(2.2)
+        cache.set("other", "value4", ttl=60)
+
+        stats = cache.get_stats()
+        assert stats["size"] == 2
+        assert set(cache.list_keys()) == {"long", "other"}
+
+    def test_reset_key_survives_old_bucket_sweep(self):
+        """Test that re-setting a key moves it to a later expiry bucket"""
+        cache = MemoryCache(max_size=10)
+        cache.set("key1", "old", ttl=1)
+        cache.set("key1", "new", ttl=60)
+
+        time.sleep(2.2)
+
+        assert cache.get("key1") == "new"
+
+    def test_expiry_buckets_only_hold_live_keys(self):
+        """Test that deleted, evicted and re-set keys leave their expiry bucket"""
+        cache = MemoryCache(max_size=8)
+        for i in range(100):
+            cache.set(f"gone{i}", i, ttl=60)
+            cache.delete(f"gone{i}")
+            cache.set("same", i, ttl=60 + i)
+        for i in range(100):
+            cache.set(f"evict{i}", i, ttl=60)
+
+        tracked = sum(
+            len(keys)
+            for shard in cache._shards
+            for keys in shard.expiry_buckets.values()
+        )
+        assert tracked == cache.get_stats()["size"] <= 8
+
     def test_lru_eviction(self):
         """Test LRU eviction when at capacity"""
         cache = MemoryCache(max_size=3)
@@ -66,6 +114,15 @@ class TestMemoryCache:
         assert cache.get("key3") == "value3"
         assert cache.get("key4") == "value4"
 
+    def test_mset_matches_set(self):
+        """Test that mset applies TTL and LRU eviction like set"""
+        cache = MemoryCache(max_size=3)
+        cache.mset({"a": 1, "b": 2, "c": 3, "d": 4}, ttl=60)
+
+        assert cache.get("a") is None
+        assert cache.mget(["b", "c", "d"]) == {"b": 2, "c": 3, "d": 4}
+        assert 0 < cache.get_with_ttl("d")[1] <= 60
+
     def test_clear(self):
         """Test clearing all cache entries"""
         cache = MemoryCache(max_size=10)
@@ -76,7 +133,41 @@ class TestMemoryCache:
 
         assert cache.get("key1") is None
         assert cache.get("key2") is None
-        assert len(cache.cache) == 0
+        assert cache.get_stats()["size"] == 0
+
+    def test_sharding(self):
+        """Test that large caches are striped and still honor capacity"""
+        cache = MemoryCache(max_size=1024, shards=16)
+        assert cache.get_stats()["shards"] == 16
+
+        for i in range(2000):
+            cache.set(f"key{i}", i)
+
+        assert cache.get_stats()["size"] <= 1024
+        assert cache.get("key1999") == 1999
+
+        # Small caches fall back to a single shard for exact LRU
+        assert MemoryCache(max_size=10).get_stats()["shards"] == 1
+
+    def test_concurrent_access(self):
+        """Test that concurrent writers and readers do not corrupt the cache"""
+        cache = MemoryCache(max_size=256)
+
+        def worker(offset):
+            for i in range(500):
+                key = f"key{(offset + i) % 300}"
+                cache.set(key, i)
+                cache.get(key)
+                if i % 7 == 0:
+                    cache.delete(key)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.get_stats()["size"] <= 256
 
     def test_stats(self):
         """Test cache statistics"""
@@ -93,8 +184,8 @@ class TestMemoryCache:
         assert stats["size"] == 2
         assert stats["max_size"] == 10
         assert stats["total_hits"] >= 3
-        assert "key1" in stats["keys"]
-        assert "key2" in stats["keys"]
+        assert "keys" not in stats
+        assert sorted(cache.list_keys()) == ["key1", "key2"]
 
 
 class TestRedisCache:
@@ -137,6 +228,34 @@ class TestRedisCache:
             cache = RedisCache()
             assert cache.redis_url == test_url
 
+    def test_prebuilt_client_is_used(self):
+        """Test that a caller-supplied client is used as-is"""
+        client = MagicMock()
+        cache = RedisCache(client=client)
+
+        assert cache.client is client
+        assert cache.enabled is True
+        client.ping.assert_called_once()
+
+    def test_connection_pool_is_bounded(self):
+        """Test that URL connections share a bounded keepalive pool"""
+        with patch("redis.Redis.ping"):
+            cache = RedisCache(redis_url="redis://localhost:6379/0")
+
+        pool = cache.client.connection_pool
+        assert pool.max_connections == RedisCache.MAX_CONNECTIONS
+        assert pool.connection_kwargs["socket_keepalive"] is True
+
+    def test_unix_socket_from_environment(self):
+        """Test that REDIS_SOCKET selects a Unix socket connection"""
+        with patch.dict(os.environ, {"REDIS_SOCKET": "/run/redis/redis.sock"}):
+            with patch("redis.Redis.ping"):
+                cache = RedisCache()
+
+        pool = cache.client.connection_pool
+        assert pool.connection_kwargs["path"] == "/run/redis/redis.sock"
+        assert pool.max_connections == RedisCache.MAX_CONNECTIONS
+
     def test_key_prefix(self):
         """Test that key prefix is applied"""
         cache = RedisCache(key_prefix="test:")
@@ -208,6 +327,141 @@ class TestRedisCache:
         # Verify setex was not called due to serialization error
         cache.client.setex.assert_not_called()
 
+    def test_batch_operations_use_single_pipeline(self):
+        """Test that mget/mset issue one pipelined round trip"""
+        cache = RedisCache(key_prefix="test:")
+        cache.enabled = True
+        cache.fallback_mode = False
+        cache.client = MagicMock()
+        pipe = cache.client.pipeline.return_value
+        pipe.execute.return_value = ['{"height": 1}', 5000, None, -2]
+
+        result = cache.mget(["block:1", "block:2"])
+
+        assert result == {"block:1": {"height": 1}}
+        cache.client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.get.call_count == 2
+        assert pipe.pttl.call_count == 2
+        pipe.execute.assert_called_once()
+
+        cache.client.pipeline.reset_mock()
+        cache.mset({"block:1": {"height": 1}, "block:2": {"height": 2}}, ttl=60)
+        assert pipe.setex.call_count == 2
+        key, ttl, payload = pipe.setex.call_args_list[0].args
+        assert (key, ttl) == ("test:block:1", 60)
+        assert json.loads(payload) == {"height": 1}
+        pipe.execute.assert_called_once()
+
+        cache.mdelete(["block:1", "block:2"])
+        cache.client.delete.assert_called_once_with("test:block:1", "test:block:2")
+
+    def test_batch_operations_in_fallback_mode(self):
+        """Test that batch operations work against the fallback cache"""
+        cache = RedisCache(redis_url="redis://nonexistent:9999")
+
+        cache.mset({"key1": "value1", "key2": "value2"})
+        assert cache.mget(["key1", "key2", "key3"]) == {
+            "key1": "value1",
+            "key2": "value2",
+        }
+
+        cache.mdelete(["key1", "key2"])
+        assert cache.mget(["key1", "key2"]) == {}
+
+    def test_clear_unlinks_in_pipelined_batches(self):
+        """Test that clear scans with a large COUNT and unlinks in batches"""
+        cache = RedisCache(key_prefix="test:")
+        cache.enabled = True
+        cache.fallback_mode = False
+        cache.client = MagicMock()
+        keys = [f"test:key{i}".encode() for i in range(2500)]
+        cache.client.scan_iter.return_value = iter(keys)
+        pipe = cache.client.pipeline.return_value
+
+        cache.clear()
+
+        cache.client.scan_iter.assert_called_once_with(
+            match="test:*", count=RedisCache.SCAN_COUNT
+        )
+        assert [len(c.args) for c in pipe.unlink.call_args_list] == [1000, 1000, 500]
+        pipe.execute.assert_called_once()
+        cache.client.delete.assert_not_called()
+
+    def test_stats_estimate_prefixed_key_count(self):
+        """Test that stats scale DBSIZE by one SCAN page instead of walking it"""
+        cache = RedisCache(key_prefix="test:")
+        cache.enabled = True
+        cache.fallback_mode = False
+        cache.client = MagicMock()
+        cache.client.dbsize.return_value = 10_000
+        sample = [b"test:a", b"test:b", b"test:c", b"other:d"]
+        cache.client.scan.return_value = (42, sample)
+
+        stats = cache.get_stats()
+        assert stats["key_count"] == 7500
+        assert stats["key_count_estimated"] is True
+        cache.client.scan.assert_called_once_with(cursor=0, count=RedisCache.SCAN_COUNT)
+        cache.client.scan_iter.assert_not_called()
+
+        cache.client.scan_iter.return_value = iter([b"test:a", b"test:b"])
+        stats = cache.get_stats(exact_count=True)
+        assert stats["key_count"] == 2
+        assert stats["key_count_estimated"] is False
+
+    def test_serialization_round_trip(self):
+        """Test that values are stored as bytes and decoded back"""
+        cache = RedisCache()
+        cache.enabled = True
+        cache.fallback_mode = False
+        cache.client = MagicMock()
+
+        value = {"height": 5, "txs": ["a", "b"], "fee": 0.25}
+        cache.set("block:5", value, ttl=60)
+
+        payload = cache.client.setex.call_args.args[2]
+        assert isinstance(payload, bytes)
+
+        cache.client.get.return_value = payload
+        assert cache.get("block:5") == value
+
+    @pytest.mark.skipif(cache_module.lz4_frame is None, reason="lz4 not installed")
+    def test_large_payloads_are_compressed(self):
+        """Test that large values are stored lz4-compressed and small ones not"""
+        cache = RedisCache()
+        cache.enabled = True
+        cache.fallback_mode = False
+        cache.client = MagicMock()
+
+        validators = [
+            {"address": f"auravaloper1{i:040d}", "power": i} for i in range(50)
+        ]
+        cache.set("validators:active", validators, ttl=60)
+        payload = cache.client.setex.call_args.args[2]
+        assert payload[:1] == b"\x01"
+        assert len(payload) < len(json.dumps(validators))
+
+        cache.client.get.return_value = payload
+        assert cache.get("validators:active") == validators
+
+        cache.set("block:1", {"height": 1}, ttl=60)
+        assert cache.client.setex.call_args.args[2][:1] == b"{"
+
+    def test_corrupt_compressed_payload_is_dropped(self):
+        """Test that a corrupt lz4 value is deleted without leaving Redis"""
+        cache = RedisCache(key_prefix="test:")
+        cache.enabled = True
+        cache.fallback_mode = False
+        cache.client = MagicMock()
+        cache.client.get.return_value = b"\x01garbage"
+
+        assert cache.get("block:1") is None
+        assert cache.fallback_mode is False
+        cache.client.delete.assert_called_once_with("test:block:1")
+
+        cache.client.pipeline.return_value.execute.return_value = [b"\x01", 5000]
+        assert cache.mget(["block:2"]) == {}
+        assert cache.fallback_mode is False
+
     def test_stats_in_fallback_mode(self):
         """Test stats when in fallback mode"""
         cache = RedisCache(redis_url="redis://nonexistent:9999")
@@ -252,6 +506,42 @@ class TestMultiTierCache:
         # Now should be in L1
         assert l1.get("key1") == "value1"
 
+    def test_tinylfu_admits_only_repeated_keys(self):
+        """Test that TinyLFU admission keeps one-off L2 hits out of L1"""
+        l1 = MemoryCache(max_size=10)
+        l2 = RedisCache(redis_url="redis://nonexistent:9999")
+        cache = MultiTierCache(memory_cache=l1, redis_cache=l2, admission="tinylfu")
+        l2.mset({"block:1": "a", "block:2": "b"})
+
+        assert cache.get("block:1") == "a"
+        assert cache.mget(["block:2"]) == {"block:2": "b"}
+        assert l1.get("block:1") is None
+        assert l1.get("block:2") is None
+
+        # The second access is frequent enough to be promoted
+        assert cache.get("block:1") == "a"
+        assert l1.get("block:1") == "a"
+        assert cache.stats["l2_hits"] == 3
+
+    def test_unknown_admission_policy(self):
+        """Test that an unknown admission policy is rejected"""
+        with pytest.raises(ValueError):
+            MultiTierCache(admission="lru")
+
+    def test_get_with_ttl(self):
+        """Test that get_with_ttl reports the remaining TTL from either tier"""
+        l1 = MemoryCache(max_size=10)
+        l2 = RedisCache(redis_url="redis://nonexistent:9999")
+        cache = MultiTierCache(memory_cache=l1, redis_cache=l2)
+        cache.set("latest_height", 1000, ttl=30)
+        l2.set("validators:active", ["val1"], ttl=60)
+
+        value, ttl = cache.get_with_ttl("latest_height")
+        assert value == 1000 and 0 < ttl <= 30
+        value, ttl = cache.get_with_ttl("validators:active")
+        assert value == ["val1"] and 0 < ttl <= 60
+        assert cache.get_with_ttl("missing") == (None, None)
+
     def test_cache_miss(self):
         """Test cache miss tracking"""
         cache = MultiTierCache()
@@ -267,11 +557,116 @@ class TestMultiTierCache:
         cache = MultiTierCache(memory_cache=l1, redis_cache=l2)
 
         cache.set("key1", "value1")
+        cache.flush()
 
         # Should be in both tiers (L2 will be in fallback MemoryCache)
         assert l1.get("key1") == "value1"
         assert l2.get("key1") == "value1"
 
+    def test_set_writes_l2_behind(self):
+        """Test that queued L2 writes are batched and applied on flush"""
+        l1 = MemoryCache(max_size=10)
+        l2 = RedisCache(redis_url="redis://nonexistent:9999")
+        cache = MultiTierCache(memory_cache=l1, redis_cache=l2)
+
+        with patch.object(l2, "mset", wraps=l2.mset) as l2_mset:
+            cache.set("key1", "value1", ttl=60)
+            cache.mset({"key2": "value2", "key3": "value3"}, ttl=60)
+            cache.flush()
+
+        assert l2.mget(["key1", "key2", "key3"]) == {
+            "key1": "value1",
+            "key2": "value2",
+            "key3": "value3",
+        }
+        assert 1 <= l2_mset.call_count <= 3
+
+    def test_delete_not_resurrected_by_pending_write(self):
+        """Test that delete drains queued writes before removing from L2"""
+        l1 = MemoryCache(max_size=10)
+        l2 = RedisCache(redis_url="redis://nonexistent:9999")
+        cache = MultiTierCache(memory_cache=l1, redis_cache=l2)
+
+        cache.set("key1", "value1")
+        cache.delete("key1")
+        cache.flush()
+
+        assert l2.get("key1") is None
+        assert cache.get("key1") is None
+
+    def test_l2_promotion_preserves_remaining_ttl(self):
+        """Test that promoted entries expire with their L2 TTL, not the default"""
+        l1 = MemoryCache(max_size=10)
+        l2 = RedisCache(redis_url="redis://nonexistent:9999")
+        cache = MultiTierCache(memory_cache=l1, redis_cache=l2)
+
+        l2.set("key1", "value1", ttl=5)
+        assert cache.get("key1") == "value1"
+
+        value, ttl = l1.get_with_ttl("key1")
+        assert value == "value1"
+        assert ttl <= 5
+
+    def test_l2_promotion_uses_pttl_from_redis(self):
+        """Test that GET and PTTL share one pipeline for promotion"""
+        l1 = MemoryCache(max_size=10)
+        l2 = RedisCache(key_prefix="test:")
+        l2.enabled = True
+        l2.fallback_mode = False
+        l2.client = MagicMock()
+        pipe = l2.client.pipeline.return_value
+        pipe.execute.return_value = [b'"value1"', 4500]
+        cache = MultiTierCache(memory_cache=l1, redis_cache=l2)
+
+        assert cache.get("key1") == "value1"
+        pipe.execute.assert_called_once()
+        assert l1.get_with_ttl("key1")[1] <= 4
+
+    def test_remember_miss_skips_l2(self):
+        """Test that a remembered miss returns None without an L2 lookup"""
+        l1 = MemoryCache(max_size=10)
+        l2 = RedisCache(redis_url="redis://nonexistent:9999")
+        cache = MultiTierCache(memory_cache=l1, redis_cache=l2)
+        cache.remember_miss("tx:missing")
+
+        with patch.object(l2, "get_with_ttl") as l2_get, patch.object(
+            l2, "mget_with_ttl", return_value={}
+        ) as l2_mget:
+            assert cache.get("tx:missing") is None
+            assert cache.mget(["tx:missing", "tx:other"]) == {}
+
+        l2_get.assert_not_called()
+        l2_mget.assert_called_once_with(["tx:other"])
+        assert cache.stats["misses"] == 3
+
+        # A real value replaces the marker
+        cache.set("tx:missing", "found")
+        assert cache.get("tx:missing") == "found"
+
+    def test_remembered_miss_is_distinguishable(self):
+        """Test that get() reports remembered misses with the caller's marker"""
+        cache = MultiTierCache(memory_cache=MemoryCache(max_size=10))
+        marker = object()
+        cache.remember_miss("block:99999")
+
+        assert cache.get("block:99999", absent=marker) is marker
+        assert cache.get("block:1", absent=marker) is None
+
+    def test_mget_batches_l2_misses(self):
+        """Test that mget serves L1 hits and promotes L2 hits"""
+        l1 = MemoryCache(max_size=10)
+        l2 = RedisCache(redis_url="redis://nonexistent:9999")
+        cache = MultiTierCache(memory_cache=l1, redis_cache=l2)
+
+        l1.set("key1", "value1")
+        l2.mset({"key2": "value2"})
+
+        result = cache.mget(["key1", "key2", "key3"])
+
+        assert result == {"key1": "value1", "key2": "value2"}
+        assert cache.stats == {"l1_hits": 1, "l2_hits": 1, "misses": 1}
+        assert l1.get("key2") == "value2"
+
     def test_delete_both_tiers(self):
         """Test that delete removes from both tiers"""
         cache = MultiTierCache()
@@ -307,6 +702,31 @@ class TestMultiTierCache:
         assert stats["hit_rate"] > 0
 
 
+class TestCountMinSketch:
+    """Test CountMinSketch frequency estimates"""
+
+    def test_estimate_counts_additions(self):
+        """Test that estimates track additions and never undercount"""
+        sketch = CountMinSketch(width=64, depth=4)
+        for _ in range(5):
+            sketch.add("hot")
+        sketch.add("cold")
+
+        assert sketch.estimate("hot") >= 5
+        assert sketch.estimate("cold") >= 1
+        assert sketch.estimate("hot") > sketch.estimate("cold")
+
+    def test_aging_halves_counts(self):
+        """Test that counters are halved after sample_size additions"""
+        sketch = CountMinSketch(width=64, depth=4, sample_size=8)
+        for _ in range(7):
+            sketch.add("hot")
+        assert sketch.estimate("hot") == 7
+
+        sketch.add("hot")
+        assert sketch.estimate("hot") == 4
+
+
 class TestCacheKey:
     """Tests for cache key generation"""
 
@@ -381,8 +801,8 @@ class TestCachedDecorator:
 
         my_function(5)
         # Check that cache key includes prefix
-        stats = my_function._cache.get_stats()
-        assert len(stats["keys"]) == 1
+        keys = my_function._cache.list_keys()
+        assert len(keys) == 1
 
     def test_method_caching(self):
         """Test caching of class methods"""
@@ -411,6 +831,172 @@ class TestCachedDecorator:
         assert result2 == 10
         assert obj.call_count == 1
 
+    def test_object_first_argument_is_part_of_key(self):
+        """Test that a plain object argument is not mistaken for self"""
+
+        class Account:
+            def __init__(self, address):
+                self.address = address
+
+            def __repr__(self):
+                return f"Account({self.address!r})"
+
+        @cached(ttl=60)
+        def balance(account, denom):
+            return f"{account.address}:{denom}"
+
+        balance._cache = MemoryCache()
+
+        assert balance(Account("aura1a"), "uaura") == "aura1a:uaura"
+        assert balance(Account("aura1b"), "uaura") == "aura1b:uaura"
+
+    def test_specialized_key_for_simple_signatures(self):
+        """Test that fixed-arity scalar functions get a direct, unhashed key"""
+
+        @cached(ttl=60, key_prefix="block")
+        def get_block(height: int, network: str):
+            return {"height": height, "network": network}
+
+        get_block._cache = MemoryCache()
+        get_block(100, "main")
+        get_block(100, "main")
+
+        assert get_block._cache.list_keys() == ["block:get_block:100:'main'"]
+
+    def test_specialized_key_avoids_separator_collisions(self):
+        """Test that string arguments containing ':' keep distinct keys"""
+        call_count = {"count": 0}
+
+        @cached(ttl=60)
+        def lookup(a: str, b: str):
+            call_count["count"] += 1
+            return f"{a}|{b}"
+
+        lookup._cache = MemoryCache()
+
+        assert lookup("x:y", "z") == "x:y|z"
+        assert lookup("x", "y:z") == "x|y:z"
+        assert call_count["count"] == 2
+
+    def test_generic_key_for_complex_signatures(self):
+        """Test that unannotated or keyword calls use the hashed key"""
+
+        @cached(ttl=60, key_prefix="test")
+        def search(query, limit: int = 10):
+            return [query] * limit
+
+        search._cache = MemoryCache()
+        search("abc", limit=2)
+
+        [key] = search._cache.list_keys()
+        assert key == f"test:search:{cache_key('abc', limit=2)}"
+
+    def test_concurrent_misses_are_coalesced(self):
+        """Test that concurrent misses on one key run the function once"""
+        call_count = {"count": 0}
+        started = threading.Event()
+        release = threading.Event()
+
+        @cached(ttl=60)
+        def slow_function(x):
+            call_count["count"] += 1
+            started.set()
+            release.wait(timeout=5)
+            return x * 2
+
+        slow_function._cache = MemoryCache()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(slow_function(21)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(timeout=5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [42] * 5
+        assert call_count["count"] == 1
+
+    def test_coalesced_errors_propagate(self):
+        """Test that waiters see the leader's exception"""
+        flight = SingleFlight()
+
+        def failing():
+            raise ValueError("node unavailable")
+
+        with pytest.raises(ValueError):
+            flight.do("key", failing)
+
+        # A failed flight must not be left registered
+        assert flight.do("key", lambda: "ok") == "ok"
+
+    def test_async_flight_survives_cancelled_leader(self):
+        """Test that cancelling the first caller does not fail the waiters"""
+        flight = AsyncSingleFlight()
+        call_count = {"count": 0}
+
+        async def fetch():
+            call_count["count"] += 1
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def run():
+            leader = asyncio.ensure_future(flight.do("key", fetch))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flight.do("key", fetch))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            result = await waiter
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return result
+
+        assert asyncio.run(run()) == 42
+        assert call_count["count"] == 1
+
+    def test_async_flight_errors_propagate(self):
+        """Test that async waiters see the error and the key is released"""
+        flight = AsyncSingleFlight()
+
+        async def failing():
+            raise ValueError("node unavailable")
+
+        async def ok():
+            return "ok"
+
+        async def run():
+            with pytest.raises(ValueError):
+                await flight.do("key", failing)
+            return await flight.do("key", ok)
+
+        assert asyncio.run(run()) == "ok"
+
+    def test_async_caching(self):
+        """Test that coroutine functions are cached and coalesced"""
+        call_count = {"count": 0}
+
+        @cached(ttl=60)
+        async def fetch(x):
+            call_count["count"] += 1
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        fetch._cache = MemoryCache()
+
+        async def run():
+            return await asyncio.gather(*(fetch(5) for _ in range(5)))
+
+        assert asyncio.run(run()) == [10] * 5
+        assert call_count["count"] == 1
+        assert asyncio.run(fetch(5)) == 10
+        assert call_count["count"] == 1
+
 
 class TestCacheWarmer:
     """Tests for cache warming"""
@@ -0,0 +1,696 @@
+"""
+AURA Block Explorer - Cosmos SDK Client Tests
+Tests for response decoding and query helpers in CosmosSDKClient
+"""
+
+import asyncio
+import base64
+import dataclasses
+import gzip
+import io
+import json
+import logging
+import threading
+import time
+from decimal import Decimal
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import requests
+import urllib3
+from urllib3.util.request import ACCEPT_ENCODING
+
+from cosmos_sdk_client import (
+    AsyncCosmosSDKClient,
+    BondStatus,
+    Coin,
+    CosmosSDKClient,
+    NetworkOverview,
+    ProposalStatus,
+    Validator,
+    _dumps,
+    _grpc_dec,
+    _parse_validator,
+)
+
+try:
+    import aiohttp
+    from aiohttp import web
+except ImportError:
+    aiohttp = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class _MockResponse:
+    """Simple mock for HTTP responses"""
+
+    def __init__(self, payload: Any, status_code: int = 200):
+        self.content = (
+            payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        )
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+@pytest.fixture
+def client():
+    """Create a client pointed at unreachable local endpoints"""
+    return CosmosSDKClient("http://localhost:26657", "http://localhost:1317")
+
+
+class TestModels:
+    """Test data model behaviour"""
+
+    def test_models_are_slotted_and_frozen(self):
+        coin = Coin(denom="uaura", amount="1")
+
+        assert not hasattr(coin, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            coin.amount = "2"
+        assert {coin, Coin(denom="uaura", amount="1")} == {coin}
+
+    def test_coin_amounts_parsed_once(self):
+        coin = Coin(denom="uaura", amount="1500")
+
+        assert coin.amount_int == 1500
+        assert coin.amount_decimal == Decimal("1500")
+        assert coin.amount_decimal is coin.amount_decimal
+        # Cached parses are not part of the model's value
+        assert coin == Coin(denom="uaura", amount="1500")
+        assert dataclasses.asdict(coin) == {"denom": "uaura", "amount": "1500"}
+
+    def test_dec_coin_amount(self):
+        coin = Coin(denom="uaura", amount="12.500000000000000000")
+
+        assert coin.amount_decimal == Decimal("12.5")
+        with pytest.raises(ValueError):
+            coin.amount_int
+
+    def test_validator_fields_map_by_name(self):
+        raw = {
+            "operator_address": "auravaloper1abc",
+            "consensus_pubkey": {"key": "pubkey"},
+            "jailed": True,
+            "status": "BOND_STATUS_UNBONDING",
+            "tokens": "1000",
+            "delegator_shares": "1000.0",
+            "description": {"moniker": "val"},
+            "unbonding_height": "42",
+            "unbonding_time": "2024-01-01T00:00:00Z",
+            "commission": {"commission_rates": {"rate": "0.05"}},
+            "min_self_delegation": "1",
+        }
+
+        assert _parse_validator(raw) == Validator(
+            operator_address="auravaloper1abc",
+            consensus_address="pubkey",
+            jailed=True,
+            status="BOND_STATUS_UNBONDING",
+            tokens="1000",
+            delegator_shares="1000.0",
+            description={"moniker": "val"},
+            unbonding_height=42,
+            unbonding_time="2024-01-01T00:00:00Z",
+            commission={"commission_rates": {"rate": "0.05"}},
+            min_self_delegation="1",
+        )
+
+
+class TestSessionConfig:
+    """Test connection pool and default header setup"""
+
+    def test_pool_sized_for_bursts(self, client):
+        for prefix in ("http://", "https://"):
+            adapter = client.session.get_adapter(prefix + "localhost")
+            assert adapter._pool_maxsize == CosmosSDKClient.POOL_SIZE
+            assert adapter._pool_connections == CosmosSDKClient.POOL_SIZE
+
+    def test_default_headers(self, client):
+        assert client.session.headers["Accept"] == "application/json"
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+        assert client.session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+        assert client.session.headers["Connection"] == "keep-alive"
+
+    def test_retry_policy_is_shared(self, client):
+        retry = client.session.get_adapter("http://localhost").max_retries
+        assert retry is CosmosSDKClient.RETRY
+        assert retry.backoff_jitter > 0
+        assert retry.allowed_methods == frozenset(["GET", "HEAD"])
+        assert retry.respect_retry_after_header
+        assert not retry.raise_on_status
+
+    def test_custom_retry_count(self):
+        client = CosmosSDKClient(
+            "http://localhost:26657", "http://localhost:1317", retry_count=5
+        )
+        retry = client.session.get_adapter("http://localhost").max_retries
+        assert retry.total == 5
+        assert retry.backoff_jitter == CosmosSDKClient.RETRY.backoff_jitter
+
+    def test_retries_are_logged(self, caplog):
+        with caplog.at_level(logging.DEBUG, logger="cosmos_sdk_client"):
+            CosmosSDKClient.RETRY.increment("GET", "/status", error=ConnectionError())
+
+        assert "retry n=1 url=/status" in caplog.text
+
+    def test_prewarm_failure_is_not_fatal(self):
+        with patch(
+            "requests.Session.head", side_effect=requests.ConnectionError("refused")
+        ) as mock_head:
+            CosmosSDKClient(
+                "http://localhost:26657", "http://localhost:1317", prewarm=True
+            )
+
+        mock_head.assert_called_once_with("http://localhost:1317", timeout=10)
+
+
+class TestCompression:
+    """Test transparent decoding of compressed responses"""
+
+    def test_gzip_response_is_decoded(self, client, caplog):
+        body = gzip.compress(json.dumps({"result": {"ok": True}}).encode())
+        response = requests.Response()
+        response.status_code = 200
+        response.headers.update(
+            {"Content-Encoding": "gzip", "Content-Length": str(len(body))}
+        )
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            headers=response.headers,
+            preload_content=False,
+            decode_content=True,
+        )
+
+        with caplog.at_level(logging.DEBUG, logger="cosmos_sdk_client"):
+            with patch.object(client.session, "get", return_value=response):
+                assert client.get_status() == {"result": {"ok": True}}
+
+        assert f"gzip {len(body)} bytes on the wire" in caplog.text
+
+
+class TestResponseDecoding:
+    """Test that responses are parsed from raw bytes"""
+
+    def test_get_balances_parses_content(self, client):
+        payload = {"balances": [{"denom": "uaura", "amount": "1500"}]}
+        with patch.object(client.session, "get", return_value=_MockResponse(payload)):
+            balances = client.get_balances("aura1abc")
+
+        assert balances == [Coin(denom="uaura", amount="1500")]
+
+    @pytest.mark.parametrize("typed", [True, False])
+    @pytest.mark.parametrize("balances", [[], None])
+    def test_empty_balances_return_empty_list(self, client, balances, typed):
+        payload = {"balances": balances}
+        with (
+            patch("cosmos_sdk_client.msgspec", msgspec if typed else None),
+            patch.object(client.session, "get", return_value=_MockResponse(payload)),
+        ):
+            assert client.get_balances("aura1new") == []
+
+    @pytest.mark.skipif(msgspec is None, reason="msgspec not installed")
+    def test_coin_lists_decode_straight_to_models(self, client):
+        payload = {
+            "supply": [{"denom": "uaura", "amount": "1000"}],
+            "pagination": {"total": "1"},
+        }
+        with (
+            patch("cosmos_sdk_client._parse_coins") as parse_coins,
+            patch.object(client.session, "get", return_value=_MockResponse(payload)),
+        ):
+            supply = client.get_total_supply()
+
+        assert supply == [Coin("uaura", "1000")]
+        assert supply[0].amount_int == 1000
+        parse_coins.assert_not_called()
+
+    def test_invalid_json_raises_value_error(self, client):
+        with patch.object(
+            client.session,
+            "get",
+            return_value=_MockResponse(b"<html>bad gateway</html>"),
+        ):
+            with pytest.raises(ValueError):
+                client.get_status()
+
+    def test_http_error_propagates(self, client):
+        with patch.object(
+            client.session, "get", return_value=_MockResponse({}, status_code=500)
+        ):
+            with pytest.raises(requests.HTTPError):
+                client.get_status()
+
+
+class TestStatusFilters:
+    """Test enum validation of status filters"""
+
+    def test_enum_and_string_statuses_are_equivalent(self, client):
+        response = _MockResponse({"validators": [], "proposals": []})
+        with patch.object(client.session, "get", return_value=response) as mock_get:
+            client.get_staking_validators(status=BondStatus.BONDED)
+            client.get_staking_validators(status="BOND_STATUS_BONDED")
+            client.get_proposals(status=ProposalStatus.PASSED)
+
+        sent = [c.kwargs["params"] for c in mock_get.call_args_list]
+        assert sent[0]["status"] == sent[1]["status"] == "BOND_STATUS_BONDED"
+        assert sent[2]["proposal_status"] == "PROPOSAL_STATUS_PASSED"
+
+    def test_unknown_status_is_rejected(self, client):
+        with patch.object(client.session, "get") as mock_get:
+            with pytest.raises(ValueError):
+                client.get_staking_validators(status="BONDED")
+
+        mock_get.assert_not_called()
+
+
+class TestParallelFanOut:
+    """Test concurrent fan-out over the pooled session"""
+
+    @staticmethod
+    def _delegations_response(url, params=None, **kwargs):
+        validator = url.split("/validators/")[1].split("/")[0]
+        return _MockResponse(
+            {
+                "delegation_responses": [
+                    {
+                        "delegation": {
+                            "delegator_address": f"aura1del{validator}",
+                            "validator_address": validator,
+                            "shares": "10",
+                        },
+                        "balance": {"denom": "uaura", "amount": "10"},
+                    }
+                ]
+            }
+        )
+
+    def test_concurrent_identical_requests_are_coalesced(self, client):
+        release = threading.Event()
+        calls = {"count": 0}
+
+        def respond(url, params=None, **kwargs):
+            calls["count"] += 1
+            release.wait(timeout=5)
+            return _MockResponse({"pool": {"bonded_tokens": "100"}})
+
+        results = []
+        with patch.object(client.session, "get", side_effect=respond):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(client.get_staking_pool())
+                )
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        assert calls["count"] == 1
+        assert results == [{"bonded_tokens": "100"}] * 5
+
+    def test_parallel_get_preserves_order(self, client):
+        def respond(url, params=None, **kwargs):
+            return _MockResponse({"url": url})
+
+        urls = [f"http://localhost:1317/item/{i}" for i in range(10)]
+        with patch.object(client.session, "get", side_effect=respond):
+            results = client._parallel_get([(url, None) for url in urls])
+
+        assert [r["url"] for r in results] == urls
+
+    def test_validator_delegations_bulk(self, client):
+        with patch.object(
+            client.session, "get", side_effect=self._delegations_response
+        ) as mock_get:
+            result = client.get_validator_delegations_bulk(["valA", "valB"])
+
+        assert mock_get.call_count == 2
+        assert result["valA"][0].delegator_address == "aura1delvalA"
+        assert result["valB"][0].validator_address == "valB"
+
+    def test_staking_validators_with_delegations(self, client):
+        validator = {
+            "operator_address": "valA",
+            "jailed": False,
+            "status": "BOND_STATUS_BONDED",
+            "tokens": "100",
+            "delegator_shares": "100",
+            "description": {"moniker": "A"},
+            "commission": {},
+            "min_self_delegation": "1",
+        }
+
+        def respond(url, params=None, **kwargs):
+            if url.endswith("/delegations"):
+                return self._delegations_response(url)
+            return _MockResponse({"validators": [validator]})
+
+        with patch.object(client.session, "get", side_effect=respond):
+            plain = client.get_staking_validators()
+            [loaded] = client.get_staking_validators(fetch_delegations=True)
+
+        assert plain[0].delegations is None
+        assert loaded.delegations[0].delegator_address == "aura1delvalA"
+
+
+class TestNetworkOverview:
+    """Test the combined home page query"""
+
+    def test_overview_queries_run_concurrently(self, client):
+        payloads = {
+            "/pool": {"pool": {"bonded_tokens": "100"}},
+            "/supply": {"supply": [{"denom": "uaura", "amount": "1000"}]},
+            "/params": {"params": {"bond_denom": "uaura"}},
+        }
+        barrier = threading.Barrier(3, timeout=5)
+
+        def respond(url, params=None, **kwargs):
+            # Deadlocks (and times out) unless all three are in flight at once
+            barrier.wait()
+            suffix = "/" + url.rsplit("/", 1)[1]
+            return _MockResponse(payloads[suffix])
+
+        with patch.object(client.session, "get", side_effect=respond):
+            overview = client.get_network_overview()
+
+        assert overview == NetworkOverview(
+            pool={"bonded_tokens": "100"},
+            total_supply=[Coin("uaura", "1000")],
+            staking_params={"bond_denom": "uaura"},
+        )
+
+
+class TestStreaming:
+    """Test incremental parsing of large list responses"""
+
+    @staticmethod
+    def _raw_response(payload):
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(json.dumps(payload).encode())
+        return response
+
+    def _check_votes(self, client):
+        votes = [{"voter": f"aura1v{i}", "option": "VOTE_OPTION_YES"} for i in range(3)]
+        response = self._raw_response({"votes": votes, "pagination": {}})
+        with patch.object(client.session, "get", return_value=response) as mock_get:
+            assert list(client.iter_proposal_votes(7)) == votes
+
+        assert mock_get.call_args.kwargs["stream"] is True
+
+    def test_iter_proposal_votes(self, client):
+        self._check_votes(client)
+
+    def test_iter_proposal_votes_without_ijson(self, client):
+        with patch("cosmos_sdk_client.ijson", None):
+            self._check_votes(client)
+
+    def test_iter_transactions_pages_until_short_page(self, client):
+        pages = [
+            {"result": {"txs": [{"hash": "A"}, {"hash": "B"}]}},
+            {"result": {"txs": [{"hash": "C"}]}},
+        ]
+        with patch.object(
+            client.session,
+            "get",
+            side_effect=[self._raw_response(page) for page in pages],
+        ) as mock_get:
+            txs = list(client.iter_transactions("tx.height>1", per_page=2))
+
+        assert [tx["hash"] for tx in txs] == ["A", "B", "C"]
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"]["page"] == "2"
+
+    def _check_exact_multiple(self, client):
+        pages = [
+            {"result": {"txs": [{"hash": "A"}, {"hash": "B"}], "total_count": "4"}},
+            {"result": {"txs": [{"hash": "C"}, {"hash": "D"}], "total_count": "4"}},
+        ]
+        with patch.object(
+            client.session,
+            "get",
+            side_effect=[self._raw_response(page) for page in pages],
+        ) as mock_get:
+            txs = list(client.iter_transactions("tx.height>1", per_page=2))
+
+        # A third, out-of-range page would raise from the exhausted side_effect
+        assert [tx["hash"] for tx in txs] == ["A", "B", "C", "D"]
+        assert mock_get.call_count == 2
+
+    def test_iter_transactions_stops_at_total_count(self, client):
+        self._check_exact_multiple(client)
+
+    def test_iter_transactions_stops_at_total_count_without_ijson(self, client):
+        with patch("cosmos_sdk_client.ijson", None):
+            self._check_exact_multiple(client)
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation of repeated reads"""
+
+    def test_not_modified_reuses_cached_body(self, client):
+        first = _MockResponse({"result": {"block": {"height": "5"}}})
+        first.headers["ETag"] = '"abc"'
+        not_modified = _MockResponse(b"", status_code=304)
+
+        with patch.object(
+            client.session, "get", side_effect=[first, not_modified]
+        ) as mock_get:
+            assert client.get_status() == {"result": {"block": {"height": "5"}}}
+            assert client.get_status() == {"result": {"block": {"height": "5"}}}
+
+        assert mock_get.call_args_list[0].kwargs["headers"] is None
+        assert mock_get.call_args_list[1].kwargs["headers"] == {
+            "If-None-Match": '"abc"'
+        }
+
+    def test_changed_body_replaces_etag(self, client):
+        first = _MockResponse({"n": 1})
+        first.headers["ETag"] = '"v1"'
+        second = _MockResponse({"n": 2})
+        second.headers["ETag"] = '"v2"'
+        third = _MockResponse(b"", status_code=304)
+
+        with patch.object(client.session, "get", side_effect=[first, second, third]):
+            assert client.get_status() == {"n": 1}
+            assert client.get_status() == {"n": 2}
+            assert client.get_status() == {"n": 2}
+
+    def test_etag_cache_is_bounded(self, client):
+        client.ETAG_CACHE_SIZE = 2
+
+        def respond(url, params=None, **kwargs):
+            response = _MockResponse({"url": url})
+            response.headers["ETag"] = url
+            return response
+
+        with patch.object(client.session, "get", side_effect=respond):
+            for height in range(1, 4):
+                client.get_block_results(height)
+
+        assert len(client._etag_cache) == 2
+
+
+class TestQueryCache:
+    """Test TTL caching of idempotent queries"""
+
+    @staticmethod
+    def _proposal_response(status):
+        return _MockResponse(
+            {
+                "proposal": {
+                    "proposal_id": "7",
+                    "status": status,
+                    "submit_time": "2024-01-01T00:00:00Z",
+                    "deposit_end_time": "2024-01-03T00:00:00Z",
+                }
+            }
+        )
+
+    def test_params_fetched_once(self, client):
+        response = _MockResponse({"params": {"bond_denom": "uaura"}})
+        with patch.object(client.session, "get", return_value=response) as mock_get:
+            assert client.get_staking_params() == {"bond_denom": "uaura"}
+            assert client.get_staking_params() == {"bond_denom": "uaura"}
+
+        assert mock_get.call_count == 1
+
+    def test_latest_block_is_not_cached(self, client):
+        response = _MockResponse({"result": {"block": {}}})
+        with patch.object(client.session, "get", return_value=response) as mock_get:
+            client.get_block()
+            client.get_block()
+            client.get_block(100)
+            client.get_block(100)
+
+        assert mock_get.call_count == 3
+
+    def test_only_final_proposals_are_cached(self, client):
+        with patch.object(
+            client.session,
+            "get",
+            return_value=self._proposal_response("PROPOSAL_STATUS_VOTING_PERIOD"),
+        ) as mock_get:
+            client.get_proposal(7)
+            client.get_proposal(7)
+        assert mock_get.call_count == 2
+
+        with patch.object(
+            client.session,
+            "get",
+            return_value=self._proposal_response("PROPOSAL_STATUS_PASSED"),
+        ) as mock_get:
+            client.get_proposal(7)
+            assert client.get_proposal(7).status == "PROPOSAL_STATUS_PASSED"
+        assert mock_get.call_count == 1
+
+    def test_failed_queries_are_not_cached(self, client):
+        with patch.object(
+            client.session, "get", side_effect=requests.ConnectionError("down")
+        ):
+            assert client.get_contract_info("aura1contract") is None
+
+        response = _MockResponse({"contract_info": {"label": "dex"}})
+        with patch.object(client.session, "get", return_value=response):
+            assert client.get_contract_info("aura1contract") == {"label": "dex"}
+
+    def test_invalidate(self, client):
+        response = _MockResponse({"params": {"bond_denom": "uaura"}})
+        with patch.object(client.session, "get", return_value=response) as mock_get:
+            client.get_staking_params()
+            client.invalidate()
+            client.get_staking_params()
+
+        assert mock_get.call_count == 2
+
+
+class TestGrpcStaking:
+    """Test the optional gRPC path for staking queries"""
+
+    def test_grpc_dec_matches_rest_format(self):
+        assert _grpc_dec("1000000000000000000") == "1.000000000000000000"
+        assert _grpc_dec("50000000000000000") == "0.050000000000000000"
+        assert _grpc_dec("-2500000000000000000") == "-2.500000000000000000"
+
+    def test_falls_back_to_rest_without_stubs(self):
+        client = CosmosSDKClient(
+            rpc_url="http://localhost:26657",
+            api_url="http://localhost:1317",
+            grpc_url="localhost:9090",
+        )
+        response = _MockResponse({"delegation_responses": []})
+        with (
+            patch("cosmos_sdk_client.grpc", None),
+            patch.object(client.session, "get", return_value=response) as mock_get,
+        ):
+            assert client.get_delegations("aura1abc") == []
+
+        assert mock_get.call_args[0][0].endswith("/delegations/aura1abc")
+
+
+class TestContractQueries:
+    """Test smart contract query encoding"""
+
+    def test_query_contract_encodes_message(self, client):
+        query_msg = {"balance": {"address": "aura1abc"}}
+        response = _MockResponse({"data": {"balance": "42"}})
+        with patch.object(client.session, "get", return_value=response) as mock_get:
+            assert client.query_contract("aura1contract", query_msg) == {
+                "balance": "42"
+            }
+
+        url = mock_get.call_args[0][0]
+        encoded = url.rsplit("/", 1)[1]
+        assert json.loads(base64.urlsafe_b64decode(encoded)) == query_msg
+
+    def test_query_contract_payload_is_path_safe(self, client):
+        # Standard base64 of this message contains "/" and "+"
+        query_msg = {"query": ">>>???~~~"}
+        standard = base64.b64encode(_dumps(query_msg)).decode()
+        assert "/" in standard and "+" in standard
+
+        response = _MockResponse({"data": {}})
+        with patch.object(client.session, "get", return_value=response) as mock_get:
+            client.query_contract("aura1contract", query_msg)
+
+        url = mock_get.call_args[0][0]
+        prefix = "http://localhost:1317/cosmwasm/wasm/v1/contract/aura1contract/smart/"
+        assert url.startswith(prefix)
+        encoded = url[len(prefix) :]
+        assert "/" not in encoded and "+" not in encoded
+        assert json.loads(base64.urlsafe_b64decode(encoded)) == query_msg
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp not installed")
+class TestAsyncClient:
+    """Test the aiohttp-based client against a local test server"""
+
+    @staticmethod
+    async def _serve(routes):
+        app = web.Application()
+        app.add_routes(routes)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return runner, f"http://127.0.0.1:{port}"
+
+    def test_concurrent_queries_share_session(self):
+        async def pool(request):
+            return web.json_response({"pool": {"bonded_tokens": "100"}})
+
+        async def supply(request):
+            return web.json_response({"supply": [{"denom": "uaura", "amount": "5"}]})
+
+        async def run():
+            runner, url = await self._serve(
+                [
+                    web.get("/cosmos/staking/v1beta1/pool", pool),
+                    web.get("/cosmos/bank/v1beta1/supply", supply),
+                ]
+            )
+            try:
+                async with AsyncCosmosSDKClient(url, url) as client:
+                    return await asyncio.gather(
+                        client.get_staking_pool(), client.get_total_supply()
+                    )
+            finally:
+                await runner.cleanup()
+
+        staking_pool, total_supply = asyncio.run(run())
+        assert staking_pool == {"bonded_tokens": "100"}
+        assert total_supply == [Coin(denom="uaura", amount="5")]
+
+    def test_retries_server_errors(self):
+        calls = {"count": 0}
+
+        async def status(request):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                return web.Response(status=503)
+            return web.json_response({"result": {"sync_info": {}}})
+
+        async def run():
+            runner, url = await self._serve([web.get("/status", status)])
+            try:
+                async with AsyncCosmosSDKClient(url, url) as client:
+                    client.BACKOFF_FACTOR = 0
+                    return await client.get_status()
+            finally:
+                await runner.cleanup()
+
+        assert asyncio.run(run()) == {"result": {"sync_info": {}}}
+        assert calls["count"] == 2
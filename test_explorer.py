@@ -3,7 +3,11 @@ AURA Block Explorer Integration Tests
 Comprehensive test suite for verifying explorer functionality
 """
 
+import io
 import json
+import sqlite3
+import threading
+import time
 from typing import Any, Dict
 
 import pytest
@@ -13,13 +17,18 @@ from explorer_backend import (
     ExplorerDatabase,
     AnalyticsEngine,
     SearchEngine,
+    RichListManager,
     ExportManager,
     SearchType,
     AddressLabel,
     app,
     db,
+    _cache_ttl,
 )
 
+# bech32 encoding of bytes 0..19 under the "aura" prefix
+VALID_ADDRESS = "aura1qqqsyqcyq5rqwzqfpg9scrgwpugpzysncqxcnq"
+
 
 class _MockResponse:
     """Simple mock for HTTP responses"""
@@ -27,6 +36,14 @@ class _MockResponse:
     def __init__(self, payload: Dict[str, Any], status_code: int = 200):
         self._payload = payload
         self.status_code = status_code
+        self.content = json.dumps(payload).encode()
+        self.raw = io.BytesIO(self.content)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
 
     def json(self):
         return self._payload
@@ -36,12 +53,19 @@ class _MockResponse:
             raise requests.HTTPError(f"HTTP {self.status_code}")
 
 
+# Tests that patch requests.get still see calls made on the pooled session
+pytestmark = pytest.mark.usefixtures("route_session_through_requests_get")
+
+
 @pytest.fixture(autouse=True)
 def clear_explorer_cache():
     """Ensure cache table is cleared between tests for deterministic behavior"""
+    db.flush()
     cursor = db.conn.cursor()
     cursor.execute("DELETE FROM explorer_cache")
+    cursor.execute("DELETE FROM explorer_stale_cache")
     db.conn.commit()
+    db._mem_cache.clear()
 
 
 class TestConfiguration:
@@ -85,6 +109,21 @@ class TestExplorerDatabase:
         assert "analytics" in tables
         assert "explorer_cache" in tables
 
+    def test_metric_range_uses_composite_index(self, db):
+        """get_metrics is served by the (metric_type, timestamp) index"""
+        plan = db.conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT timestamp, value, data FROM analytics
+            WHERE metric_type = ? AND timestamp > ?
+            ORDER BY timestamp ASC
+        """,
+            ("test_metric", 0),
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "idx_metric_type_ts" in detail
+        assert "TEMP B-TREE" not in detail
+
     def test_add_search(self, db):
         """Test recording search queries"""
         db.add_search("aura1test", "address", True, "user123")
@@ -93,6 +132,15 @@ class TestExplorerDatabase:
         assert len(recent) == 1
         assert recent[0]["query"] == "aura1test"
 
+    def test_search_suggestions(self, db):
+        """Suggestions are distinct prefix matches, most recent first"""
+        for query in ["aura1abc", "aura1abd", "AURA1xyz", "12345", "aura1abc"]:
+            db.add_search(query, "address", True)
+
+        assert db.get_search_suggestions("aura1") == ["aura1abc", "aura1abd"]
+        assert db.get_search_suggestions("aura1", limit=1) == ["aura1abc"]
+        assert db.get_search_suggestions("zzz") == []
+
     def test_address_labels(self, db):
         """Test address labeling system"""
         label = AddressLabel(
@@ -109,6 +157,17 @@ class TestExplorerDatabase:
         assert retrieved.label == "Test Wallet"
         assert retrieved.category == "user"
 
+    def test_bulk_address_labels(self, db):
+        """Labels for many addresses come back keyed by address"""
+        db.add_address_label(AddressLabel("aura1a", "Exchange", "exchange"))
+        db.add_address_label(AddressLabel("aura1b", "Team", "team"))
+
+        labels = db.get_address_labels(["aura1a", "aura1b", "aura1none"])
+
+        assert set(labels) == {"aura1a", "aura1b"}
+        assert labels["aura1b"].label == "Team"
+        assert db.get_address_labels([]) == {}
+
     def test_metrics_recording(self, db):
         """Test analytics metrics recording"""
         db.record_metric("test_metric", 100.5, {"extra": "data"})
@@ -129,6 +188,142 @@ class TestExplorerDatabase:
         value = db.get_cache("expired_key")
         assert value is None
 
+    def test_purge_expired_cache(self, db):
+        """Expired cache rows are deleted, live ones kept"""
+        db.set_cache("live_key", "live_value", ttl=300)
+        db.set_cache("expired_key", "expired_value", ttl=-1)
+        db.purge_expired_cache()
+        db.flush()
+
+        keys = [row[0] for row in db.conn.execute("SELECT key FROM explorer_cache")]
+        assert keys == ["live_key"]
+
+    def test_stale_cache_outlives_fresh_entry(self, db):
+        """Only entries stored with a stale_ttl are kept past their TTL"""
+        db.set_cache("kept", "old", ttl=-1, stale_ttl=300)
+        db.set_cache("dropped", "old", ttl=-1)
+        db.purge_expired_cache()
+
+        assert db.get_cache("kept") is None
+        assert db.get_stale_cache("kept") == "old"
+        assert db.get_stale_cache("dropped") is None
+
+    def test_set_cache_overwrites_value(self, db):
+        """Re-setting a key replaces its value"""
+        db.set_cache("test_key", "old", ttl=300)
+        db.flush()
+        db.set_cache("test_key", "new", ttl=300)
+
+        assert db.get_cache("test_key") == "new"
+
+    def test_cache_hit_served_from_memory(self, db):
+        """Warm reads skip SQLite; misses are loaded from it"""
+        db.set_cache("test_key", "test_value", ttl=300)
+        db.flush()
+        db.conn.execute("DELETE FROM explorer_cache")
+        db.conn.commit()
+        assert db.get_cache("test_key") == "test_value"
+
+        db.set_cache("cold_key", "cold_value", ttl=300)
+        db.flush()
+        db._mem_cache.clear()
+        assert db.get_cache("cold_key") == "cold_value"
+        assert db._mem_cache.get("cold_key") == "cold_value"
+
+    def test_writes_are_committed_in_background(self, db):
+        """Queued writes reach the database without an explicit flush"""
+        db.add_search("aura1test", "address", True)
+        db.record_metric("test_metric", 1.0)
+
+        deadline = time.time() + 2
+        while not db._write_queue.empty() and time.time() < deadline:
+            time.sleep(0.01)
+
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM search_history")
+        assert cursor.fetchone()[0] == 1
+        cursor.execute("SELECT COUNT(*) FROM analytics")
+        assert cursor.fetchone()[0] == 1
+
+    def test_bad_row_does_not_drop_batch(self, db):
+        """A failing row is skipped while the rest of its batch commits"""
+        db.record_metric("test_metric", 1.0)
+        db.record_metric("test_metric", None)  # violates NOT NULL
+        db.record_metric("test_metric", 3.0)
+
+        values = [m["value"] for m in db.get_metrics("test_metric", hours=1)]
+        assert values == [1.0, 3.0]
+
+    def test_read_waits_for_batch_being_committed(self, tmp_path):
+        """A read sees writes the writer thread dequeued but hasn't committed"""
+        file_db = ExplorerDatabase(str(tmp_path / "explorer.db"))
+        committing = threading.Event()
+        apply_rows = file_db._apply_rows
+
+        def slow_apply(cursor, sql, rows):
+            committing.set()
+            time.sleep(0.2)
+            apply_rows(cursor, sql, rows)
+
+        file_db._apply_rows = slow_apply
+        file_db.add_search("aura1race", "address", True)
+        assert committing.wait(timeout=5)
+        recent = file_db.get_recent_searches(1)
+        file_db.close()
+
+        assert [r["query"] for r in recent] == ["aura1race"]
+
+    def test_reads_do_not_wait_for_writer_lock(self, db):
+        """Reads use a pooled read connection instead of the shared lock"""
+        db.add_address_label(
+            AddressLabel(address="aura1test", label="Test", category="user")
+        )
+        results = []
+        with db.lock:
+            reader = threading.Thread(
+                target=lambda: results.append(db.get_address_label("aura1test"))
+            )
+            reader.start()
+            reader.join(timeout=2)
+            assert not reader.is_alive()
+
+        assert results[0].label == "Test"
+
+    def test_short_lived_threads_reuse_read_connections(self, tmp_path):
+        """Per-request threads check out pooled connections; close() closes them"""
+        file_db = ExplorerDatabase(str(tmp_path / "explorer.db"))
+        connect = file_db._connect
+        opened = []
+
+        def counting_connect(**kwargs):
+            conn = connect(**kwargs)
+            opened.append(conn)
+            return conn
+
+        file_db._connect = counting_connect
+        for _ in range(5):
+            reader = threading.Thread(target=file_db.get_address_label, args=("x",))
+            reader.start()
+            reader.join(timeout=2)
+        file_db.close()
+
+        assert len(opened) == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """On-disk databases switch to WAL and survive close()"""
+        path = str(tmp_path / "explorer.db")
+        file_db = ExplorerDatabase(path)
+        for i in range(10):
+            file_db.add_search(f"query{i}", "address", False)
+        file_db.close()
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("SELECT COUNT(*) FROM search_history").fetchone()[0] == 10
+        conn.close()
+
 
 class TestSearchEngine:
     """Test search functionality"""
@@ -146,34 +341,57 @@ class TestSearchEngine:
 
     def test_identify_address(self, search_engine):
         """Test AURA address identification"""
-        search_type = search_engine._identify_search_type("aura1abcdefghijk")
+        search_type = search_engine._identify_search_type(VALID_ADDRESS)
         assert search_type == SearchType.ADDRESS
 
+    def test_identify_malformed_address(self, search_engine):
+        """Bad bech32 checksums and characters are not addresses"""
+        corrupted = VALID_ADDRESS[:-1] + "p"
+        assert search_engine._identify_search_type(corrupted) == SearchType.UNKNOWN
+        assert (
+            search_engine._identify_search_type("aura1abcdefghijk")
+            == SearchType.UNKNOWN
+        )
+
+    def test_malformed_address_skips_node(self, search_engine):
+        """Searching a malformed address makes no node request"""
+        with patch("requests.get") as mock_get:
+            result = search_engine.search("aura1abcdefghijk")
+        mock_get.assert_not_called()
+        assert result["type"] == SearchType.UNKNOWN.value
+
     def test_identify_transaction(self, search_engine):
         """Test transaction hash identification"""
         tx_hash = "A" * 64
         search_type = search_engine._identify_search_type(tx_hash)
         assert search_type == SearchType.TRANSACTION_ID
 
+    def test_identify_non_hex_64_chars_as_block_hash(self, search_engine):
+        """64-character non-hex queries fall through to block hash"""
+        assert search_engine._identify_search_type("G" * 64) == SearchType.BLOCK_HASH
+
+    def test_identify_non_ascii_digits_as_unknown(self, search_engine):
+        """Digits int() cannot parse are not treated as heights"""
+        assert search_engine._identify_search_type("\u00b2") == SearchType.UNKNOWN
+
     @patch("requests.get")
     def test_search_block_height(self, mock_get, search_engine):
         """Test block height search with mocked response"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {
-                "block": {
-                    "header": {
-                        "height": "100",
-                        "time": "2024-01-01T00:00:00Z",
-                        "proposer_address": "test_proposer",
-                        "last_block_id": {"hash": "test_hash"},
-                    },
-                    "data": {"txs": []},
+        mock_get.return_value = _MockResponse(
+            {
+                "result": {
+                    "block": {
+                        "header": {
+                            "height": "100",
+                            "time": "2024-01-01T00:00:00Z",
+                            "proposer_address": "test_proposer",
+                            "last_block_id": {"hash": "test_hash"},
+                        },
+                        "data": {"txs": []},
+                    }
                 }
             }
-        }
-        mock_get.return_value = mock_response
+        )
 
         result = search_engine._search_block_height(100)
         assert result is not None
@@ -182,12 +400,9 @@ class TestSearchEngine:
     @patch("requests.get")
     def test_search_address(self, mock_get, search_engine):
         """Test address search with mocked response"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "balances": [{"denom": "uaura", "amount": "1000000"}]
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = _MockResponse(
+            {"balances": [{"denom": "uaura", "amount": "1000000"}]}
+        )
 
         result = search_engine._search_address("aura1test")
         assert result is not None
@@ -204,13 +419,24 @@ class TestAnalyticsEngine:
         db = ExplorerDatabase(":memory:")
         return AnalyticsEngine("http://localhost:26657", db)
 
+    def test_http_session_is_pooled(self, analytics):
+        """Node calls reuse a keep-alive pool with light retries"""
+        adapter = analytics.http.get_adapter("http://localhost:26657")
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 2
+        assert analytics.http.headers["Connection"] == "keep-alive"
+
+        payload = {"result": {"last_height": "7"}}
+        with patch.object(
+            requests.Session, "get", autospec=True, return_value=_MockResponse(payload)
+        ) as session_get:
+            assert analytics._fetch_stats()["total_blocks"] == 7
+        assert session_get.call_args.args[0] is analytics.http
+
     @patch("requests.get")
     def test_fetch_stats(self, mock_get, analytics):
         """Test fetching blockchain stats"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": {"last_height": "1000"}}
-        mock_get.return_value = mock_response
+        mock_get.return_value = _MockResponse({"result": {"last_height": "1000"}})
 
         stats = analytics._fetch_stats()
         assert stats is not None
@@ -219,25 +445,72 @@ class TestAnalyticsEngine:
     @patch("requests.get")
     def test_fetch_blocks(self, mock_get, analytics):
         """Test fetching blocks"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {
-                "block_metas": [
-                    {
-                        "header": {"height": "100", "time": "2024-01-01T00:00:00Z"},
-                        "block_id": {"hash": "test_hash"},
-                        "num_txs": "5",
-                    }
-                ]
+        mock_get.return_value = _MockResponse(
+            {
+                "result": {
+                    "block_metas": [
+                        {
+                            "header": {"height": "100", "time": "2024-01-01T00:00:00Z"},
+                            "block_id": {"hash": "test_hash"},
+                            "num_txs": "5",
+                        }
+                    ]
+                }
             }
-        }
-        mock_get.return_value = mock_response
+        )
 
         blocks = analytics._fetch_blocks(limit=10)
         assert blocks is not None
         assert len(blocks["blocks"]) > 0
 
+    def test_fetch_blocks_parses_nanosecond_times(self, analytics):
+        """CometBFT's nanosecond RFC 3339 times become unix timestamps"""
+        meta = {
+            "header": {"height": "7", "time": "2024-01-01T00:00:00.123456789Z"},
+            "block_id": {"hash": "h"},
+            "num_txs": "0",
+        }
+        payload = {"result": {"block_metas": [meta]}}
+        with patch("requests.get", return_value=_MockResponse(payload)):
+            blocks = analytics._fetch_blocks(limit=1)
+
+        assert blocks["blocks"][0]["timestamp"] == pytest.approx(1704067200.123456)
+
+    def test_average_block_time(self, analytics):
+        """Only positive gaps between sorted blocks are averaged"""
+        blocks = [{"timestamp": t} for t in (130, 100, 106, 106, 118)]
+        with patch.object(analytics, "_fetch_blocks", return_value={"blocks": blocks}):
+            result = analytics.get_average_block_time()
+
+        assert result["average_block_time_seconds"] == 10
+        assert result["blocks_sampled"] == 3
+
+    def test_concurrent_requests_are_coalesced(self, analytics, overlapping_calls):
+        """Callers arriving mid-fetch share the first caller's node query"""
+        calls, results = overlapping_calls(
+            analytics.get_mempool_size,
+            _MockResponse({"count": 3, "transactions": []}),
+        )
+
+        assert len(calls) == 1
+        assert [r["pending_transactions"] for r in results] == [3, 3]
+
+    def test_dashboard_queries_run_concurrently(self, analytics):
+        """All six dashboard metrics have their node query in flight at once"""
+        barrier = threading.Barrier(6, timeout=5)
+        payload = {"result": {"last_height": "1000", "block_metas": []}}
+
+        def fake_get(url, **kwargs):
+            barrier.wait()
+            return _MockResponse(payload)
+
+        with patch("requests.get", side_effect=fake_get):
+            dashboard = analytics.get_dashboard()
+
+        assert not barrier.broken
+        assert dashboard["hashrate"]["block_height"] == 1000
+        assert "timestamp" in dashboard
+
 
 class TestFlaskEndpoints:
     """Test Flask API endpoints"""
@@ -355,6 +628,62 @@ class TestFlaskEndpoints:
             assert "richlist" in data
 
 
+class TestRichListManager:
+    """Test rich list aggregation"""
+
+    @pytest.fixture
+    def rich_list(self):
+        """Create rich list manager for testing"""
+        return RichListManager(
+            "http://localhost:26657",
+            ExplorerDatabase(":memory:"),
+            "http://localhost:1317",
+        )
+
+    def test_holders_are_paged_from_bank_module(self, rich_list):
+        """denom_owners pages are followed and the largest holders ranked"""
+        pages = {
+            None: {
+                "denom_owners": [
+                    {
+                        "address": "aura1a",
+                        "balance": {"denom": "uaura", "amount": "10"},
+                    },
+                    {
+                        "address": "aura1b",
+                        "balance": {"denom": "uaura", "amount": "60"},
+                    },
+                ],
+                "pagination": {"next_key": "bmV4dA=="},
+            },
+            "bmV4dA==": {
+                "denom_owners": [
+                    {"address": "aura1c", "balance": {"denom": "uaura", "amount": "30"}}
+                ],
+                "pagination": {"next_key": None},
+            },
+        }
+        urls = []
+
+        def fake_get(url, params=None, **kwargs):
+            urls.append(url)
+            return _MockResponse(pages[params.get("pagination.key")])
+
+        with patch("requests.get", side_effect=fake_get):
+            result = rich_list._calculate_rich_list(limit=2)
+
+        assert len(urls) == 2
+        assert urls[0].endswith("/cosmos/bank/v1beta1/denom_owners/uaura")
+        assert [r["address"] for r in result] == ["aura1b", "aura1c"]
+        assert result[0]["balance"] == 60
+        assert result[0]["percentage_of_supply"] == 60
+
+    def test_failed_page_aborts_scan(self, rich_list):
+        """A partial holder list is not reported as a rich list"""
+        with patch("requests.get", return_value=_MockResponse({}, status_code=500)):
+            assert rich_list._calculate_rich_list(limit=10) == []
+
+
 class TestExportManager:
     """Test export functionality"""
 
@@ -406,7 +735,7 @@ class TestIntegration:
 
         test_cases = [
             {"query": "12345", "expected_type": "block_height"},
-            {"query": "aura1abcdefghijk", "expected_type": "address"},
+            {"query": VALID_ADDRESS, "expected_type": "address"},
         ]
 
         for case in test_cases:
@@ -537,6 +866,121 @@ class TestExplorerDataEndpoints:
             assert data["transactions"][0]["hash"] == "ABC123"
             assert data["transactions"][0]["status"] == "success"
 
+    def test_transactions_rpc_fallback_fetches_details_concurrently(self, client):
+        """tx_search hits are resolved in parallel and keep their order"""
+        hashes = ["AAA", "BBB", "CCC"]
+        barrier = threading.Barrier(len(hashes), timeout=5)
+
+        def fake_get(url, params=None, timeout=5):
+            if url.endswith("/cosmos/tx/v1beta1/txs"):
+                return _MockResponse({}, status_code=500)
+            if url.endswith("/tx_search"):
+                return _MockResponse(
+                    {
+                        "result": {
+                            "txs": [
+                                {"hash": h, "height": "7", "tx_result": {"code": 0}}
+                                for h in hashes
+                            ],
+                            "total_count": "3",
+                        }
+                    }
+                )
+            tx_hash = url.rsplit("/", 1)[-1]
+            # Each lookup waits for the others, so a serial loop would time out
+            barrier.wait()
+            if tx_hash == "BBB":
+                return _MockResponse({}, status_code=404)
+            return _MockResponse(
+                {"tx_response": {"txhash": tx_hash, "height": "7", "code": 0}}
+            )
+
+        with patch("requests.get", side_effect=fake_get):
+            response = client.get("/api/transactions?limit=3&offset=30")
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert [tx["hash"] for tx in data["transactions"]] == hashes
+            assert data["transactions"][1]["type"] == "Unknown"
+            assert data["total"] == 3
+
+    def test_transactions_rpc_fallback_reads_result_events(self, client):
+        """tx_search hits with readable events need no detail lookups"""
+
+        def event(kind, **attrs):
+            return {
+                "type": kind,
+                "attributes": [{"key": k, "value": v} for k, v in attrs.items()],
+            }
+
+        # Cosmos SDK v0.47 order: the ante handler's fee transfer, fee
+        # payer and signature events precede the message's own events
+        hit = {
+            "hash": "EEE",
+            "height": "9",
+            "tx_result": {
+                "code": 0,
+                "events": [
+                    event("coin_spent", spender="aura1alice", amount="5000uaura"),
+                    event("coin_received", receiver="aura1fee", amount="5000uaura"),
+                    event(
+                        "transfer",
+                        recipient="aura1fee",
+                        sender="aura1alice",
+                        amount="5000uaura",
+                    ),
+                    event("message", sender="aura1alice"),
+                    event("tx", fee="5000uaura", fee_payer="aura1alice"),
+                    event("tx", acc_seq="aura1alice/3"),
+                    event("tx", signature="c2lnbmF0dXJl"),
+                    event(
+                        "message",
+                        action="/cosmos.bank.v1beta1.MsgSend",
+                        sender="aura1alice",
+                        module="bank",
+                    ),
+                    event("coin_spent", spender="aura1alice", amount="1000000000uaura"),
+                    event(
+                        "coin_received", receiver="aura1bob", amount="1000000000uaura"
+                    ),
+                    event(
+                        "transfer",
+                        recipient="aura1bob",
+                        sender="aura1alice",
+                        amount="1000000000uaura",
+                    ),
+                    event("message", sender="aura1alice"),
+                ],
+            },
+        }
+        urls = []
+
+        def fake_get(url, params=None, timeout=5):
+            urls.append(url)
+            if url.endswith("/tx_search"):
+                return _MockResponse({"result": {"txs": [hit], "total_count": "1"}})
+            return _MockResponse({}, status_code=500)
+
+        with patch("requests.get", side_effect=fake_get):
+            response = client.get("/api/transactions?limit=1&offset=40")
+            data = json.loads(response.data)
+
+        assert len(urls) == 2  # REST list, then tx_search
+        tx = data["transactions"][0]
+        assert tx["type_key"] == "msg-send"
+        assert tx["from"] == "aura1alice"
+        assert tx["to"] == "aura1bob"
+        assert tx["amount"] == "1000.000000 AURA"
+        assert tx["fee"] == "0.005000 AURA"
+        assert tx["status"] == "success"
+
+    def test_cache_ttl_tiers(self):
+        """Stable data is cached longer, and slow fetches stretch the TTL"""
+        now = time.monotonic()
+        assert _cache_ttl("gov_params", now) == 3600
+        assert _cache_ttl("blocks", now) == 5
+        assert _cache_ttl("blocks", now - 0.5) == 10
+        assert _cache_ttl("blocks", now - 60) == 15
+
     def test_validators_endpoint_sort(self, client):
         """Validators endpoint sorts by commission"""
         validators_payload = {
@@ -4,6 +4,7 @@ Tests for the new governance and staking features added to meet community expect
 """
 
 import json
+import threading
 from typing import Any, Dict
 from unittest.mock import patch
 
@@ -28,6 +29,10 @@ class _MockResponse:
             raise requests.HTTPError(f"HTTP {self.status_code}")
 
 
+# Tests that patch requests.get still see calls made on the pooled session
+pytestmark = pytest.mark.usefixtures("route_session_through_requests_get")
+
+
 # ==================== GOVERNANCE SERVICE TESTS ====================
 
 
@@ -103,33 +108,34 @@ class TestGovernanceService:
     @patch("requests.get")
     def test_get_single_proposal(self, mock_get, governance):
         """Test fetching single proposal with tally"""
-        # First call returns proposal, second returns tally
-        mock_get.side_effect = [
-            _MockResponse(
-                {
-                    "proposal": {
-                        "proposal_id": "5",
-                        "content": {
-                            "title": "Community Pool Spend",
-                            "description": "Fund development",
-                            "@type": "/cosmos.distribution.v1beta1.CommunityPoolSpendProposal",
-                        },
-                        "status": "PROPOSAL_STATUS_VOTING_PERIOD",
-                        "total_deposit": [{"denom": "uaura", "amount": "10000000"}],
-                    }
+        proposal_response = _MockResponse(
+            {
+                "proposal": {
+                    "proposal_id": "5",
+                    "content": {
+                        "title": "Community Pool Spend",
+                        "description": "Fund development",
+                        "@type": "/cosmos.distribution.v1beta1.CommunityPoolSpendProposal",
+                    },
+                    "status": "PROPOSAL_STATUS_VOTING_PERIOD",
+                    "total_deposit": [{"denom": "uaura", "amount": "10000000"}],
                 }
-            ),
-            _MockResponse(
-                {
-                    "tally": {
-                        "yes": "5000000",
-                        "no": "1000000",
-                        "abstain": "500000",
-                        "no_with_veto": "100000",
-                    }
+            }
+        )
+        tally_response = _MockResponse(
+            {
+                "tally": {
+                    "yes": "5000000",
+                    "no": "1000000",
+                    "abstain": "500000",
+                    "no_with_veto": "100000",
                 }
-            ),
-        ]
+            }
+        )
+        # Proposal and tally are requested concurrently, so route by URL
+        mock_get.side_effect = lambda url, **kwargs: (
+            tally_response if url.endswith("/tally") else proposal_response
+        )
 
         result = governance.get_proposal(5)
 
@@ -163,6 +169,37 @@ class TestGovernanceService:
         assert result["votes"][2]["option"] == "Abstain"
         assert result["proposal_id"] == 5
 
+    def test_vote_pages_sliced_from_one_fetch(self, governance):
+        """Pages inside the fetched window share one upstream call"""
+        governance.LIST_FETCH_LIMIT = 4
+        voters = [f"aura1voter{i}" for i in range(6)]
+        calls = []
+
+        def fake_get(url, params=None, **kwargs):
+            limit = int(params["pagination.limit"])
+            offset = int(params["pagination.offset"])
+            calls.append((limit, offset))
+            return _MockResponse(
+                {
+                    "votes": [
+                        {"voter": voter, "option": "VOTE_OPTION_YES"}
+                        for voter in voters[offset : offset + limit]
+                    ],
+                    "pagination": {"total": str(len(voters))},
+                }
+            )
+
+        with patch("requests.get", side_effect=fake_get):
+            first = governance.get_proposal_votes(5, limit=2, offset=0)
+            second = governance.get_proposal_votes(5, limit=2, offset=2)
+            last = governance.get_proposal_votes(5, limit=2, offset=4)
+
+        assert calls == [(4, 0), (2, 4)]
+        assert [v["voter"] for v in first["votes"]] == voters[0:2]
+        assert [v["voter"] for v in second["votes"]] == voters[2:4]
+        assert [v["voter"] for v in last["votes"]] == voters[4:6]
+        assert second["total"] == 6
+
     @patch("requests.get")
     def test_get_governance_params(self, mock_get, governance):
         """Test fetching governance parameters"""
@@ -199,6 +236,25 @@ class TestGovernanceService:
         assert "voting" in result
         assert "tallying" in result
 
+    def test_governance_params_fetched_concurrently(self, governance):
+        """The three params endpoints are queried at the same time"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_get(url, **kwargs):
+            # A sequential loop would never get three threads to the barrier
+            barrier.wait()
+            param_type = url.rsplit("/", 1)[-1]
+            return _MockResponse({f"{param_type}_params": {"type": param_type}})
+
+        with patch("requests.get", side_effect=fake_get):
+            result = governance.get_governance_params()
+
+        assert result == {
+            "deposit": {"type": "deposit"},
+            "voting": {"type": "voting"},
+            "tallying": {"type": "tallying"},
+        }
+
     @patch("requests.get")
     def test_proposals_fetch_error_handling(self, mock_get, governance):
         """Test error handling in proposals fetch"""
@@ -209,6 +265,57 @@ class TestGovernanceService:
         assert "error" in result
         assert result["proposals"] == []
 
+    def test_stale_proposals_served_when_upstream_fails(self, governance):
+        """An expired response is returned, marked stale, during an outage"""
+        payload = {"proposals": [], "pagination": {"total": "4"}}
+        with patch("requests.get", return_value=_MockResponse(payload)):
+            assert governance.get_proposals()["total"] == 4
+
+        # Expire the fresh entry
+        governance.db.flush()
+        governance.db.conn.execute("DELETE FROM explorer_cache")
+        governance.db.conn.commit()
+        governance.db._mem_cache.clear()
+
+        outage = requests.exceptions.ConnectionError("Connection refused")
+        with patch("requests.get", side_effect=outage):
+            result = governance.get_proposals()
+
+        assert result["total"] == 4
+        assert result["stale"] is True
+        assert "error" not in result
+
+    def test_stale_page_past_listing_served_when_upstream_fails(self, governance):
+        """A page beyond the listing window falls back to its own stale copy"""
+
+        def page(url, params=None, **kwargs):
+            offset = int(params["pagination.offset"])
+            count = min(int(params["pagination.limit"]), 600 - offset)
+            proposals = [{"proposal_id": str(offset + i)} for i in range(count)]
+            return _MockResponse(
+                {"proposals": proposals, "pagination": {"total": "600"}}
+            )
+
+        with patch("requests.Session.get", side_effect=page):
+            assert (
+                len(governance.get_proposals(limit=20, offset=500)["proposals"]) == 20
+            )
+
+        governance.db.flush()
+        governance.db.conn.execute("DELETE FROM explorer_cache")
+        governance.db.conn.commit()
+        governance.db._mem_cache.clear()
+
+        outage = requests.exceptions.ConnectionError("Connection refused")
+        with patch("requests.Session.get", side_effect=outage):
+            result = governance.get_proposals(limit=20, offset=500)
+            missing = governance.get_proposals(limit=20, offset=520)
+
+        assert [p["id"] for p in result["proposals"]][:2] == ["500", "501"]
+        assert result["stale"] is True
+        assert missing["proposals"] == []
+        assert "error" in missing
+
     def test_format_tally_percentages(self, governance):
         """Test tally percentage calculations"""
         tally = {
@@ -249,6 +356,18 @@ class TestStakingService:
         db = ExplorerDatabase(":memory:")
         return StakingService("http://localhost:1317", db)
 
+    def test_concurrent_misses_share_one_fetch(self, staking, overlapping_calls):
+        """Callers arriving mid-fetch wait for the first caller's request"""
+        calls, results = overlapping_calls(
+            staking.get_staking_pool,
+            _MockResponse(
+                {"pool": {"bonded_tokens": "3000000", "not_bonded_tokens": "0"}}
+            ),
+        )
+
+        assert len(calls) == 1
+        assert [r["bonded_tokens"] for r in results] == [3000000, 3000000]
+
     @patch("requests.get")
     def test_get_staking_pool(self, mock_get, staking):
         """Test fetching staking pool info"""
@@ -123,7 +123,7 @@ def check_search_engine():
         # Test search type detection
         tests = [
             ("12345", SearchType.BLOCK_HEIGHT),
-            ("aura1test123", SearchType.ADDRESS),
+            ("aura1qqqsyqcyq5rqwzqfpg9scrgwpugpzysncqxcnq", SearchType.ADDRESS),
             ("A" * 64, SearchType.TRANSACTION_ID),
         ]
 